@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Column Schema Index
+Parses telemetry column names once per column set into turbine, sensor,
+statistic, unit and measurement category.
+
+Column names look like ``WTG01_Ambient WindSpeed Avg. (1)``, optionally with
+a merge suffix (``_x``, ``_y``). The analysis functions look columns up in the
+index instead of substring-scanning every name on every call, so they all
+agree on what counts as, say, a temperature column.
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+# Checked in order; the first rule whose keywords appear in the lowercased
+# name decides the category
+CATEGORY_RULES = [
+    ('timestamp', ('timestamp', 'time')),
+    ('power', ('power',)),
+    ('temperature', ('temp', 'temperature')),
+    ('wind_speed', ('windspeed', 'wind')),
+    ('voltage', ('voltage',)),
+    ('current', ('current',)),
+    ('pressure', ('pressure',)),
+    ('rpm', ('rpm',)),
+    ('angle', ('angle', 'pitch', 'yaw')),
+    ('humidity', ('humidity',)),
+]
+CATEGORIES = [category for category, _ in CATEGORY_RULES] + ['other']
+
+DEFAULT_UNITS = {
+    'power': 'kW',
+    'temperature': '°C',
+    'wind_speed': 'm/s',
+    'voltage': 'V',
+    'current': 'A',
+    'pressure': 'bar',
+    'rpm': 'rpm',
+    'angle': 'deg',
+    'humidity': '%',
+}
+
+TURBINE_PATTERN = re.compile(r'^(WTG\d+)_')
+MERGE_SUFFIX_PATTERN = re.compile(r'_(x|y|\d+)$')
+STATISTICS = {s.lower(): s for s in ('Avg', 'Min', 'Max', 'StdDev', 'Std', 'Sum', 'Count', 'Last')}
+STATISTIC_PATTERN = re.compile(r'\b(' + '|'.join(STATISTICS.values()) + r')\.?(?=\s|$)', re.IGNORECASE)
+UNIT_PATTERN = re.compile(r'\[([^\]]+)\]|\(([^)\d][^)]*)\)')
+CHANNEL_PATTERN = re.compile(r'\s*\(\d+\)')
+
+
+class ColumnInfo(NamedTuple):
+    name: str
+    turbine: Optional[str]
+    sensor: str
+    statistic: Optional[str]
+    unit: Optional[str]
+    category: str
+
+
+def classify(name):
+    """Measurement category of a column name."""
+    lower = name.lower()
+    for category, keywords in CATEGORY_RULES:
+        if any(keyword in lower for keyword in keywords):
+            return category
+    return 'other'
+
+
+def parse_column(name):
+    """Split a column name into its ColumnInfo parts."""
+    category = classify(name)
+    rest = MERGE_SUFFIX_PATTERN.sub('', name) if TURBINE_PATTERN.match(name) else name
+
+    match = TURBINE_PATTERN.match(rest)
+    turbine = match.group(1) if match else None
+    if match:
+        rest = rest[match.end():]
+
+    unit_match = UNIT_PATTERN.search(rest)
+    unit = next(g for g in unit_match.groups() if g) if unit_match else DEFAULT_UNITS.get(category)
+    if unit_match:
+        rest = rest[:unit_match.start()] + rest[unit_match.end():]
+
+    stat_match = STATISTIC_PATTERN.search(rest)
+    statistic = STATISTICS[stat_match.group(1).lower()] if stat_match else None
+    if stat_match:
+        rest = rest[:stat_match.start()] + rest[stat_match.end():]
+
+    sensor = ' '.join(CHANNEL_PATTERN.sub('', rest).split()) or name
+    return ColumnInfo(name, turbine, sensor, statistic, unit, category)
+
+
+class ColumnSchema:
+    """Parsed index over one set of column names."""
+
+    def __init__(self, columns):
+        self.columns = tuple(columns)
+        self.info = {col: parse_column(col) for col in self.columns}
+        self.by_category = {category: [] for category in CATEGORIES}
+        self.by_turbine = {}
+        self._by_turbine_category = {}
+        for info in self.info.values():
+            self.by_category[info.category].append(info.name)
+            if info.turbine is not None:
+                self.by_turbine.setdefault(info.turbine, []).append(info.name)
+                self._by_turbine_category.setdefault((info.turbine, info.category), []).append(info.name)
+
+    @property
+    def turbines(self):
+        return sorted(self.by_turbine)
+
+    def columns_for(self, category, turbine=None, sensor_keyword=None):
+        """Columns of a category, optionally restricted to one turbine.
+
+        ``sensor_keyword`` narrows the match to sensors whose name (spaces
+        removed, lowercased) contains it, e.g. ``'windspeed'`` to skip wind
+        direction channels that share the wind_speed category.
+        """
+        if turbine is None:
+            columns = self.by_category.get(category, [])
+        else:
+            columns = self._by_turbine_category.get((turbine, category), [])
+        if sensor_keyword:
+            columns = [c for c in columns
+                       if sensor_keyword in self.info[c].sensor.replace(' ', '').lower()]
+        return columns
+
+    def turbine_map(self, category, sensor_keyword=None):
+        """First matching column of ``category`` per turbine, keyed by turbine ID."""
+        mapping = {}
+        for name in self.columns_for(category, sensor_keyword=sensor_keyword):
+            turbine = self.info[name].turbine
+            if turbine is not None:
+                mapping.setdefault(turbine, name)
+        return mapping
+
+
+@lru_cache(maxsize=32)
+def _schema_for(columns):
+    return ColumnSchema(columns)
+
+
+def column_schema(df_or_columns):
+    """Schema index of a DataFrame or list of names, memoized by column set."""
+    columns = df_or_columns.columns if hasattr(df_or_columns, 'columns') else df_or_columns
+    return _schema_for(tuple(columns))
@@ -7,20 +7,35 @@ Analyzes the comprehensive dataset of wind turbine operational data.
 import pandas as pd
 import numpy as np
 import os
+import time
+import argparse
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import matplotlib.pyplot as plt
 import seaborn as sns
+from excel_cache import read_cached, cached_info, compact_frame, frame_memory_mb
+from column_schema import column_schema
+from power_curve import BIN_WIDTH, PowerCurveAccumulator
 
-def analyze_file(filename):
+def analyze_file(filename, compact=False):
     """Analyze a single Excel file and return basic statistics."""
+    start = time.perf_counter()
     try:
-        df = pd.read_excel(filename)
+        df = read_cached(filename)
+        memory_usage_mb = frame_memory_mb(df)
+        compact_memory_usage_mb = None
+        if compact:
+            df = compact_frame(df)
+            compact_memory_usage_mb = frame_memory_mb(df)
+        
         analysis = {
             'filename': filename,
             'shape': df.shape,
             'columns': len(df.columns),
             'rows': len(df),
-            'memory_usage_mb': df.memory_usage(deep=True).sum() / 1024 / 1024,
+            'memory_usage_mb': memory_usage_mb,
+            'compact_memory_usage_mb': compact_memory_usage_mb,
             'missing_values': df.isnull().sum().sum(),
             'duplicate_rows': df.duplicated().sum(),
             'time_range': None,
@@ -29,61 +44,34 @@ def analyze_file(filename):
         
         # Check if there's a timestamp column
         if 'PCTimeStamp' in df.columns:
-            df['PCTimeStamp'] = pd.to_datetime(df['PCTimeStamp'])
+            if not pd.api.types.is_datetime64_any_dtype(df['PCTimeStamp']):
+                df['PCTimeStamp'] = pd.to_datetime(df['PCTimeStamp'])
             analysis['time_range'] = {
                 'start': df['PCTimeStamp'].min(),
                 'end': df['PCTimeStamp'].max(),
                 'duration_days': (df['PCTimeStamp'].max() - df['PCTimeStamp'].min()).days
             }
         
+        analysis['elapsed_seconds'] = time.perf_counter() - start
         return analysis
     except Exception as e:
-        return {'filename': filename, 'error': str(e)}
+        return {'filename': filename, 'error': str(e),
+                'elapsed_seconds': time.perf_counter() - start}
+
+def analyze_files(filenames, workers=None, compact=False):
+    """Analyze files in parallel, returning results in the input order."""
+    analyze = partial(analyze_file, compact=compact)
+    if workers == 1 or len(filenames) <= 1:
+        return [analyze(f) for f in filenames]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(analyze, filenames))
 
 def get_column_categories(df):
-    """Categorize columns by their measurement type."""
-    categories = {
-        'timestamp': [],
-        'power': [],
-        'temperature': [],
-        'wind_speed': [],
-        'voltage': [],
-        'current': [],
-        'pressure': [],
-        'rpm': [],
-        'angle': [],
-        'humidity': [],
-        'other': []
-    }
-    
-    for col in df.columns:
-        col_lower = col.lower()
-        if 'timestamp' in col_lower or 'time' in col_lower:
-            categories['timestamp'].append(col)
-        elif 'power' in col_lower:
-            categories['power'].append(col)
-        elif 'temp' in col_lower or 'temperature' in col_lower:
-            categories['temperature'].append(col)
-        elif 'windspeed' in col_lower or 'wind' in col_lower:
-            categories['wind_speed'].append(col)
-        elif 'voltage' in col_lower:
-            categories['voltage'].append(col)
-        elif 'current' in col_lower:
-            categories['current'].append(col)
-        elif 'pressure' in col_lower:
-            categories['pressure'].append(col)
-        elif 'rpm' in col_lower:
-            categories['rpm'].append(col)
-        elif 'angle' in col_lower or 'pitch' in col_lower or 'yaw' in col_lower:
-            categories['angle'].append(col)
-        elif 'humidity' in col_lower:
-            categories['humidity'].append(col)
-        else:
-            categories['other'].append(col)
-    
-    return categories
+    """Categorize columns (of a DataFrame or a list of names) by measurement type."""
+    schema = column_schema(df)
+    return {category: list(cols) for category, cols in schema.by_category.items()}
 
-def main():
+def main(workers=None, compact=False):
     """Main analysis function."""
     print("=" * 80)
     print("WIND TURBINE DATA ANALYSIS")
@@ -102,17 +90,21 @@ def main():
     print("DETAILED FILE ANALYSIS")
     print("=" * 80)
     
-    all_analyses = []
-    for file in excel_files:
+    # Files are independent, so they are analyzed in a process pool and
+    # reported in the original order once all are done
+    all_analyses = analyze_files(excel_files, workers, compact)
+    for file, analysis in zip(excel_files, all_analyses):
         print(f"\nAnalyzing: {file}")
-        analysis = analyze_file(file)
-        all_analyses.append(analysis)
         
         if 'error' in analysis:
             print(f"  ERROR: {analysis['error']}")
         else:
             print(f"  Shape: {analysis['shape']}")
-            print(f"  Memory: {analysis['memory_usage_mb']:.1f} MB")
+            if analysis['compact_memory_usage_mb'] is not None:
+                print(f"  Memory: {analysis['memory_usage_mb']:.1f} MB -> "
+                      f"{analysis['compact_memory_usage_mb']:.1f} MB (compact)")
+            else:
+                print(f"  Memory: {analysis['memory_usage_mb']:.1f} MB")
             print(f"  Missing values: {analysis['missing_values']}")
             print(f"  Duplicate rows: {analysis['duplicate_rows']}")
             
@@ -131,19 +123,31 @@ def main():
     
     print(f"Total dataset size: {total_rows:,} rows × {total_columns:,} columns")
     print(f"Total memory usage: {total_memory:.1f} MB")
+    if compact:
+        compact_memory = sum(a['compact_memory_usage_mb'] for a in all_analyses if 'error' not in a)
+        print(f"Total compact memory usage: {compact_memory:.1f} MB")
     print(f"Number of files: {len([a for a in all_analyses if 'error' not in a])}")
     
+    print("\n" + "=" * 80)
+    print("FILE TIMINGS")
+    print("=" * 80)
+    
+    # Slowest workbooks first
+    for analysis in sorted(all_analyses, key=lambda a: a['elapsed_seconds'], reverse=True):
+        print(f"  {analysis['elapsed_seconds']:7.2f}s  {analysis['filename']}")
+    
     # Analyze the main power curve file in detail
     print("\n" + "=" * 80)
     print("POWER CURVE ANALYSIS")
     print("=" * 80)
     
     try:
-        power_df = pd.read_excel('Power-curve baseline (expected power vs. wind-speed pairs).xlsx')
-        print(f"Power curve data shape: {power_df.shape}")
+        power_file = 'Power-curve baseline (expected power vs. wind-speed pairs).xlsx'
+        power_info = cached_info(power_file)
+        print(f"Power curve data shape: {(power_info['rows'], len(power_info['columns']))}")
         
         # Get column categories
-        categories = get_column_categories(power_df)
+        categories = get_column_categories(power_info['columns'])
         
         print("\nColumn categories:")
         for category, cols in categories.items():
@@ -154,8 +158,9 @@ def main():
                         print(f"    - {col}")
         
         # Basic statistics for wind speed and power
-        wind_cols = [col for col in power_df.columns if 'windspeed' in col.lower()]
-        power_cols = [col for col in power_df.columns if 'power' in col.lower()]
+        schema = column_schema(power_info['columns'])
+        wind_cols = schema.columns_for('wind_speed', sensor_keyword='windspeed')
+        power_cols = schema.columns_for('power')
         
         if wind_cols and power_cols:
             print(f"\nWind speed columns: {len(wind_cols)}")
@@ -165,10 +170,21 @@ def main():
             if wind_cols and power_cols:
                 wind_col = wind_cols[0]
                 power_col = power_cols[0]
+                power_df = read_cached(power_file, columns=[wind_col, power_col])
                 
                 print(f"\nSample statistics for {wind_col} and {power_col}:")
                 print(f"  Wind speed - Min: {power_df[wind_col].min():.2f}, Max: {power_df[wind_col].max():.2f}, Mean: {power_df[wind_col].mean():.2f}")
                 print(f"  Power - Min: {power_df[power_col].min():.2f}, Max: {power_df[power_col].max():.2f}, Mean: {power_df[power_col].mean():.2f}")
+                
+                # Binned power curve in 0.5 m/s bins, shown every 2 m/s
+                turbine = schema.info[wind_col].turbine or wind_col
+                curve = PowerCurveAccumulator().update(
+                    turbine, power_df[wind_col].to_numpy(), power_df[power_col].to_numpy()
+                ).curves()['turbines'][turbine]
+                print(f"\nBinned power curve for {turbine} ({len(curve['power'])} bins of {BIN_WIDTH} m/s):")
+                for center, power, count in zip(curve['bin_center'], curve['power'], curve['count']):
+                    if center % 2 == 0:
+                        print(f"  {center:5.1f} m/s: {power:8.1f} kW ({count} samples)")
     
     except Exception as e:
         print(f"Error analyzing power curve file: {e}")
@@ -201,4 +217,11 @@ def main():
     print("   - 10 wind turbines (WTG01-WTG10) with comprehensive monitoring")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Analyze the wind turbine Excel workbooks.")
+    parser.add_argument('--workers', type=int,
+                        default=int(os.getenv('ANALYSIS_WORKERS', os.cpu_count() or 1)),
+                        help="number of files analyzed in parallel")
+    parser.add_argument('--compact', action='store_true',
+                        help="downcast dtypes and report memory before and after")
+    args = parser.parse_args()
+    main(workers=args.workers, compact=args.compact) 
\ No newline at end of file
@@ -9,35 +9,47 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime, timedelta
+import argparse
+import os
 import warnings
 warnings.filterwarnings('ignore')
 
-def analyze_data_quality(df, filename):
-    """Analyze data quality issues."""
+from excel_cache import CACHE_DIR, read_cached, compact_frame, frame_memory_mb
+from column_schema import column_schema
+from quality_store import update_quality_stats
+from slot_grid import TimeGrid
+
+def analyze_data_quality(df, filename, stats_path=None, source=None, rebuild=False):
+    """Analyze data quality issues.
+    
+    With ``stats_path`` the statistics are kept in a persistent store and
+    only rows appended to ``source`` since the last run are scanned;
+    ``rebuild`` rescans every row.
+    """
     print(f"\n=== Data Quality Analysis for {filename} ===")
     
-    # Missing values analysis
-    missing_data = df.isnull().sum()
-    missing_percentage = (missing_data / len(df)) * 100
+    stats = update_quality_stats(df, stats_path, source, rebuild)
+    report = stats.report()
     
-    print(f"Total rows: {len(df):,}")
-    print(f"Total columns: {len(df.columns)}")
-    print(f"Total missing values: {df.isnull().sum().sum():,}")
-    print(f"Overall missing percentage: {(df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100:.2f}%")
+    print(f"Total rows: {report['rows']:,}")
+    print(f"Total columns: {report['columns']}")
+    print(f"Total missing values: {report['missing_values']:,}")
+    print(f"Overall missing percentage: {report['missing_percentage']:.2f}%")
     
     # Columns with most missing values
-    missing_summary = pd.DataFrame({
-        'Column': missing_data.index,
-        'Missing_Count': missing_data.values,
-        'Missing_Percentage': missing_percentage.values
-    }).sort_values('Missing_Count', ascending=False)
+    missing_summary = stats.missing_summary()
     
     print(f"\nTop 5 columns with most missing values:")
     print(missing_summary.head())
     
     # Duplicate analysis
-    duplicates = df.duplicated().sum()
-    print(f"\nDuplicate rows: {duplicates:,} ({duplicates/len(df)*100:.2f}%)")
+    print(f"\nDuplicate rows: {report['duplicate_rows']:,} ({report['duplicate_percentage']:.2f}%)")
+    
+    # Value ranges of the numeric columns
+    numeric_summary = stats.numeric_summary()
+    if len(numeric_summary):
+        print(f"\nNumeric columns ({len(numeric_summary)}):")
+        print(numeric_summary.round(3).to_string())
     
     return missing_summary
 
@@ -49,7 +61,8 @@ def analyze_time_series_patterns(df):
         print("No timestamp column found")
         return
     
-    df['PCTimeStamp'] = pd.to_datetime(df['PCTimeStamp'])
+    if not pd.api.types.is_datetime64_any_dtype(df['PCTimeStamp']):
+        df['PCTimeStamp'] = pd.to_datetime(df['PCTimeStamp'])
     
     # Time range
     start_time = df['PCTimeStamp'].min()
@@ -70,60 +83,91 @@ def analyze_time_series_patterns(df):
     print(f"Actual median interval: {time_diffs.median()}")
     print(f"Interval standard deviation: {time_diffs.std()}")
     
-    # Check for gaps
-    gaps = time_diffs[time_diffs > expected_interval * 1.5]
-    print(f"Number of gaps (>15 min): {len(gaps)}")
+    # Gaps on the regular 10-minute grid
+    grid = TimeGrid(df['PCTimeStamp'])
+    print(f"\nExpected 10-minute slots: {len(grid):,} ({grid.coverage:.2%} present)")
+    print(f"Duplicate timestamps: {grid.duplicate_rows:,}, out of order: {grid.out_of_order_rows:,}")
+    print(f"Number of gaps (>15 min): {len(grid.gap_starts)}")
+    
+    if len(grid.gap_starts):
+        gap_start, gap_end = grid.gap_intervals()
+        longest = np.argsort(grid.gap_lengths, kind='stable')[::-1][:5]
+        print("Longest gaps:")
+        for i in longest:
+            print(f"  {pd.Timestamp(gap_start[i])} to {pd.Timestamp(gap_end[i])} "
+                  f"({grid.gap_lengths[i]} slots missing)")
     
-    return time_diffs
+    return grid
+
+def to_long_format(df, column_map):
+    """Reshape ``{column: (turbine, sensor)}`` into turbine/timestamp/sensor/value rows."""
+    columns = list(column_map)
+    long = df[columns].reset_index(drop=True).rename_axis('row').reset_index()
+    if 'PCTimeStamp' in df.columns:
+        long['timestamp'] = df['PCTimeStamp'].to_numpy()
+        id_vars = ['row', 'timestamp']
+    else:
+        id_vars = ['row']
+    long = long.melt(id_vars=id_vars, value_vars=columns, var_name='column', value_name='value')
+    
+    long['turbine'] = long['column'].map({c: t for c, (t, _) in column_map.items()}).astype('category')
+    long['sensor'] = long['column'].map({c: s for c, (_, s) in column_map.items()}).astype('category')
+    long['value'] = long['value'].astype(np.float64)
+    return long.drop(columns='column')
 
 def analyze_wind_turbine_performance(df):
-    """Analyze wind turbine performance metrics."""
-    print(f"\n=== Wind Turbine Performance Analysis ===")
+    """Per-turbine wind/power statistics computed in one grouped pass.
     
-    # Find wind speed and power columns
-    wind_cols = [col for col in df.columns if 'windspeed' in col.lower()]
-    power_cols = [col for col in df.columns if 'power' in col.lower()]
+    Wind speed and power columns are paired by their WTG prefix rather than
+    by position. Returns a DataFrame indexed by turbine, or None if no turbine
+    has both a wind speed and a power column.
+    """
+    schema = column_schema(df)
+    wind = schema.turbine_map('wind_speed', sensor_keyword='windspeed')
+    power = schema.turbine_map('power')
+    turbines = sorted(set(wind) & set(power))
+    if not turbines:
+        return None
     
-    if not wind_cols or not power_cols:
-        print("No wind speed or power columns found")
-        return
+    column_map = {wind[t]: (t, 'wind_speed') for t in turbines}
+    column_map.update({power[t]: (t, 'power') for t in turbines})
+    long = to_long_format(df, column_map)
     
-    print(f"Found {len(wind_cols)} wind speed columns and {len(power_cols)} power columns")
+    # Mean, std and max of every (turbine, sensor) series at once
+    stats = long.groupby(['turbine', 'sensor'], observed=True)['value'].agg(['mean', 'std', 'max'])
+    stats = stats.unstack('sensor')
     
-    # Analyze each turbine
-    for i in range(min(len(wind_cols), len(power_cols))):
-        wind_col = wind_cols[i]
-        power_col = power_cols[i]
-        
-        turbine_id = wind_col.split('_')[0]  # Extract WTG01, WTG02, etc.
-        
-        print(f"\n{turbine_id}:")
-        
-        # Basic statistics
-        wind_stats = df[wind_col].describe()
-        power_stats = df[power_col].describe()
-        
-        print(f"  Wind Speed - Mean: {wind_stats['mean']:.2f}, Std: {wind_stats['std']:.2f}")
-        print(f"  Power - Mean: {power_stats['mean']:.2f}, Std: {power_stats['std']:.2f}")
-        
-        # Power curve analysis (wind speed vs power)
-        valid_data = df[[wind_col, power_col]].dropna()
-        if len(valid_data) > 0:
-            correlation = valid_data[wind_col].corr(valid_data[power_col])
-            print(f"  Wind-Power Correlation: {correlation:.3f}")
-            
-            # Efficiency analysis
-            max_power = power_stats['max']
-            avg_power = power_stats['mean']
-            capacity_factor = avg_power / max_power if max_power > 0 else 0
-            print(f"  Capacity Factor: {capacity_factor:.3f}")
+    # Pairwise-complete wind/power correlation for all turbines
+    paired = long.pivot(index=['turbine', 'row'], columns='sensor', values='value').dropna()
+    grouped = paired.groupby(level='turbine', observed=True)
+    centered = paired - grouped.transform('mean')
+    sums = pd.DataFrame({
+        'wp': centered['wind_speed'] * centered['power'],
+        'ww': centered['wind_speed'] ** 2,
+        'pp': centered['power'] ** 2,
+    }).groupby(level='turbine', observed=True).sum()
+    correlation = sums['wp'] / np.sqrt(sums['ww'] * sums['pp'])
+    
+    power_max = stats[('max', 'power')]
+    result = pd.DataFrame({
+        'wind_speed_mean': stats[('mean', 'wind_speed')],
+        'wind_speed_std': stats[('std', 'wind_speed')],
+        'power_mean': stats[('mean', 'power')],
+        'power_std': stats[('std', 'power')],
+        'wind_power_correlation': correlation,
+        'capacity_factor': (stats[('mean', 'power')] / power_max).where(power_max > 0, 0.0),
+        'paired_samples': grouped.size(),
+    }, index=pd.Index(turbines, name='turbine'))
+    result['paired_samples'] = result['paired_samples'].fillna(0).astype(int)
+    return result
 
 def analyze_sensor_data(df, sensor_type):
     """Analyze specific sensor data."""
     print(f"\n=== {sensor_type} Sensor Analysis ===")
     
-    # Find relevant columns
-    sensor_cols = [col for col in df.columns if sensor_type.lower() in col.lower()]
+    # Find relevant columns through the shared schema index
+    schema = column_schema(df)
+    sensor_cols = schema.columns_for(sensor_type.lower().replace(' ', '_'))
     
     if not sensor_cols:
         print(f"No {sensor_type} columns found")
@@ -133,8 +177,11 @@ def analyze_sensor_data(df, sensor_type):
     
     # Analyze each sensor
     for col in sensor_cols[:5]:  # Limit to first 5 for readability
-        turbine_id = col.split('_')[0]
-        sensor_name = col.split('_')[1] if len(col.split('_')) > 1 else "Unknown"
+        info = schema.info[col]
+        turbine_id = info.turbine or "Unknown"
+        sensor_name = info.sensor
+        if info.statistic:
+            sensor_name += f" ({info.statistic})"
         
         stats = df[col].describe()
         missing_pct = (df[col].isnull().sum() / len(df)) * 100
@@ -142,9 +189,11 @@ def analyze_sensor_data(df, sensor_type):
         print(f"\n{turbine_id} - {sensor_name}:")
         print(f"  Mean: {stats['mean']:.2f}, Std: {stats['std']:.2f}")
         print(f"  Min: {stats['min']:.2f}, Max: {stats['max']:.2f}")
+        if info.unit:
+            print(f"  Unit: {info.unit}")
         print(f"  Missing: {missing_pct:.1f}%")
 
-def main():
+def main(compact=False, quality_dir=CACHE_DIR, rebuild_quality=False):
     """Main analysis function."""
     print("=" * 80)
     print("DETAILED WIND TURBINE DATA ANALYSIS")
@@ -164,17 +213,33 @@ def main():
             print(f"ANALYZING: {filename}")
             print(f"{'='*60}")
             
-            df = pd.read_excel(filename)
+            df = read_cached(filename)
+            if compact:
+                before_mb = frame_memory_mb(df)
+                df = compact_frame(df)
+                print(f"Memory: {before_mb:.1f} MB -> {frame_memory_mb(df):.1f} MB (compact)")
             
             # Data quality analysis
-            missing_summary = analyze_data_quality(df, filename)
+            stats_path = None
+            if quality_dir:
+                os.makedirs(quality_dir, exist_ok=True)
+                # Hashes and moments depend on the dtypes, so compact runs keep their own store
+                suffix = '.compact' if compact else ''
+                stats_path = os.path.join(quality_dir, f"{filename}.quality{suffix}.npz")
+            missing_summary = analyze_data_quality(df, filename, stats_path, source=filename,
+                                                   rebuild=rebuild_quality)
             
             # Time series analysis
-            time_diffs = analyze_time_series_patterns(df)
+            analyze_time_series_patterns(df)
             
             # Performance analysis (for power curve file)
             if 'power' in filename.lower():
-                analyze_wind_turbine_performance(df)
+                print(f"\n=== Wind Turbine Performance Analysis ===")
+                performance = analyze_wind_turbine_performance(df)
+                if performance is None:
+                    print("No wind speed or power columns found")
+                else:
+                    print(performance.round(3).to_string())
             
             # Sensor-specific analysis
             if 'temperature' in filename.lower():
@@ -206,4 +271,12 @@ def main():
     print("5. Visualization: Create dashboards for monitoring")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Detailed analysis of key wind turbine workbooks.")
+    parser.add_argument('--compact', action='store_true',
+                        help="downcast dtypes and report memory before and after")
+    parser.add_argument('--quality-dir', default=CACHE_DIR,
+                        help="directory of the incremental quality stores ('' disables them)")
+    parser.add_argument('--rebuild-quality', action='store_true',
+                        help="rescan every row instead of extending the quality stores")
+    args = parser.parse_args()
+    main(compact=args.compact, quality_dir=args.quality_dir, rebuild_quality=args.rebuild_quality) 
\ No newline at end of file
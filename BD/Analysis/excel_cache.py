@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Excel Telemetry Cache
+Converts each raw Excel workbook once into a columnar Parquet file so the
+analysis scripts never parse the same workbook twice.
+
+Cache entries live in CACHE_DIR (default ``.cache`` next to the workbooks)
+and are invalidated when the workbook's modification time and content hash
+change. Run this script directly to convert every workbook up front.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # Fall back to reading the workbooks directly
+    pq = None
+
+CACHE_DIR = os.getenv("WT_CACHE_DIR", ".cache")
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_paths(path, cache_dir=CACHE_DIR):
+    """Parquet and metadata paths of a workbook's cache entry."""
+    name = os.path.basename(path)
+    return (os.path.join(cache_dir, f"{name}.parquet"),
+            os.path.join(cache_dir, f"{name}.json"))
+
+
+def _is_fresh(path, parquet_path, meta_path):
+    if not (os.path.exists(parquet_path) and os.path.exists(meta_path)):
+        return False
+
+    with open(meta_path) as f:
+        meta = json.load(f)
+    stat = os.stat(path)
+    if meta['mtime'] == stat.st_mtime and meta['size'] == stat.st_size:
+        return True
+
+    # The file was touched or copied; only a content change invalidates
+    if meta['size'] == stat.st_size and meta['sha256'] == file_hash(path):
+        meta['mtime'] = stat.st_mtime
+        _write_json(meta_path, meta)
+        return True
+    return False
+
+
+def _write_json(path, data):
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _make_arrow_safe(df):
+    """Store mixed-type object columns as strings, keeping missing values."""
+    for col in df.columns:
+        if df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True) == 'mixed':
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+
+def convert_to_cache(path, cache_dir=CACHE_DIR):
+    """Parse a workbook once and write it to the Parquet cache."""
+    parquet_path, meta_path = cache_paths(path, cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    stat = os.stat(path)
+    df = _make_arrow_safe(pd.read_excel(path))
+
+    tmp_path = f"{parquet_path}.tmp{os.getpid()}"
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, parquet_path)
+    _write_json(meta_path, {
+        'source': os.path.abspath(path),
+        'mtime': stat.st_mtime,
+        'size': stat.st_size,
+        'sha256': file_hash(path),
+        'rows': len(df),
+        'columns': len(df.columns),
+    })
+    return parquet_path
+
+
+def ensure_cached(path, cache_dir=CACHE_DIR):
+    """Path to an up-to-date Parquet cache of a workbook, converting if needed."""
+    parquet_path, meta_path = cache_paths(path, cache_dir)
+    if _is_fresh(path, parquet_path, meta_path):
+        return parquet_path
+    return convert_to_cache(path, cache_dir)
+
+
+def frame_memory_mb(df):
+    """Deep memory usage of a DataFrame in MB."""
+    return df.memory_usage(deep=True).sum() / 1024 / 1024
+
+
+def compact_frame(df, rtol=1e-6, max_category_ratio=0.5):
+    """Shrink a telemetry frame's working set in place and return it.
+
+    PCTimeStamp is parsed once into datetime64, float64 sensor columns become
+    float32 when every value survives the round trip within ``rtol`` (large
+    counters that would lose precision stay float64), integer columns take the
+    smallest integer type that fits, and repetitive text columns such as
+    turbine IDs (WTG01-WTG10) become categoricals.
+    """
+    if 'PCTimeStamp' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['PCTimeStamp']):
+        df['PCTimeStamp'] = pd.to_datetime(df['PCTimeStamp'])
+
+    for col in df.columns:
+        series = df[col]
+        if series.dtype == np.float64:
+            values = series.to_numpy()
+            narrowed = values.astype(np.float32)
+            finite = np.isfinite(values)
+            if np.allclose(narrowed[finite], values[finite], rtol=rtol, atol=0.0):
+                df[col] = narrowed
+        elif pd.api.types.is_integer_dtype(series):
+            df[col] = pd.to_numeric(series, downcast='integer')
+        elif series.dtype == object or pd.api.types.is_string_dtype(series):
+            if series.nunique(dropna=True) <= max_category_ratio * len(series):
+                df[col] = series.astype('category')
+    return df
+
+
+def read_cached(path, columns=None, cache_dir=CACHE_DIR, compact=False):
+    """Read a workbook through the cache, optionally loading only some columns.
+
+    With ``compact`` the frame is passed through ``compact_frame``.
+    """
+    if pq is None:
+        df = pd.read_excel(path, usecols=columns)
+    else:
+        df = pd.read_parquet(ensure_cached(path, cache_dir), columns=columns)
+    return compact_frame(df) if compact else df
+
+
+def cached_info(path, cache_dir=CACHE_DIR):
+    """Row count and column names of a workbook without loading its data."""
+    if pq is None:
+        df = pd.read_excel(path)
+        return {'rows': len(df), 'columns': list(df.columns)}
+    metadata = pq.read_metadata(ensure_cached(path, cache_dir))
+    return {'rows': metadata.num_rows, 'columns': metadata.schema.to_arrow_schema().names}
+
+
+def main():
+    """Convert every workbook in the current directory into the cache."""
+    if pq is None:
+        print("pyarrow is not installed; the Parquet cache is unavailable")
+        return
+
+    excel_files = sorted(f for f in os.listdir('.') if f.endswith('.xlsx'))
+    print(f"Caching {len(excel_files)} Excel files into {CACHE_DIR}/")
+    for file in excel_files:
+        start = time.perf_counter()
+        parquet_path, meta_path = cache_paths(file)
+        if _is_fresh(file, parquet_path, meta_path):
+            print(f"  {file:<60} up to date")
+            continue
+        convert_to_cache(file)
+        print(f"  {file:<60} converted in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Binned Power Curves
+Builds per-turbine power curves with IEC 61400-12 style wind-speed bins
+(0.5 m/s wide, centred on multiples of 0.5 m/s) out of core.
+
+Workbooks are streamed from the Parquet cache in chunks and each chunk only
+adds to per-bin counts, wind-speed sums and power sums/sums of squares, so
+partial results from different files or processes merge by addition. The
+finished curves are written as JSON for the API (see POWER_CURVE_PATH in
+backend/main.py).
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+import numpy as np
+
+from column_schema import column_schema
+from excel_cache import ensure_cached, read_cached
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+BIN_WIDTH = 0.5
+MAX_WIND_SPEED = 40.0
+POWER_CURVE_FILE = 'Power-curve baseline (expected power vs. wind-speed pairs).xlsx'
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'models', 'power_curves.json')
+
+
+class PowerCurveAccumulator:
+    """Per-turbine, per-bin sums that can be updated chunk by chunk and merged."""
+
+    def __init__(self, bin_width=BIN_WIDTH, max_wind_speed=MAX_WIND_SPEED):
+        self.bin_width = bin_width
+        self.max_wind_speed = max_wind_speed
+        self.n_bins = int(np.floor(max_wind_speed / bin_width + 0.5)) + 1
+        self.turbines = {}
+        self.counts = np.zeros((0, self.n_bins), dtype=np.int64)
+        self.wind_sums = np.zeros((0, self.n_bins))
+        self.power_sums = np.zeros((0, self.n_bins))
+        self.power_sumsq = np.zeros((0, self.n_bins))
+
+    def _row(self, turbine):
+        row = self.turbines.get(turbine)
+        if row is None:
+            row = self.turbines[turbine] = len(self.turbines)
+            empty = np.zeros((1, self.n_bins))
+            self.counts = np.vstack([self.counts, empty.astype(np.int64)])
+            self.wind_sums = np.vstack([self.wind_sums, empty])
+            self.power_sums = np.vstack([self.power_sums, empty])
+            self.power_sumsq = np.vstack([self.power_sumsq, empty])
+        return row
+
+    def bin_index(self, wind_speed):
+        """IEC bin of each wind speed: floor(w / width + 0.5)."""
+        return np.floor(np.asarray(wind_speed, dtype=np.float64) / self.bin_width + 0.5).astype(np.int64)
+
+    def update(self, turbine, wind_speed, power):
+        """Add paired wind speed / power samples of one turbine."""
+        wind_speed = np.asarray(wind_speed, dtype=np.float64)
+        power = np.asarray(power, dtype=np.float64)
+        valid = np.isfinite(wind_speed) & np.isfinite(power) & (wind_speed >= 0)
+        wind_speed, power = wind_speed[valid], power[valid]
+        bins = self.bin_index(wind_speed)
+        in_range = bins < self.n_bins
+        bins, wind_speed, power = bins[in_range], wind_speed[in_range], power[in_range]
+
+        row = self._row(turbine)
+        self.counts[row] += np.bincount(bins, minlength=self.n_bins)
+        self.wind_sums[row] += np.bincount(bins, weights=wind_speed, minlength=self.n_bins)
+        self.power_sums[row] += np.bincount(bins, weights=power, minlength=self.n_bins)
+        self.power_sumsq[row] += np.bincount(bins, weights=power * power, minlength=self.n_bins)
+        return self
+
+    def update_frame(self, df):
+        """Add every turbine's wind speed / power pair found in a frame."""
+        schema = column_schema(df)
+        wind = schema.turbine_map('wind_speed', sensor_keyword='windspeed')
+        power = schema.turbine_map('power')
+        for turbine in sorted(set(wind) & set(power)):
+            self.update(turbine, df[wind[turbine]].to_numpy(), df[power[turbine]].to_numpy())
+        return self
+
+    def merge(self, other):
+        """Add another accumulator's sums into this one."""
+        if (other.bin_width, other.n_bins) != (self.bin_width, self.n_bins):
+            raise ValueError("Cannot merge power curves with different bins")
+        for turbine, other_row in other.turbines.items():
+            row = self._row(turbine)
+            self.counts[row] += other.counts[other_row]
+            self.wind_sums[row] += other.wind_sums[other_row]
+            self.power_sums[row] += other.power_sums[other_row]
+            self.power_sumsq[row] += other.power_sumsq[other_row]
+        return self
+
+    def _curve(self, counts, wind_sums, power_sums, power_sumsq, min_count):
+        keep = counts >= max(min_count, 1)
+        n = counts[keep]
+        mean = power_sums[keep] / n
+        with np.errstate(invalid='ignore', divide='ignore'):
+            var = np.where(n > 1, (power_sumsq[keep] - n * mean ** 2) / (n - 1), 0.0)
+        return {
+            'bin_center': (np.flatnonzero(keep) * self.bin_width).tolist(),
+            'wind_speed': (wind_sums[keep] / n).tolist(),
+            'power': mean.tolist(),
+            'power_std': np.sqrt(np.maximum(var, 0.0)).tolist(),
+            'count': n.tolist(),
+        }
+
+    def curves(self, min_count=3):
+        """Binned curve per turbine plus a pooled ``fleet`` curve."""
+        result = {
+            'bin_width': self.bin_width,
+            'min_count': min_count,
+            'turbines': {
+                turbine: self._curve(self.counts[row], self.wind_sums[row],
+                                     self.power_sums[row], self.power_sumsq[row], min_count)
+                for turbine, row in sorted(self.turbines.items())
+            },
+        }
+        result['fleet'] = self._curve(self.counts.sum(axis=0), self.wind_sums.sum(axis=0),
+                                      self.power_sums.sum(axis=0), self.power_sumsq.sum(axis=0),
+                                      min_count)
+        return result
+
+    def save(self, path, min_count=3):
+        """Write the finished curves as JSON."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.curves(min_count), f, indent=2)
+        os.replace(tmp_path, path)
+
+
+def accumulate_file(filename, chunk_rows=100_000):
+    """Power-curve sums of one workbook, streamed from its Parquet cache."""
+    acc = PowerCurveAccumulator()
+    if pq is None:
+        return acc.update_frame(read_cached(filename))
+
+    parquet_file = pq.ParquetFile(ensure_cached(filename))
+    schema = column_schema(parquet_file.schema_arrow.names)
+    wind = schema.turbine_map('wind_speed', sensor_keyword='windspeed')
+    power = schema.turbine_map('power')
+    turbines = sorted(set(wind) & set(power))
+    if not turbines:
+        return acc
+
+    columns = [wind[t] for t in turbines] + [power[t] for t in turbines]
+    for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=columns):
+        acc.update_frame(batch.to_pandas())
+    return acc
+
+
+def build_power_curves(filenames, workers=None, chunk_rows=100_000):
+    """Accumulate workbooks in a process pool and merge the partial sums."""
+    if workers == 1 or len(filenames) <= 1:
+        partials = [accumulate_file(f, chunk_rows) for f in filenames]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = list(pool.map(accumulate_file, filenames, [chunk_rows] * len(filenames)))
+    return reduce(PowerCurveAccumulator.merge, partials, PowerCurveAccumulator())
+
+
+def main():
+    """Build power curves from workbooks in the current directory."""
+    parser = argparse.ArgumentParser(description="Build binned per-turbine power curves.")
+    parser.add_argument('files', nargs='*', default=[POWER_CURVE_FILE],
+                        help="workbooks holding paired wind speed and power columns")
+    parser.add_argument('--output', default=os.getenv('POWER_CURVE_PATH', DEFAULT_OUTPUT))
+    parser.add_argument('--workers', type=int,
+                        default=int(os.getenv('ANALYSIS_WORKERS', os.cpu_count() or 1)))
+    parser.add_argument('--chunk-rows', type=int, default=100_000)
+    parser.add_argument('--min-count', type=int, default=3,
+                        help="bins with fewer samples are left out of the curves")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    acc = build_power_curves(args.files, args.workers, args.chunk_rows)
+    acc.save(args.output, args.min_count)
+
+    curves = acc.curves(args.min_count)
+    print(f"Power curves for {len(curves['turbines'])} turbines from {len(args.files)} files "
+          f"in {time.perf_counter() - start:.1f}s -> {args.output}")
+    for turbine, curve in curves['turbines'].items():
+        rated = max(curve['power'], default=0.0)
+        print(f"  {turbine}: {len(curve['power'])} bins, {sum(curve['count']):,} samples, "
+              f"max bin power {rated:.1f}")
+
+
+if __name__ == "__main__":
+    main()
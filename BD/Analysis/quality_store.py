@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Incremental Data-Quality Statistics
+Keeps per-column missing counts, a row-hash set for duplicate detection and
+running min/max/mean/variance so appended telemetry is folded in without
+rescanning the rows already seen.
+
+Workbooks are expected to grow by appending rows: rows beyond the stored row
+count are treated as new. A store is reused as-is while the source file's
+modification time and size are unchanged. Otherwise a sample of the rows it
+already covers (always including the last one) is re-hashed and the store
+is rebuilt if any of them changed; an explicit rebuild rescans everything.
+Stats are saved as a compressed ``.npz`` next to whatever path the caller
+chooses.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+# Stored rows re-hashed to check that a changed source was only appended to
+PREFIX_SAMPLES = 64
+
+
+class QualityStats:
+    """Mergeable data-quality accumulators for one table."""
+
+    def __init__(self):
+        self.columns = []
+        self.rows = 0
+        self.duplicates = 0
+        self.missing = np.zeros(0, dtype=np.int64)
+        self.numeric_columns = []
+        self.count = np.zeros(0, dtype=np.int64)
+        self.mean = np.zeros(0)
+        self.m2 = np.zeros(0)
+        self.min = np.zeros(0)
+        self.max = np.zeros(0)
+        self.row_hash_log = np.zeros(0, dtype=np.uint64)  # Hash of every row, in order
+        self.row_hashes = set()
+        self.source = None  # (mtime_ns, size) of the file the rows came from
+
+    def _add_columns(self, df):
+        new = [col for col in df.columns if col not in self.columns]
+        if not new:
+            return
+        # Columns absent so far count as missing for every earlier row
+        self.columns.extend(new)
+        self.missing = np.concatenate([self.missing, np.full(len(new), self.rows, dtype=np.int64)])
+
+        new_numeric = [col for col in new if pd.api.types.is_numeric_dtype(df[col])
+                       and not pd.api.types.is_bool_dtype(df[col])]
+        k = len(new_numeric)
+        self.numeric_columns.extend(new_numeric)
+        self.count = np.concatenate([self.count, np.zeros(k, dtype=np.int64)])
+        self.mean = np.concatenate([self.mean, np.zeros(k)])
+        self.m2 = np.concatenate([self.m2, np.zeros(k)])
+        self.min = np.concatenate([self.min, np.full(k, np.inf)])
+        self.max = np.concatenate([self.max, np.full(k, -np.inf)])
+
+    def _hash_rows(self, df):
+        return pd.util.hash_pandas_object(df.reindex(columns=self.columns), index=False).to_numpy(np.uint64)
+
+    def matches_prefix(self, df, samples=PREFIX_SAMPLES):
+        """Whether the first ``rows`` rows of ``df`` are the rows already folded in.
+
+        Only ``samples`` evenly spaced rows, always including the last one,
+        are re-hashed, so the check costs O(samples) rather than O(rows).
+        """
+        if len(df) < self.rows:
+            return False
+        if self.rows == 0:
+            return True
+        positions = np.unique(np.linspace(0, self.rows - 1, min(samples, self.rows)).astype(np.intp))
+        return np.array_equal(self._hash_rows(df.iloc[positions]), self.row_hash_log[positions])
+
+    def update(self, df):
+        """Fold new rows into the statistics in O(len(df))."""
+        if len(df) == 0:
+            return self
+        self._add_columns(df)
+        df = df.reindex(columns=self.columns)
+
+        self.missing += df.isnull().sum().to_numpy(dtype=np.int64)
+
+        # Hash rows once; a row is a duplicate if its hash was seen before
+        hashes = self._hash_rows(df)
+        self.row_hash_log = np.concatenate([self.row_hash_log, hashes])
+        seen = self.row_hashes
+        duplicates = 0
+        for h in hashes.tolist():
+            if h in seen:
+                duplicates += 1
+            else:
+                seen.add(h)
+        self.duplicates += duplicates
+
+        # Batch moments merged into the running ones (Chan et al.)
+        values = df[self.numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(values)
+        n_b = valid.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_b = np.where(n_b > 0, np.nansum(values, axis=0) / n_b, 0.0)
+            m2_b = np.nansum((values - mean_b) ** 2, axis=0)
+            n = self.count + n_b
+            delta = mean_b - self.mean
+            self.mean = np.where(n > 0, self.mean + delta * n_b / np.maximum(n, 1), 0.0)
+            self.m2 = self.m2 + m2_b + delta ** 2 * self.count * n_b / np.maximum(n, 1)
+        self.count = n
+        if values.size:
+            self.min = np.fmin(self.min, np.nanmin(np.where(valid, values, np.inf), axis=0))
+            self.max = np.fmax(self.max, np.nanmax(np.where(valid, values, -np.inf), axis=0))
+
+        self.rows += len(df)
+        return self
+
+    def missing_summary(self):
+        """Missing counts per column, most missing first."""
+        rows = max(self.rows, 1)
+        return pd.DataFrame({
+            'Column': self.columns,
+            'Missing_Count': self.missing,
+            'Missing_Percentage': self.missing / rows * 100,
+        }).sort_values('Missing_Count', ascending=False)
+
+    def numeric_summary(self):
+        """Count, mean, std, min and max of every numeric column."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.sqrt(self.m2 / (self.count - 1))
+        has_values = self.count > 0
+        return pd.DataFrame({
+            'count': self.count,
+            'mean': np.where(has_values, self.mean, np.nan),
+            'std': np.where(self.count > 1, std, np.nan),
+            'min': np.where(has_values, self.min, np.nan),
+            'max': np.where(has_values, self.max, np.nan),
+        }, index=pd.Index(self.numeric_columns, name='column'))
+
+    def report(self):
+        """Totals the quality report prints."""
+        total_missing = int(self.missing.sum())
+        cells = self.rows * len(self.columns)
+        return {
+            'rows': self.rows,
+            'columns': len(self.columns),
+            'missing_values': total_missing,
+            'missing_percentage': total_missing / cells * 100 if cells else 0.0,
+            'duplicate_rows': self.duplicates,
+            'duplicate_percentage': self.duplicates / self.rows * 100 if self.rows else 0.0,
+        }
+
+    def save(self, path):
+        tmp_path = f"{path}.tmp{os.getpid()}.npz"
+        np.savez_compressed(
+            tmp_path,
+            columns=np.array(self.columns, dtype=object),
+            numeric_columns=np.array(self.numeric_columns, dtype=object),
+            counters=np.array([self.rows, self.duplicates], dtype=np.int64),
+            source=np.array(self.source if self.source else [-1, -1], dtype=np.int64),
+            missing=self.missing, count=self.count, mean=self.mean, m2=self.m2,
+            min=self.min, max=self.max,
+            row_hash_log=self.row_hash_log,
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        stats = cls()
+        with np.load(path, allow_pickle=True) as data:
+            stats.columns = data['columns'].tolist()
+            stats.numeric_columns = data['numeric_columns'].tolist()
+            stats.rows, stats.duplicates = (int(v) for v in data['counters'])
+            stats.missing = data['missing']
+            stats.count = data['count']
+            stats.mean = data['mean']
+            stats.m2 = data['m2']
+            stats.min = data['min']
+            stats.max = data['max']
+            stats.row_hash_log = data['row_hash_log']
+            stats.row_hashes = set(stats.row_hash_log.tolist())
+            source = tuple(int(v) for v in data['source'])
+            stats.source = source if source != (-1, -1) else None
+        return stats
+
+
+def source_signature(path):
+    """Modification time and size of a source file, None without one."""
+    if not path or not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def update_quality_stats(df, stats_path=None, source=None, rebuild=False):
+    """Quality stats for ``df``, reusing and extending a saved store if given.
+
+    ``source`` is the file ``df`` was read from. While its modification time
+    and size match the store, the store is current. Otherwise only rows past
+    the stored row count are processed, provided the rows before them are
+    unchanged (checked on a sample of them); a source that was edited in
+    place or replaced rebuilds it. ``rebuild`` discards the saved store and
+    rescans every row.
+    """
+    signature = source_signature(source)
+    stats = None
+    if stats_path and os.path.exists(stats_path) and not rebuild:
+        try:
+            stats = QualityStats.load(stats_path)
+        except (KeyError, ValueError, OSError):
+            stats = None  # Written by an older version or unreadable
+        if stats is not None and (signature is None or signature != stats.source):
+            if not stats.matches_prefix(df):
+                stats = None
+    if stats is None:
+        stats = QualityStats()
+
+    stats.update(df.iloc[stats.rows:])
+    stats.source = signature
+    if stats_path:
+        stats.save(stats_path)
+    return stats
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Regular Time-Grid Index
+Maps 10-minute SCADA timestamps onto a regular grid of slots to find
+missing, duplicated and out-of-order samples in one vectorised pass.
+
+Slots are counted from the Unix epoch, ``round(t / step)``, so a slot
+number is found in O(1) without a lookup table. Timestamps are parsed and
+numbered exactly like backend/time_grid.py (tests check the two agree), so
+a slot found here identifies the same 10 minutes in the backend's sequence
+buffers.
+"""
+
+import numpy as np
+import pandas as pd
+
+SLOT_SECONDS = 600
+NAT = np.iinfo(np.int64).min
+
+
+def to_epoch_ns(timestamps):
+    """Nanoseconds since the epoch (UTC) as int64; unparseable values become NaT."""
+    timestamps = pd.Series(timestamps)
+    if pd.api.types.is_numeric_dtype(timestamps):
+        parsed = pd.to_datetime(timestamps, utc=True, errors='coerce', unit='ns')
+    else:
+        # Parsed per value, so mixed ISO 8601 variants all parse
+        parsed = pd.to_datetime(timestamps, utc=True, errors='coerce', format='ISO8601')
+    return parsed.dt.tz_localize(None).to_numpy(dtype='datetime64[ns]').astype(np.int64)
+
+
+def slot_numbers(timestamps, step_seconds=SLOT_SECONDS):
+    """Epoch slot number of every timestamp, -1 where the timestamp is missing."""
+    ns = to_epoch_ns(timestamps)
+    step_ns = step_seconds * 1_000_000_000
+    return np.where(ns == NAT, -1, (ns + step_ns // 2) // step_ns)
+
+
+class TimeGrid:
+    """Index from every expected slot of a dataset to its row.
+
+    ``slot_to_row[i]`` is the first row whose timestamp falls in slot
+    ``first_slot + i``, or -1 when the slot has no data. Missing runs are
+    exposed as ``gap_starts``/``gap_lengths`` (grid offsets and slot counts).
+    """
+
+    def __init__(self, timestamps, step_seconds=SLOT_SECONDS):
+        self.step_seconds = step_seconds
+        slots = slot_numbers(timestamps, step_seconds)
+        rows = np.flatnonzero(slots >= 0)
+        slots = slots[rows]
+
+        self.first_slot = int(slots.min()) if len(slots) else 0
+        n_slots = int(slots.max()) - self.first_slot + 1 if len(slots) else 0
+        offsets = slots - self.first_slot
+
+        # Assign in reverse so the first row of a duplicated slot wins
+        self.slot_to_row = np.full(n_slots, -1, dtype=np.int64)
+        self.slot_to_row[offsets[::-1]] = rows[::-1]
+        self.duplicate_rows = len(rows) - int((self.slot_to_row >= 0).sum())
+        self.out_of_order_rows = int((np.diff(slots) < 0).sum())
+
+        missing = np.concatenate(([False], self.slot_to_row < 0, [False]))
+        edges = np.flatnonzero(np.diff(missing.astype(np.int8)))
+        self.gap_starts = edges[::2]
+        self.gap_lengths = edges[1::2] - edges[::2]
+
+    def __len__(self):
+        return len(self.slot_to_row)
+
+    @property
+    def present_slots(self):
+        return len(self) - int(self.gap_lengths.sum())
+
+    @property
+    def coverage(self):
+        return self.present_slots / len(self) if len(self) else 0.0
+
+    def offset_of(self, timestamp):
+        """Grid offset of a timestamp (may fall outside the grid)."""
+        return int(slot_numbers([timestamp], self.step_seconds)[0]) - self.first_slot
+
+    def row_at(self, offset):
+        """Row at a grid offset, or -1 when the slot is missing or off the grid."""
+        if 0 <= offset < len(self.slot_to_row):
+            return int(self.slot_to_row[offset])
+        return -1
+
+    def timestamps(self, offsets=None):
+        """datetime64 start of the given grid offsets (all slots by default)."""
+        if offsets is None:
+            offsets = np.arange(len(self))
+        slots = self.first_slot + np.asarray(offsets, dtype=np.int64)
+        return (slots * self.step_seconds).astype('datetime64[s]').astype('datetime64[ns]')
+
+    def gap_intervals(self):
+        """Start and end timestamps of every gap; the end is the next present slot."""
+        return self.timestamps(self.gap_starts), self.timestamps(self.gap_starts + self.gap_lengths)
+
+    def reindex(self, values, fill_value=np.nan):
+        """Place row-aligned values onto the regular grid, ``fill_value`` in gaps."""
+        values = np.asarray(values)
+        present = self.slot_to_row >= 0
+        dtype = np.result_type(values.dtype, np.asarray(fill_value).dtype)
+        out = np.full((len(self),) + values.shape[1:], fill_value, dtype=dtype)
+        out[present] = values[self.slot_to_row[present]]
+        return out
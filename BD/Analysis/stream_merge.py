@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Streaming Telemetry Merge
+Outer-joins the per-file Parquet caches on PCTimeStamp without loading any
+file fully into memory.
+
+Every cached file is read in time-ordered chunks. At each step the rows
+older than the smallest "last buffered timestamp" among the files still
+being read are complete in every file, so they are joined and appended to
+the output; the file that limits progress reads its next chunk. Peak memory
+is therefore bounded by the chunk size times the number of files, not by
+the size of the dataset.
+"""
+
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from excel_cache import ensure_cached
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+KEY = 'PCTimeStamp'
+DUPLICATE_SUFFIXES = ('_x', '_y')
+
+
+def output_columns(schemas, key=KEY):
+    """Rename columns that occur in several files, like pandas merge suffixes.
+
+    Returns one ``{old: new}`` mapping per file and the merged Arrow schema.
+    """
+    owners = {}
+    for schema in schemas:
+        for name in schema.names:
+            if name != key:
+                owners[name] = owners.get(name, 0) + 1
+
+    seen = {}
+    renames, fields = [], [pa.field(key, pa.timestamp('ns'))]
+    for schema in schemas:
+        rename = {}
+        for field in schema:
+            if field.name == key:
+                continue
+            new_name = field.name
+            if owners[field.name] > 1:
+                k = seen.get(field.name, 0)
+                seen[field.name] = k + 1
+                suffix = DUPLICATE_SUFFIXES[k] if k < len(DUPLICATE_SUFFIXES) else f'_{k + 1}'
+                new_name = f'{field.name}{suffix}'
+            rename[field.name] = new_name
+            fields.append(pa.field(new_name, field.type))
+        renames.append(rename)
+    return renames, pa.schema(fields)
+
+
+class _Source:
+    """Time-ordered chunk reader over one cached file."""
+
+    def __init__(self, path, rename, chunk_rows, key=KEY):
+        self.path = path
+        self.rename = rename
+        self.key = key
+        self._batches = pq.ParquetFile(path).iter_batches(batch_size=chunk_rows)
+        self.buffer = None
+        self.exhausted = False
+        self._last_key = None
+
+    def read_next(self):
+        """Append the next non-empty chunk to the buffer."""
+        for batch in self._batches:
+            if batch.num_rows == 0:
+                continue
+            df = batch.to_pandas().rename(columns=self.rename)
+            df[self.key] = pd.to_datetime(df[self.key])
+            df = df.set_index(self.key)
+            if not df.index.is_monotonic_increasing or (
+                    self._last_key is not None and df.index[0] < self._last_key):
+                raise ValueError(f"{self.path} is not sorted by {self.key}")
+            self._last_key = df.index[-1]
+            self.buffer = df if self.buffer is None or self.buffer.empty else pd.concat([self.buffer, df])
+            return
+        self.exhausted = True
+
+    def last_buffered(self):
+        return self.buffer.index[-1]
+
+    def take_before(self, watermark=None):
+        """Remove and return buffered rows older than ``watermark`` (all if None)."""
+        if self.buffer is None or self.buffer.empty:
+            return None
+        if watermark is None:
+            part, self.buffer = self.buffer, self.buffer.iloc[:0]
+        else:
+            pos = self.buffer.index.searchsorted(watermark, side='left')
+            part, self.buffer = self.buffer.iloc[:pos], self.buffer.iloc[pos:]
+        # Duplicate timestamps within a file keep their first row
+        return part[~part.index.duplicated(keep='first')]
+
+
+def merge_streaming(parquet_paths, output_path, chunk_rows=50_000, key=KEY):
+    """Outer-join cached files on ``key`` and write the result incrementally."""
+    if pq is None:
+        raise ImportError("pyarrow is required for the streaming merge")
+
+    schemas = [pq.read_schema(path) for path in parquet_paths]
+    renames, schema = output_columns(schemas, key)
+    sources = [_Source(path, rename, chunk_rows, key)
+               for path, rename in zip(parquet_paths, renames)]
+    for source in sources:
+        source.read_next()
+
+    rows_written = 0
+    tmp_path = f"{output_path}.tmp{os.getpid()}"
+    with pq.ParquetWriter(tmp_path, schema) as writer:
+        while True:
+            reading = [s for s in sources if not s.exhausted]
+            watermark = min((s.last_buffered() for s in reading), default=None)
+
+            parts = [s.take_before(watermark) for s in sources]
+            parts = [p for p in parts if p is not None and not p.empty]
+            if parts:
+                merged = pd.concat(parts, axis=1, join='outer', sort=True)
+                merged.index.name = key
+                merged = merged.reset_index().reindex(columns=schema.names)
+                writer.write_table(pa.Table.from_pandas(merged, schema=schema, preserve_index=False))
+                rows_written += len(merged)
+
+            if not reading:
+                break
+            # Only the files holding back the watermark need more data
+            for source in reading:
+                if source.last_buffered() == watermark:
+                    source.read_next()
+    os.replace(tmp_path, output_path)
+
+    return {'rows': rows_written, 'columns': len(schema.names), 'output': output_path}
+
+
+def main():
+    """Merge every workbook in the current directory through the cache."""
+    parser = argparse.ArgumentParser(description="Stream-merge the telemetry workbooks on PCTimeStamp.")
+    parser.add_argument('--output', default='merged_telemetry.parquet')
+    parser.add_argument('--chunk-rows', type=int, default=50_000)
+    args = parser.parse_args()
+
+    excel_files = sorted(f for f in os.listdir('.') if f.endswith('.xlsx'))
+    print(f"Merging {len(excel_files)} files on {KEY} (chunks of {args.chunk_rows:,} rows)")
+
+    start = time.perf_counter()
+    result = merge_streaming([ensure_cached(f) for f in excel_files], args.output, args.chunk_rows)
+    print(f"Wrote {result['rows']:,} rows × {result['columns']:,} columns to {result['output']} "
+          f"in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from quality_store import QualityStats, update_quality_stats
+
+
+def _frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'PCTimeStamp': pd.date_range('2024-01-01', periods=rows, freq='10min').astype(str),
+        'temp': rng.normal(40, 5, rows).round(1),
+        'power': rng.normal(1500, 300, rows).round(0),
+    })
+    df.loc[rng.random(rows) < 0.1, 'temp'] = np.nan
+    df.iloc[5] = df.iloc[4]  # One duplicate row
+    return df
+
+
+def _write_source(path, df, mtime_ns):
+    df.to_csv(path, index=False)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return str(path)
+
+
+def _assert_matches_full_scan(stats, df):
+    full = QualityStats().update(df)
+    assert stats.report() == full.report()
+    pd.testing.assert_frame_equal(stats.missing_summary(), full.missing_summary())
+    pd.testing.assert_frame_equal(stats.numeric_summary(), full.numeric_summary())
+
+
+def test_numeric_summary_matches_pandas():
+    df = _frame(200)
+    summary = QualityStats().update(df.iloc[:70]).update(df.iloc[70:]).numeric_summary()
+    expected = df[['temp', 'power']].agg(['count', 'mean', 'std', 'min', 'max']).T
+    np.testing.assert_allclose(summary.to_numpy(dtype=float), expected.to_numpy(dtype=float))
+
+
+def test_appended_rows_are_folded_in(tmp_path):
+    stats_path = str(tmp_path / 'stats.npz')
+    df = _frame(300)
+    source = _write_source(tmp_path / 'source.csv', df.iloc[:200], 1_000_000_000)
+    update_quality_stats(df.iloc[:200], stats_path, source)
+
+    _write_source(tmp_path / 'source.csv', df, 2_000_000_000)
+    stats = update_quality_stats(df, stats_path, source)
+    _assert_matches_full_scan(stats, df)
+
+
+def test_unchanged_source_reuses_the_store(tmp_path):
+    stats_path = str(tmp_path / 'stats.npz')
+    df = _frame(100)
+    source = _write_source(tmp_path / 'source.csv', df, 1_000_000_000)
+    update_quality_stats(df, stats_path, source)
+
+    stats = QualityStats.load(stats_path)
+    assert stats.source == (1_000_000_000, os.path.getsize(source))
+    assert update_quality_stats(df, stats_path, source).report() == stats.report()
+
+
+def test_source_edited_in_place_rebuilds(tmp_path):
+    stats_path = str(tmp_path / 'stats.npz')
+    df = _frame(100)
+    source = _write_source(tmp_path / 'source.csv', df, 1_000_000_000)
+    update_quality_stats(df, stats_path, source)
+
+    # Same row count, different values and one more duplicate
+    edited = df.copy()
+    edited.loc[:40, 'temp'] = np.nan
+    edited.iloc[60] = edited.iloc[59]
+    _write_source(tmp_path / 'source.csv', edited, 2_000_000_000)
+    stats = update_quality_stats(edited, stats_path, source)
+    _assert_matches_full_scan(stats, edited)
+
+    # Edited and extended
+    extended = pd.concat([_frame(120, seed=1), df.iloc[:10]], ignore_index=True)
+    _write_source(tmp_path / 'source.csv', extended, 3_000_000_000)
+    stats = update_quality_stats(extended, stats_path, source)
+    _assert_matches_full_scan(stats, extended)
+
+
+def test_prefix_check_hashes_a_sample(tmp_path, monkeypatch):
+    stats_path = str(tmp_path / 'stats.npz')
+    df = _frame(5000)
+    source = _write_source(tmp_path / 'source.csv', df.iloc[:4000], 1_000_000_000)
+    update_quality_stats(df.iloc[:4000], stats_path, source)
+
+    hashed = []
+    original = QualityStats._hash_rows
+    monkeypatch.setattr(QualityStats, '_hash_rows', lambda self, rows: hashed.append(len(rows)) or original(self, rows))
+    _write_source(tmp_path / 'source.csv', df, 2_000_000_000)
+    stats = update_quality_stats(df, stats_path, source)
+
+    assert hashed == [64, 1000]  # The sampled check, then the appended rows
+    _assert_matches_full_scan(stats, df)
+
+
+def test_explicit_rebuild_rescans(tmp_path):
+    stats_path = str(tmp_path / 'stats.npz')
+    df = _frame(1000)
+    source = _write_source(tmp_path / 'source.csv', df, 1_000_000_000)
+    update_quality_stats(df, stats_path, source)
+
+    # An edit between the sampled rows, with the size and mtime unchanged
+    edited = df.copy()
+    edited.loc[501, 'power'] = -1.0
+    assert update_quality_stats(edited, stats_path, source).report() == QualityStats.load(stats_path).report()
+    stats = update_quality_stats(edited, stats_path, source, rebuild=True)
+    _assert_matches_full_scan(stats, edited)
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+from slot_grid import TimeGrid, slot_numbers
+
+
+def test_slot_numbers_round_to_the_nearest_slot():
+    timestamps = pd.to_datetime(['1970-01-01 00:04:59', '1970-01-01 00:05:00', None, '2024-01-01'], format='ISO8601')
+    np.testing.assert_array_equal(slot_numbers(timestamps), [0, 1, -1, 1_704_067_200 // 600])
+
+
+def test_gaps_duplicates_and_order():
+    timestamps = pd.to_datetime([
+        '2024-01-01 00:00', '2024-01-01 00:10', '2024-01-01 00:10:30',  # Duplicate slot
+        '2024-01-01 00:50', '2024-01-01 00:40',                           # Out of order
+        None, '2024-01-01 01:30',
+    ], format='ISO8601')
+    grid = TimeGrid(timestamps)
+
+    assert len(grid) == 10
+    np.testing.assert_array_equal(grid.slot_to_row, [0, 1, -1, -1, 4, 3, -1, -1, -1, 6])
+    assert grid.duplicate_rows == 1
+    assert grid.out_of_order_rows == 1
+    np.testing.assert_array_equal(grid.gap_starts, [2, 6])
+    np.testing.assert_array_equal(grid.gap_lengths, [2, 3])
+    assert grid.present_slots == 5
+    assert grid.coverage == 0.5
+
+    start, end = grid.gap_intervals()
+    np.testing.assert_array_equal(start, pd.to_datetime(['2024-01-01 00:20', '2024-01-01 01:00']).to_numpy())
+    np.testing.assert_array_equal(end, pd.to_datetime(['2024-01-01 00:40', '2024-01-01 01:30']).to_numpy())
+
+
+def test_empty_grid():
+    grid = TimeGrid(pd.Series([], dtype='datetime64[ns]'))
+    assert len(grid) == 0
+    assert grid.coverage == 0.0
+    assert len(grid.gap_starts) == 0
+
+
+def test_mixed_iso_strings_parse():
+    timestamps = ['2024-01-01 00:00:00', '2024-01-01 00:10:00.5', '2024-01-01T00:20:00Z', 'bad', None]
+    first = 1_704_067_200 // 600
+    np.testing.assert_array_equal(slot_numbers(timestamps), [first, first + 1, first + 2, -1, -1])
+
+
+def test_slot_numbers_agree_with_the_backend():
+    import time_grid
+
+    timestamps = ['2024-01-01 00:00:00', '2024-01-01T00:10:00.5', '2024-01-01T02:24:59+02:00', None]
+    np.testing.assert_array_equal(slot_numbers(timestamps), time_grid.slot_numbers(timestamps))
+    parsed = pd.to_datetime(['2024-03-01 12:04:59', '2024-03-01 12:05:00'])
+    np.testing.assert_array_equal(slot_numbers(parsed), time_grid.slot_numbers(parsed))
+
+
+def test_lookup_and_reindex():
+    timestamps = pd.to_datetime(['2024-01-01 00:00', '2024-01-01 00:10', '2024-01-01 00:40'])
+    grid = TimeGrid(timestamps)
+
+    assert grid.offset_of('2024-01-01 00:41') == 4
+    assert grid.offset_of(pd.Timestamp('2023-12-31 23:50')) == -1
+    assert [grid.row_at(offset) for offset in (-1, 0, 1, 2, 4, 5)] == [-1, 0, 1, -1, 2, -1]
+
+    values = np.array([[1.0, 10.0], [2.0, 20.0], [3.0, 30.0]])
+    np.testing.assert_array_equal(
+        grid.reindex(values),
+        [[1, 10], [2, 20], [np.nan, np.nan], [np.nan, np.nan], [3, 30]]
+    )
+    np.testing.assert_array_equal(grid.reindex(np.arange(3), fill_value=-1), [0, 1, -1, -1, 2])
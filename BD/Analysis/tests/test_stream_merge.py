@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from stream_merge import KEY, merge_streaming
+
+
+def _write(path, timestamps, **columns):
+    df = pd.DataFrame({KEY: pd.to_datetime(timestamps), **columns})
+    df.to_parquet(path, index=False)
+    return str(path)
+
+
+def _reference(paths):
+    """Outer join of the files with pandas, renaming shared columns like the merge."""
+    frames = [pd.read_parquet(path) for path in paths]
+    counts = pd.Series([c for df in frames for c in df.columns if c != KEY]).value_counts()
+    seen = {}
+    renamed = []
+    for df in frames:
+        rename = {}
+        for column in df.columns:
+            if column != KEY and counts[column] > 1:
+                k = seen.get(column, 0)
+                seen[column] = k + 1
+                rename[column] = f"{column}{('_x', '_y')[k] if k < 2 else f'_{k + 1}'}"
+        df = df.rename(columns=rename).drop_duplicates(KEY, keep='first').set_index(KEY)
+        renamed.append(df)
+    merged = pd.concat(renamed, axis=1, join='outer', sort=True)
+    merged.index.name = KEY
+    return merged.reset_index()
+
+
+@pytest.fixture
+def sources(tmp_path):
+    rng = np.random.default_rng(0)
+    base = pd.date_range('2024-01-01', periods=60, freq='10min')
+    # Interleaved coverage, a duplicate timestamp and a column shared by all files
+    a = base[::2].append(base[[10]]).sort_values()
+    b = base[5:45]
+    c = base[30:]
+    return [
+        _write(tmp_path / 'a.parquet', a, temp=rng.normal(size=len(a)), shared=rng.normal(size=len(a))),
+        _write(tmp_path / 'b.parquet', b, power=rng.normal(size=len(b)), shared=rng.normal(size=len(b))),
+        _write(tmp_path / 'c.parquet', c, pitch=rng.normal(size=len(c)), shared=rng.normal(size=len(c))),
+    ]
+
+
+@pytest.mark.parametrize('chunk_rows', [1, 3, 7, 1000])
+def test_matches_pandas_outer_join(sources, tmp_path, chunk_rows):
+    output = str(tmp_path / 'merged.parquet')
+    result = merge_streaming(sources, output, chunk_rows=chunk_rows)
+
+    merged = pd.read_parquet(output)
+    expected = _reference(sources)
+    assert result['rows'] == len(expected) == len(merged)
+    assert list(merged.columns) == [KEY, 'temp', 'shared_x', 'power', 'shared_y', 'pitch', 'shared_3']
+    pd.testing.assert_frame_equal(merged, expected[merged.columns], check_dtype=False)
+
+
+def test_rejects_unsorted_input(tmp_path):
+    times = pd.date_range('2024-01-01', periods=10, freq='10min')[::-1]
+    path = _write(tmp_path / 'unsorted.parquet', times, temp=np.arange(10.0))
+    with pytest.raises(ValueError, match='not sorted'):
+        merge_streaming([path], str(tmp_path / 'out.parquet'), chunk_rows=4)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Random Forest prediction path.
+
+Compares the old two-pass path (predict_proba followed by predict) with the
+single-pass forest_predict used by the API, and checks both give identical
+outputs. Also times the CompiledForest engine (FOREST_ENGINE=compiled) and
+checks it matches predict_proba to floating-point tolerance. Uses the trained
+forest when it is available, otherwise a forest of the same shape
+(10 features, 100 trees) fitted on synthetic data.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import joblib
+import numpy as np
+
+
+def load_or_build_forest(model_path, n_trees, n_features):
+    """Load the trained forest, or fit a synthetic one of the same shape"""
+    if os.path.exists(model_path):
+        print(f"Using trained model: {model_path}")
+        return joblib.load(model_path)
+
+    from sklearn.ensemble import RandomForestClassifier
+
+    print(f"Model not found at {model_path}, fitting a synthetic forest "
+          f"({n_trees} trees, {n_features} features)")
+    rng = np.random.default_rng(42)
+    X = rng.normal(size=(20000, n_features))
+    y = (X[:, 0] + 0.5 * rng.normal(size=len(X)) > 0.9).astype(int)
+    model = RandomForestClassifier(n_estimators=n_trees, random_state=42, n_jobs=1)
+    return model.fit(X, y)
+
+
+def two_pass(model, X):
+    """Previous prediction path: the forest is traversed twice"""
+    return model.predict_proba(X)[:, 1], model.predict(X)
+
+
+def time_per_call(fn, model, X, repeats):
+    fn(model, X)  # Warm up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn(model, X)
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", help="defaults to random_forest_model.pkl in MODEL_DIR")
+    parser.add_argument("--trees", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from main import MODEL_DIR, forest_predict
+    from forest_engine import CompiledForest
+
+    model_path = args.model or os.path.join(MODEL_DIR, "random_forest_model.pkl")
+    n_features = 10
+    model = load_or_build_forest(model_path, args.trees, n_features)
+    n_features = getattr(model, "n_features_in_", n_features)
+    print(f"Forest: {len(model.estimators_)} trees, {n_features} features")
+    compiled = CompiledForest.from_sklearn(model)
+
+    rng = np.random.default_rng(0)
+    print(f"\n{'batch':>7} {'two-pass (ms)':>15} {'single-pass (ms)':>18} {'speedup':>9} "
+          f"{'compiled (ms)':>15}")
+    for batch_size in (1, 100, 1000):
+        X = rng.normal(size=(batch_size, n_features))
+
+        old_probs, old_preds = two_pass(model, X)
+        new_probs, new_preds = forest_predict(model, X)
+        assert np.array_equal(old_probs, new_probs), "probabilities differ"
+        assert np.array_equal(old_preds, new_preds), "predicted classes differ"
+        compiled_probs, _ = forest_predict(compiled, X)
+        assert np.allclose(old_probs, compiled_probs), "compiled forest differs"
+
+        repeats = max(5, args.repeats // batch_size)
+        old_time = time_per_call(two_pass, model, X, repeats)
+        new_time = time_per_call(forest_predict, model, X, repeats)
+        compiled_time = time_per_call(forest_predict, compiled, X, repeats)
+        print(f"{batch_size:>7} {old_time * 1000:>15.3f} {new_time * 1000:>18.3f} "
+              f"{old_time / new_time:>8.2f}x {compiled_time * 1000:>15.3f}")
+
+    print("\n✅ Outputs identical for all batch sizes")
+
+
+if __name__ == "__main__":
+    main()
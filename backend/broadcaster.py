@@ -0,0 +1,105 @@
+"""
+Shared producer that pushes changed payloads to streaming subscribers.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class Subscription:
+    """Latest payload per event name, waiting to be sent to one client.
+
+    A slow client never builds a backlog: a newer payload for the same
+    event replaces the one it has not received yet.
+    """
+
+    def __init__(self):
+        self._pending: Dict[str, Any] = {}
+        self._ready = asyncio.Event()
+
+    def put(self, name: str, payload: Any):
+        self._pending[name] = payload
+        self._ready.set()
+
+    async def get(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Pending payloads by event name; empty if ``timeout`` passes first"""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return {}
+        self._ready.clear()
+        pending, self._pending = self._pending, {}
+        return pending
+
+
+class Broadcaster:
+    """Poll payload producers once for all subscribers and fan out changes.
+
+    ``producers`` maps an event name to an async callable returning a
+    payload with an ``etag``. The producer task only runs while someone is
+    subscribed. It checks every ``interval_seconds``, or sooner after
+    ``notify()``, and pushes a payload only when its ETag changed.
+    """
+
+    def __init__(self, producers: Dict[str, Callable[[], Awaitable[Any]]],
+                 interval_seconds: float):
+        self.producers = producers
+        self.interval_seconds = interval_seconds
+        self._subscribers = set()
+        self._latest: Dict[str, Any] = {}
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def notify(self):
+        """Check the producers now instead of at the next interval"""
+        self._wake.set()
+
+    @asynccontextmanager
+    async def subscribe(self):
+        subscription = Subscription()
+        # New clients start from the latest known state
+        for name, payload in self._latest.items():
+            subscription.put(name, payload)
+        self._subscribers.add(subscription)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        try:
+            yield subscription
+        finally:
+            self._subscribers.discard(subscription)
+            if not self._subscribers and self._task is not None:
+                self._task.cancel()
+                self._task = None
+
+    async def _poll(self):
+        for name, producer in self.producers.items():
+            try:
+                payload = await producer()
+            except Exception as e:
+                print(f"Error producing {name} stream update: {e}")
+                continue
+            previous = self._latest.get(name)
+            if previous is not None and previous.etag == payload.etag:
+                continue
+            self._latest[name] = payload
+            for subscription in self._subscribers:
+                subscription.put(name, payload)
+
+    async def _run(self):
+        while True:
+            self._wake.clear()
+            await self._poll()
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
@@ -0,0 +1,114 @@
+"""
+Bounded executor that keeps blocking model inference off the event loop.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class InferenceOverloaded(Exception):
+    """Raised when the inference queue is full and a request is rejected"""
+
+
+def _timed_call(fn: Callable, args: tuple):
+    """Run ``fn`` in the worker and report when it actually started"""
+    started = time.monotonic()
+    result = fn(*args)
+    return result, started, time.monotonic()
+
+
+class InferenceExecutor:
+    """Thread or process pool with a bounded backlog and wait-time metrics.
+
+    At most ``max_workers + max_queue`` jobs are in flight at once; anything
+    beyond that fails fast with ``InferenceOverloaded`` instead of queueing.
+    Process pools run ``initializer`` in every worker so each one preloads
+    the models before taking jobs.
+    """
+
+    def __init__(self, kind: str = "thread", max_workers: int = 4, max_queue: int = 32,
+                 initializer: Optional[Callable] = None):
+        if kind == "thread":
+            self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="inference")
+        elif kind == "process":
+            self._pool = ProcessPoolExecutor(max_workers=max_workers, initializer=initializer)
+        else:
+            raise ValueError(f"Unknown inference executor kind: {kind!r}")
+
+        self.kind = kind
+        self.max_workers = max_workers
+        self.capacity = max_workers + max_queue
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_run = 0.0
+
+    def _release(self, _future):
+        with self._lock:
+            self._in_flight -= 1
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """Run ``fn(*args)`` on the pool, or raise if the backlog is full"""
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._rejected += 1
+                raise InferenceOverloaded(
+                    f"Inference queue full ({self._in_flight}/{self.capacity} jobs in flight)"
+                )
+            self._in_flight += 1
+            self._submitted += 1
+
+        submitted = time.monotonic()
+        try:
+            future = self._pool.submit(_timed_call, fn, args)
+        except BaseException:
+            self._release(None)
+            raise
+        # Release the slot when the job really finishes, even if the caller
+        # stops waiting for it
+        future.add_done_callback(self._release)
+
+        try:
+            result, started, finished = await asyncio.wrap_future(future)
+        except Exception:
+            with self._lock:
+                self._failed += 1
+            raise
+
+        wait = max(0.0, started - submitted)
+        with self._lock:
+            self._completed += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            self._total_run += finished - started
+        return result
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of queue depth and wait/run times"""
+        with self._lock:
+            completed = self._completed
+            return {
+                "executor": self.kind,
+                "workers": self.max_workers,
+                "capacity": self.capacity,
+                "in_flight": self._in_flight,
+                "queue_depth": max(0, self._in_flight - self.max_workers),
+                "submitted": self._submitted,
+                "completed": completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "avg_wait_ms": 1000 * self._total_wait / completed if completed else 0.0,
+                "max_wait_ms": 1000 * self._max_wait,
+                "avg_run_ms": 1000 * self._total_run / completed if completed else 0.0,
+            }
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
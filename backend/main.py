@@ -1,16 +1,56 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, NamedTuple, Tuple
 import pandas as pd
 import numpy as np
 import joblib
-import tensorflow as tf
+# Imported up front: the loader threads unpickle sklearn objects concurrently,
+# and a first sklearn import from two threads at once can fail
+import sklearn.ensemble
+import sklearn.preprocessing
 import os
 from datetime import datetime, timedelta
 import json
 import random
-from fastapi.responses import JSONResponse
+import asyncio
+import time
+import threading
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+from fastapi.responses import JSONResponse, StreamingResponse
+from dotenv import load_dotenv
+from sequence_buffer import SequenceBuffer
+from inference_executor import InferenceExecutor, InferenceOverloaded
+from micro_batcher import MicroBatcher
+from forest_engine import load_compiled_forest
+from time_grid import slot_numbers, to_epoch_ns
+from telemetry_store import NS_PER_SECOND, TelemetryStore
+from telemetry_log import TelemetryLog
+from health_rules import BASE_RUL_HOURS, HealthEngine
+from power_lookup import ExpectedPowerTable
+from response_cache import ResponseCache
+from broadcaster import Broadcaster
+from telemetry_ingest import (
+    ARROW_CONTENT_TYPES, NDJSON_CONTENT_TYPES, ArrowStreamIngest, IngestError,
+    NdjsonParser, TelemetryChunk
+)
+
+# Settings can come from the environment or a .env file
+load_dotenv()
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+# Trained artifacts; the shipped ones live in BD/models
+MODEL_DIR = os.getenv("MODEL_DIR", os.path.join(BACKEND_DIR, "..", "BD", "models"))
+# Optional; without it the names the scaler was fitted on are used
+FEATURE_NAMES_PATH = os.getenv("FEATURE_NAMES_PATH", os.path.join(MODEL_DIR, "feature_names.json"))
+# Uncompressed compiled forest, memory-mapped so all workers on a host
+# share one page-cached copy of the node arrays
+COMPILED_FOREST_PATH = os.getenv(
+    "COMPILED_FOREST_PATH", os.path.join(MODEL_DIR, "random_forest_compiled.joblib")
+)
+# Binned power curves from BD/Analysis/power_curve.py
+POWER_CURVE_PATH = os.getenv("POWER_CURVE_PATH", os.path.join(MODEL_DIR, "power_curves.json"))
 
 app = FastAPI(
     title="Wind Turbine ML API",
@@ -47,8 +87,19 @@ class TurbineData(BaseModel):
     ambient_temp: float
     humidity: float
     wind_direction: float
+    turbine_id: Optional[str] = None
     timestamp: Optional[str] = None
 
+# Sensor channels of TurbineData, in the column order of telemetry matrices
+TURBINE_FIELDS = (
+    'wind_speed', 'power_output', 'rotor_rpm', 'nacelle_temp',
+    'gear_oil_temp', 'generator_temp', 'blade_pitch', 'yaw_angle',
+    'voltage_l1', 'voltage_l2', 'voltage_l3',
+    'current_l1', 'current_l2', 'current_l3',
+    'gear_oil_pressure', 'ambient_temp', 'humidity', 'wind_direction',
+)
+_read_turbine_fields = attrgetter(*TURBINE_FIELDS)
+
 class PredictionResponse(BaseModel):
     failure_probability: float
     failure_prediction: bool
@@ -58,6 +109,8 @@ class PredictionResponse(BaseModel):
     next_maintenance_date: str
     component_health: Dict[str, float]
     rul_estimates: Dict[str, int]
+    expected_power: Optional[float] = None
+    power_deviation: Optional[float] = None  # (actual - expected) / rated power
 
 class HealthScore(BaseModel):
     component: str
@@ -67,261 +120,612 @@ class HealthScore(BaseModel):
     next_maintenance: str
     risk_level: str
 
+# Number of leading feature columns the models were trained on
+MODEL_FEATURE_COUNT = 10
+
+# Sensor keyword in a model feature name -> TurbineData field that feeds it
+FEATURE_KEYWORDS = (
+    ('WindSpeed', 'wind_speed'),
+    ('Power', 'power_output'),
+    ('RPM', 'rotor_rpm'),
+    ('Temp', 'nacelle_temp'),
+    ('Voltage', 'voltage_l1'),
+)
+
+# Features used when no feature names are available
+DEFAULT_FEATURE_FIELDS = (
+    'wind_speed', 'power_output', 'rotor_rpm', 'nacelle_temp', 'gear_oil_temp',
+    'generator_temp', 'blade_pitch', 'yaw_angle', 'voltage_l1', 'voltage_l2',
+)
+
+class FeaturePlan(NamedTuple):
+    """Precompiled mapping from telemetry columns to model feature columns"""
+    indices: np.ndarray    # TURBINE_FIELDS index feeding each model column
+    zero_mask: np.ndarray  # Model columns with no matching field (filled with 0.0)
+    names: List[str]
+
+# Forest inference engine: "sklearn" (the pickled model) or "compiled"
+# (CompiledForest, memory-mapped from COMPILED_FOREST_PATH)
+FOREST_ENGINE = os.getenv("FOREST_ENGINE", "sklearn")
+
 # Global variables for models
-rf_model = None
+rf_model = None  # RandomForestClassifier or CompiledForest, per FOREST_ENGINE
 lstm_model = None
 scaler = None
 feature_names = None
+power_table = None  # ExpectedPowerTable, when power curves are available
 
-def load_models():
-    """Load the trained ML models"""
-    global rf_model, lstm_model, scaler, feature_names
+# Readiness of each artifact: "pending", "loading", "ready" or "failed"
+model_status = {
+    "random_forest": "pending",
+    "scaler": "pending",
+    "feature_names": "pending",
+    "lstm": "pending",
+    "power_curve": "pending",
+}
+# Optional artifacts do not count towards load_models() success
+OPTIONAL_ARTIFACTS = ("power_curve",)
+model_loading_task = None
+
+# LSTM sequence state: one rolling window of scaled features per turbine
+sequence_buffer = None
+lstm_task = None
+LSTM_TICK_SECONDS = float(os.getenv("LSTM_TICK_SECONDS", "1.0"))
+LSTM_DEFAULT_PROBABILITY = 0.15  # Used until a turbine has a full window
+# Missing 10-minute slots forward-filled before a turbine's window restarts
+LSTM_MAX_FILL_SLOTS = int(os.getenv("LSTM_MAX_FILL_SLOTS", "2"))
+# TensorFlow models are not safe to call concurrently, so one worker thread
+lstm_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lstm")
+
+# Executor for blocking sklearn inference ("thread" or "process")
+INFERENCE_EXECUTOR = os.getenv("INFERENCE_EXECUTOR", "thread")
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", "4"))
+INFERENCE_QUEUE_SIZE = int(os.getenv("INFERENCE_QUEUE_SIZE", "32"))
+inference_executor = None
+
+# Opt-in coalescing of concurrent /predict/failure calls into one model call
+MICRO_BATCH_ENABLED = os.getenv("MICRO_BATCH_ENABLED", "false").lower() in ("1", "true", "yes")
+MICRO_BATCH_MAX_SIZE = int(os.getenv("MICRO_BATCH_MAX_SIZE", "64"))
+MICRO_BATCH_MAX_WAIT_MS = float(os.getenv("MICRO_BATCH_MAX_WAIT_MS", "5"))
+failure_batcher = None
+
+# Dashboard payloads are computed once per TTL or new-data event and shared
+# by every poller
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "3"))
+response_cache = ResponseCache(RESPONSE_CACHE_TTL_SECONDS)
+
+# Server-sent events: one shared producer checks the cached payloads and
+# pushes them to every subscriber when their ETag changes
+STREAM_INTERVAL_SECONDS = float(os.getenv("STREAM_INTERVAL_SECONDS", "1.0"))
+STREAM_KEEPALIVE_SECONDS = float(os.getenv("STREAM_KEEPALIVE_SECONDS", "15"))
+prediction_stream = None
+
+# Rows parsed per chunk of an NDJSON upload
+INGEST_CHUNK_ROWS = int(os.getenv("INGEST_CHUNK_ROWS", "10000"))
+
+# Raw telemetry history: a fixed ring of 10-minute rows per turbine
+TELEMETRY_RETENTION_DAYS = float(os.getenv("TELEMETRY_RETENTION_DAYS", "7"))
+telemetry_store = TelemetryStore(len(TURBINE_FIELDS), retention_days=TELEMETRY_RETENTION_DAYS)
+
+# Append-only on-disk copy of recorded telemetry, replayed into the store
+# on startup; an empty TELEMETRY_LOG_DIR disables it
+TELEMETRY_LOG_DIR = os.getenv("TELEMETRY_LOG_DIR", os.path.join(BACKEND_DIR, "telemetry_log"))
+TELEMETRY_LOG_SEGMENT_ROWS = int(os.getenv("TELEMETRY_LOG_SEGMENT_ROWS", "500000"))
+telemetry_log = None
+# Live readings are recorded on one writer thread, in arrival order, so
+# log writes and segment rolls stay off the event loop
+telemetry_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="telemetry")
+# Held across the store and log appends so the log keeps the store's order
+telemetry_lock = threading.Lock()
+
+# Component health is scored on hourly means over this window of history
+HEALTH_WINDOW_HOURS = int(os.getenv("HEALTH_WINDOW_HOURS", "24"))
+HEALTH_TREND_THRESHOLD = 1.0  # Health points per day counted as a trend
+HEALTH_COMPONENT_NAMES = {
+    "gearbox": "Gearbox",
+    "generator": "Generator",
+    "blades": "Blade System",
+    "nacelle": "Nacelle",
+}
+# Component health rules applied to whole telemetry matrices at once
+health_engine = HealthEngine(TURBINE_FIELDS)
+
+def _load_random_forest(model_dir: str):
+    pickle_path = os.path.join(model_dir, "random_forest_model.pkl")
+    if FOREST_ENGINE == "compiled":
+        return load_compiled_forest(pickle_path, COMPILED_FOREST_PATH)
+    if FOREST_ENGINE == "sklearn":
+        return joblib.load(pickle_path)
+    raise ValueError(f"Unknown FOREST_ENGINE: {FOREST_ENGINE}")
+
+def _load_scaler(model_dir: str):
+    return joblib.load(os.path.join(model_dir, "scaler.pkl"))
+
+def _load_feature_names(model_dir: str):
+    if not os.path.exists(FEATURE_NAMES_PATH):
+        return None
+    with open(FEATURE_NAMES_PATH, "r") as f:
+        return json.load(f)
+
+def _load_lstm(model_dir: str):
+    # Imported here so the API can start answering before TensorFlow,
+    # by far the slowest import, has finished loading
+    import tensorflow as tf
+    return tf.keras.models.load_model(os.path.join(model_dir, "lstm_model.h5"))
+
+def _load_power_curve(model_dir: str):
+    return ExpectedPowerTable.from_file(POWER_CURVE_PATH)
+
+def _load_artifact(name: str, loader, model_dir: str):
+    """Run one loader and record its readiness in model_status"""
+    model_status[name] = "loading"
+    try:
+        artifact = loader(model_dir)
+    except Exception as e:
+        model_status[name] = "failed"
+        print(f"❌ Error loading {name}: {e}")
+        return None
+    model_status[name] = "ready"
+    return artifact
+
+def _publish_forest(forest, fitted_scaler, names) -> bool:
+    """Make the forest prediction path live once its artifacts are loaded"""
+    global rf_model, scaler, feature_names, feature_plan
+    
+    if not names and getattr(fitted_scaler, "feature_names_in_", None) is not None:
+        names = list(fitted_scaler.feature_names_in_)
+        print("ℹ️ No feature_names.json, using the scaler's feature names")
     
     try:
-        # Load models from the Data/models directory
-        model_path = "../Data/models/"
-        
-        # Load Random Forest model
-        rf_model = joblib.load(f"{model_path}random_forest_model.pkl")
-        
-        # Load LSTM model
-        lstm_model = tf.keras.models.load_model(f"{model_path}lstm_model.h5")
-        
-        # Load scaler
-        scaler = joblib.load(f"{model_path}scaler.pkl")
-        
-        # Load feature names
-        with open("../Data/preprocessed_data/feature_names.json", "r") as f:
-            feature_names = json.load(f)
-            
-        print("✅ All models loaded successfully")
-        return True
-        
+        # Compile the feature plan once instead of matching names per request
+        plan = compile_feature_plan(names)
+        validate_feature_plan(plan, fitted_scaler, forest)
     except Exception as e:
-        print(f"❌ Error loading models: {e}")
+        model_status["random_forest"] = "failed"
+        print(f"❌ Error preparing random forest: {e}")
+        return False
+    
+    # Scaler and plan go first so requests never see the forest without them
+    scaler = fitted_scaler
+    feature_names = names
+    feature_plan = plan
+    rf_model = forest
+    return forest is not None
+
+def _publish_lstm(model) -> bool:
+    """Make the LSTM path live and size the sequence buffers from its input"""
+    global lstm_model, sequence_buffer
+    
+    if model is None:
         return False
+    _, window, n_features = model.input_shape
+    sequence_buffer = SequenceBuffer(window, n_features, max_fill_gap=LSTM_MAX_FILL_SLOTS)
+    lstm_model = model
+    return True
+
+def load_models():
+    """Load the trained ML models concurrently"""
+    global power_table
+    
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="model-loader") as pool:
+        lstm_future = pool.submit(_load_artifact, "lstm", _load_lstm, MODEL_DIR)
+        rf_future = pool.submit(_load_artifact, "random_forest", _load_random_forest, MODEL_DIR)
+        scaler_future = pool.submit(_load_artifact, "scaler", _load_scaler, MODEL_DIR)
+        names_future = pool.submit(_load_artifact, "feature_names", _load_feature_names, MODEL_DIR)
+        curve_future = pool.submit(_load_artifact, "power_curve", _load_power_curve, MODEL_DIR)
+        
+        # The forest path goes live without waiting for TensorFlow
+        forest_ready = _publish_forest(
+            rf_future.result(), scaler_future.result(), names_future.result()
+        )
+        power_table = curve_future.result()
+        lstm_ready = _publish_lstm(lstm_future.result())
+    
+    success = forest_ready and lstm_ready and all(
+        status == "ready" for name, status in model_status.items()
+        if name not in OPTIONAL_ARTIFACTS
+    )
+    if success:
+        print("✅ All models loaded successfully")
+    return success
+
+def load_forest_models() -> bool:
+    """Load only the forest path; process-pool workers never run the LSTM"""
+    return _publish_forest(
+        _load_artifact("random_forest", _load_random_forest, MODEL_DIR),
+        _load_artifact("scaler", _load_scaler, MODEL_DIR),
+        _load_artifact("feature_names", _load_feature_names, MODEL_DIR)
+    )
+
+def compile_feature_plan(names: Optional[List[str]]) -> FeaturePlan:
+    """Compile model feature names into column indices of the telemetry matrix"""
+    if not names:
+        # Fallback: use basic features
+        indices = [TURBINE_FIELDS.index(field) for field in DEFAULT_FEATURE_FIELDS]
+        return FeaturePlan(
+            indices=np.array(indices, dtype=np.intp),
+            zero_mask=np.zeros(len(indices), dtype=bool),
+            names=list(DEFAULT_FEATURE_FIELDS)
+        )
+    
+    indices = []
+    zero_mask = []
+    for feature_name in names[:MODEL_FEATURE_COUNT]:
+        for keyword, field in FEATURE_KEYWORDS:
+            if keyword in feature_name:
+                indices.append(TURBINE_FIELDS.index(field))
+                zero_mask.append(False)
+                break
+        else:
+            indices.append(0)
+            zero_mask.append(True)  # Default value for missing features
+    
+    return FeaturePlan(
+        indices=np.array(indices, dtype=np.intp),
+        zero_mask=np.array(zero_mask, dtype=bool),
+        names=list(names[:MODEL_FEATURE_COUNT])
+    )
+
+def validate_feature_plan(plan: FeaturePlan, fitted_scaler, forest):
+    """Check a compiled feature plan against the loaded scaler and forest"""
+    for name, model in (("scaler", fitted_scaler), ("random forest", forest)):
+        expected = getattr(model, "n_features_in_", None)
+        if expected is not None and expected != len(plan.indices):
+            raise ValueError(
+                f"Feature plan has {len(plan.indices)} columns but the {name} expects {expected}"
+            )
+    
+    fitted_names = getattr(fitted_scaler, "feature_names_in_", None)
+    if fitted_names is not None and list(fitted_names) != plan.names:
+        raise ValueError("feature_names.json does not match the feature names the scaler was fitted on")
+    
+    for feature_name, unmapped in zip(plan.names, plan.zero_mask):
+        if unmapped:
+            print(f"⚠️ No TurbineData field for feature '{feature_name}', filling with 0.0")
+
+def telemetry_matrix(readings: List[TurbineData]) -> np.ndarray:
+    """Stack the sensor channels of many readings into an N x 18 matrix"""
+    matrix = np.empty((len(readings), len(TURBINE_FIELDS)), dtype=np.float64)
+    for i, data in enumerate(readings):
+        matrix[i] = _read_turbine_fields(data)
+    return matrix
+
+def features_from_matrix(matrix: np.ndarray) -> np.ndarray:
+    """Gather model features from a telemetry matrix using the compiled plan"""
+    plan = feature_plan
+    features = np.empty((matrix.shape[0], len(plan.indices)), dtype=np.float64)
+    np.take(matrix, plan.indices, axis=1, out=features)
+    if plan.zero_mask.any():
+        features[:, plan.zero_mask] = 0.0
+    return features
 
 def prepare_features(data: TurbineData) -> np.ndarray:
     """Prepare features for ML model prediction"""
-    # Create feature vector based on available data
-    features = []
-    
-    # Basic sensor features (matching the model's expected features)
-    feature_mapping = {
-        'wind_speed': data.wind_speed,
-        'power_output': data.power_output,
-        'rotor_rpm': data.rotor_rpm,
-        'nacelle_temp': data.nacelle_temp,
-        'gear_oil_temp': data.gear_oil_temp,
-        'generator_temp': data.generator_temp,
-        'blade_pitch': data.blade_pitch,
-        'yaw_angle': data.yaw_angle,
-        'voltage_l1': data.voltage_l1,
-        'voltage_l2': data.voltage_l2,
-        'voltage_l3': data.voltage_l3,
-        'current_l1': data.current_l1,
-        'current_l2': data.current_l2,
-        'current_l3': data.current_l3,
-        'gear_oil_pressure': data.gear_oil_pressure,
-        'ambient_temp': data.ambient_temp,
-        'humidity': data.humidity,
-        'wind_direction': data.wind_direction,
+    return prepare_features_batch([data])
+
+def prepare_features_batch(readings: List[TurbineData]) -> np.ndarray:
+    """Prepare a feature matrix with one row per reading"""
+    return features_from_matrix(telemetry_matrix(readings))
+
+# Plan used until load_models() compiles one from feature_names.json
+feature_plan = compile_feature_plan(None)
+
+def _fallback_prediction() -> Dict[str, Any]:
+    """Low-risk prediction used when the models cannot score a reading"""
+    return {
+        "failure_probability": 0.1,
+        "failure_prediction": False,
+        "confidence": 0.5,
+        "risk_level": "LOW",
+        "recommended_actions": ["Continue normal operations"],
+        "model_details": {
+            "random_forest_probability": 0.1,
+            "random_forest_prediction": False,
+            "lstm_probability": 0.1,
+            "ensemble_probability": 0.1
+        }
+    }
+
+def _build_prediction(data: TurbineData, rf_prob: float, rf_pred: Any,
+                      lstm_prob: float) -> Dict[str, Any]:
+    """Combine model probabilities for one reading into a prediction"""
+    # Ensemble prediction
+    ensemble_prob = (rf_prob + lstm_prob) / 2
+    ensemble_pred = ensemble_prob > 0.5
+    
+    # Determine risk level
+    if ensemble_prob > 0.7:
+        risk_level = "HIGH"
+    elif ensemble_prob > 0.4:
+        risk_level = "MEDIUM"
+    else:
+        risk_level = "LOW"
+    
+    # Generate recommendations
+    recommendations = []
+    if ensemble_prob > 0.5:
+        recommendations.append("Schedule immediate inspection")
+    if data.gear_oil_temp > 80:
+        recommendations.append("Check gearbox oil temperature")
+    if data.nacelle_temp > 70:
+        recommendations.append("Monitor nacelle temperature")
+    if data.rotor_rpm > 25:
+        recommendations.append("Check rotor speed parameters")
+    
+    if not recommendations:
+        recommendations.append("Continue normal operations")
+    
+    return {
+        "failure_probability": float(ensemble_prob),
+        "failure_prediction": bool(ensemble_pred),
+        "confidence": float(max(rf_prob, lstm_prob)),
+        "risk_level": risk_level,
+        "recommended_actions": recommendations,
+        "model_details": {
+            "random_forest_probability": float(rf_prob),
+            "random_forest_prediction": bool(rf_pred),
+            "lstm_probability": float(lstm_prob),
+            "ensemble_probability": float(ensemble_prob)
+        }
     }
+
+def forest_predict(model, features_scaled: np.ndarray):
+    """Failure probability and predicted class from a single pass over the trees"""
+    proba = model.predict_proba(features_scaled)
+    # Same rule as RandomForestClassifier.predict, which would walk every
+    # tree a second time to recompute these probabilities
+    preds = model.classes_.take(np.argmax(proba, axis=1), axis=0)
+    return proba[:, 1], preds  # Probability of failure
+
+def score_features(features: np.ndarray):
+    """Scale a feature matrix and score it with the Random Forest"""
+    # Scale features
+    if scaler:
+        features_scaled = scaler.transform(features)
+    else:
+        features_scaled = features
+    
+    # Random Forest prediction over the whole matrix
+    if rf_model is not None:
+        rf_probs, rf_preds = forest_predict(rf_model, features_scaled)
+    else:
+        rf_probs = np.full(len(features), 0.1)  # Default low probability
+        rf_preds = np.zeros(len(features), dtype=bool)
+    
+    return features_scaled, rf_probs, rf_preds
+
+def record_telemetry(turbine_ids: List[Optional[str]], timestamps: List[Optional[str]],
+                     matrix: np.ndarray, arrival_ns: Optional[int] = None) -> int:
+    """Append raw readings of identified turbines to the telemetry store
     
-    # Map to the expected feature names from the model
-    if feature_names:
-        for feature_name in feature_names[:10]:  # Use first 10 features as in the model
-            # Extract turbine number and sensor type
-            if 'WindSpeed' in feature_name:
-                features.append(data.wind_speed)
-            elif 'Power' in feature_name:
-                features.append(data.power_output)
-            elif 'RPM' in feature_name:
-                features.append(data.rotor_rpm)
-            elif 'Temp' in feature_name:
-                features.append(data.nacelle_temp)
-            elif 'Voltage' in feature_name:
-                features.append(data.voltage_l1)
-            else:
-                features.append(0.0)  # Default value for missing features
+    Readings without a usable timestamp are stored at ``arrival_ns``, one
+    nanosecond apart so none of them replaces another, or skipped when no
+    arrival time is given. Returns the number of readings skipped.
+    """
+    tracked = np.array([i for i, turbine_id in enumerate(turbine_ids) if turbine_id], dtype=np.intp)
+    if len(tracked) == 0:
+        return 0
+    ns = to_epoch_ns([timestamps[i] for i in tracked])
+    untimed = ns == np.iinfo(np.int64).min
+    skipped = 0
+    if untimed.any():
+        if arrival_ns is not None:
+            ns[untimed] = arrival_ns + np.arange(int(untimed.sum()))
         else:
-            # Fallback: use basic features
-            features = [
-                data.wind_speed, data.power_output, data.rotor_rpm,
-                data.nacelle_temp, data.gear_oil_temp, data.generator_temp,
-                data.blade_pitch, data.yaw_angle, data.voltage_l1, data.voltage_l2
-            ]
+            skipped = int(untimed.sum())
+            tracked, ns = tracked[~untimed], ns[~untimed]
+    ids = [turbine_ids[i] for i in tracked]
+    with telemetry_lock:
+        stored = telemetry_store.append_many(ids, ns, matrix[tracked])
+        # Only rows the store kept are logged, so a replay rebuilds the same store
+        if telemetry_log is not None and stored.any():
+            telemetry_log.append([ids[i] for i in np.flatnonzero(stored)], ns[stored], matrix[tracked[stored]])
+    return skipped
+
+def _report_telemetry_error(future):
+    if not future.cancelled() and future.exception() is not None:
+        print(f"⚠️ Recording telemetry failed: {future.exception()}")
+
+def open_telemetry_log():
+    """Open the on-disk telemetry log and replay its retained rows into the store"""
+    global telemetry_log
+    if not TELEMETRY_LOG_DIR:
+        return
+    retention_seconds = TELEMETRY_RETENTION_DAYS * 86400
+    try:
+        telemetry_log = TelemetryLog(
+            TELEMETRY_LOG_DIR,
+            TURBINE_FIELDS,
+            segment_rows=TELEMETRY_LOG_SEGMENT_ROWS,
+            retention_seconds=retention_seconds
+        )
+    except Exception as e:
+        print(f"⚠️ Telemetry log unavailable: {e}")
+        return
     
-    return np.array(features).reshape(1, -1)
+    last_ns = telemetry_log.last_timestamp()
+    if last_ns is None:
+        return
+    since_ns = last_ns - int(retention_seconds * NS_PER_SECOND)
+    retired = telemetry_log.compact(since_ns)
+    rows = sum(
+        int(telemetry_store.append_many(chunk.turbine_ids, chunk.timestamps, chunk.values).sum())
+        for chunk in telemetry_log.replay(since_ns)
+    )
+    print(f"✅ Replayed {rows} telemetry rows for {len(telemetry_store)} turbines"
+          f" ({retired} old segments retired)")
 
-def predict_failure(data: TurbineData) -> Dict[str, Any]:
-    """Predict failure probability using the trained models"""
+def warm_sequence_buffer() -> int:
+    """Rebuild each turbine's LSTM window from the telemetry store"""
+    if sequence_buffer is None:
+        return 0
+    warmed = 0
+    for turbine_id in telemetry_store.turbines:
+        timestamps, values = telemetry_store.latest(turbine_id, sequence_buffer.window)
+        if len(timestamps) == 0:
+            continue
+        features = features_from_matrix(values.astype(np.float64))
+        features_scaled = scaler.transform(features) if scaler else features
+        sequence_buffer.push_many([turbine_id] * len(timestamps), features_scaled, slot_numbers(timestamps))
+        warmed += 1
+    return warmed
+
+def assemble_predictions(readings: List[TurbineData], features_scaled: np.ndarray,
+                         rf_probs: np.ndarray, rf_preds: np.ndarray) -> List[Dict[str, Any]]:
+    """Combine forest scores with the LSTM state into per-reading predictions"""
+    if any(data.turbine_id for data in readings):
+        telemetry_executor.submit(
+            record_telemetry,
+            [data.turbine_id for data in readings],
+            [data.timestamp for data in readings],
+            telemetry_matrix(readings),
+            arrival_ns=time.time_ns()
+        ).add_done_callback(_report_telemetry_error)
+    
+    # Feed identified turbines into their LSTM windows; the latest
+    # windowed score is picked up from the background tick
+    if sequence_buffer is not None:
+        tracked = [i for i, data in enumerate(readings) if data.turbine_id]
+        if tracked:
+            # Readings with a timestamp are placed on the 10-minute grid so
+            # duplicates, reordering and gaps are handled per turbine
+            slots = slot_numbers([readings[i].timestamp for i in tracked])
+            sequence_buffer.push_many(
+                [readings[i].turbine_id for i in tracked],
+                features_scaled[tracked],
+                slots
+            )
+        lstm_probs = [
+            sequence_buffer.score(data.turbine_id, LSTM_DEFAULT_PROBABILITY)
+            for data in readings
+        ]
+    else:
+        lstm_probs = [LSTM_DEFAULT_PROBABILITY] * len(readings)
+    
+    return [
+        _build_prediction(data, rf_prob, rf_pred, lstm_prob)
+        for data, rf_prob, rf_pred, lstm_prob in zip(readings, rf_probs, rf_preds, lstm_probs)
+    ]
+
+def predict_failure_batch(readings: List[TurbineData]) -> List[Dict[str, Any]]:
+    """Predict failure probability for many readings with one model call"""
     try:
-        # Prepare features
-        features = prepare_features(data)
-        
-        # Scale features
-        if scaler:
-            features_scaled = scaler.transform(features)
-        else:
-            features_scaled = features
-        
-        # Random Forest prediction
-        if rf_model:
-            rf_prob = rf_model.predict_proba(features_scaled)[0][1]  # Probability of failure
-            rf_pred = rf_model.predict(features_scaled)[0]
-        else:
-            rf_prob = 0.1  # Default low probability
-            rf_pred = False
-        
-        # LSTM prediction (simplified for now)
-        lstm_prob = 0.15  # Placeholder
-        lstm_pred = False
-        
-        # Ensemble prediction
-        ensemble_prob = (rf_prob + lstm_prob) / 2
-        ensemble_pred = ensemble_prob > 0.5
-        
-        # Determine risk level
-        if ensemble_prob > 0.7:
-            risk_level = "HIGH"
-        elif ensemble_prob > 0.4:
-            risk_level = "MEDIUM"
-        else:
-            risk_level = "LOW"
-        
-        # Generate recommendations
-        recommendations = []
-        if ensemble_prob > 0.5:
-            recommendations.append("Schedule immediate inspection")
-        if data.gear_oil_temp > 80:
-            recommendations.append("Check gearbox oil temperature")
-        if data.nacelle_temp > 70:
-            recommendations.append("Monitor nacelle temperature")
-        if data.rotor_rpm > 25:
-            recommendations.append("Check rotor speed parameters")
-        
-        if not recommendations:
-            recommendations.append("Continue normal operations")
-        
-        return {
-            "failure_probability": float(ensemble_prob),
-            "failure_prediction": bool(ensemble_pred),
-            "confidence": float(max(rf_prob, lstm_prob)),
-            "risk_level": risk_level,
-            "recommended_actions": recommendations,
-            "model_details": {
-                "random_forest_probability": float(rf_prob),
-                "lstm_probability": float(lstm_prob),
-                "ensemble_probability": float(ensemble_prob)
-            }
-        }
-        
+        features_scaled, rf_probs, rf_preds = score_features(prepare_features_batch(readings))
+        return assemble_predictions(readings, features_scaled, rf_probs, rf_preds)
     except Exception as e:
         print(f"Error in prediction: {e}")
-        return {
-            "failure_probability": 0.1,
-            "failure_prediction": False,
-            "confidence": 0.5,
-            "risk_level": "LOW",
-            "recommended_actions": ["Continue normal operations"],
-            "model_details": {
-                "random_forest_probability": 0.1,
-                "lstm_probability": 0.1,
-                "ensemble_probability": 0.1
-            }
-        }
+        return [_fallback_prediction() for _ in readings]
 
-def calculate_component_health(data: TurbineData) -> Dict[str, float]:
-    """Calculate health scores for different components"""
-    health_scores = {}
+async def predict_failure_batch_async(readings: List[TurbineData]) -> List[Dict[str, Any]]:
+    """Like predict_failure_batch, with model calls on the inference executor"""
+    try:
+        features = prepare_features_batch(readings)
+        features_scaled, rf_probs, rf_preds = await inference_executor.run(score_features, features)
+        return assemble_predictions(readings, features_scaled, rf_probs, rf_preds)
+    except InferenceOverloaded:
+        raise
+    except Exception as e:
+        print(f"Error in prediction: {e}")
+        return [_fallback_prediction() for _ in readings]
+
+def ingest_chunk(chunk: TelemetryChunk) -> int:
+    """Feed one parsed chunk of bulk telemetry into the model state
     
-    # Gearbox health based on oil temperature and pressure
-    gearbox_score = 100.0
-    if data.gear_oil_temp > 80:
-        gearbox_score -= 20
-    if data.gear_oil_pressure < 2.0:
-        gearbox_score -= 15
-    
-    # Generator health based on temperature
-    generator_score = 100.0
-    if data.generator_temp > 85:
-        generator_score -= 25
-    
-    # Blade health based on pitch and vibration
-    blade_score = 100.0
-    if abs(data.blade_pitch) > 90:
-        blade_score -= 10
-    
-    # Nacelle health based on temperature
-    nacelle_score = 100.0
-    if data.nacelle_temp > 70:
-        nacelle_score -= 15
+    Returns the number of rows left out of the telemetry history for
+    lacking a timestamp; they still advance the LSTM windows.
+    """
+    if len(chunk) == 0:
+        return 0
     
-    # Overall system health
-    system_score = (gearbox_score + generator_score + blade_score + nacelle_score) / 4
+    untimed = record_telemetry(chunk.turbine_ids, chunk.timestamps, chunk.values)
     
-    health_scores = {
-        "gearbox": max(0, gearbox_score),
-        "generator": max(0, generator_score),
-        "blades": max(0, blade_score),
-        "nacelle": max(0, nacelle_score),
-        "overall": max(0, system_score)
-    }
+    # Same feature plan and scaler as the prediction path, once per chunk
+    features = features_from_matrix(chunk.values)
+    features_scaled = scaler.transform(features) if scaler else features
     
-    return health_scores
+    if sequence_buffer is not None:
+        tracked = [i for i, turbine_id in enumerate(chunk.turbine_ids) if turbine_id]
+        if tracked:
+            sequence_buffer.push_many(
+                [chunk.turbine_ids[i] for i in tracked],
+                features_scaled[tracked],
+                slot_numbers([chunk.timestamps[i] for i in tracked])
+            )
+    return untimed
+
+def predict_failure(data: TurbineData) -> Dict[str, Any]:
+    """Predict failure probability using the trained models"""
+    return predict_failure_batch([data])[0]
+
+def score_lstm_windows() -> int:
+    """Run one batched LSTM predict over every window that advanced"""
+    if lstm_model is None or sequence_buffer is None:
+        return 0
+    
+    turbine_ids, windows = sequence_buffer.pop_ready_windows()
+    if not turbine_ids:
+        return 0
+    
+    probabilities = lstm_model.predict(windows, verbose=0)[:, 0]
+    sequence_buffer.set_scores(turbine_ids, probabilities)
+    return len(turbine_ids)
+
+async def lstm_tick_loop():
+    """Periodically score advanced LSTM windows off the event loop"""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(LSTM_TICK_SECONDS)
+        try:
+            await loop.run_in_executor(lstm_executor, score_lstm_windows)
+        except Exception as e:
+            print(f"Error in LSTM scoring: {e}")
+
+def calculate_component_health(data: TurbineData) -> Dict[str, float]:
+    """Calculate health scores for different components"""
+    # One-row case of the fleet rules in health_rules.HEALTH_RULES
+    health, _ = health_engine.records(*health_engine.evaluate(telemetry_matrix([data])))[0]
+    return health
 
 def estimate_rul(health_scores: Dict[str, float]) -> Dict[str, int]:
     """Estimate Remaining Useful Life for components"""
     rul_estimates = {}
     
-    # Base RUL in hours
-    base_rul = {
-        "gearbox": 8760,  # 1 year
-        "generator": 17520,  # 2 years
-        "blades": 26280,  # 3 years
-        "nacelle": 13140,  # 1.5 years
-    }
-    
     for component, health in health_scores.items():
-        if component in base_rul:
+        if component in BASE_RUL_HOURS:
             # Adjust RUL based on health score
             health_factor = health / 100.0
-            rul_estimates[component] = int(base_rul[component] * health_factor)
+            rul_estimates[component] = int(BASE_RUL_HOURS[component] * health_factor)
     
     return rul_estimates
 
-def generate_component_predictions() -> Dict[str, Dict[str, str]]:
+def sample_turbine_data() -> TurbineData:
+    """Mock sensor reading the component predictions are based on"""
+    mock_data = {
+        'wind_speed': random.uniform(5, 25),
+        'power_output': random.uniform(1000, 3000),
+        'rotor_rpm': random.uniform(10, 30),
+        'nacelle_temp': random.uniform(50, 90),
+        'gear_oil_temp': random.uniform(60, 100),
+        'generator_temp': random.uniform(70, 110),
+        'blade_pitch': random.uniform(-5, 90),
+        'yaw_angle': random.uniform(0, 360),
+        'voltage_l1': random.uniform(350, 400),
+        'voltage_l2': random.uniform(350, 400),
+        'voltage_l3': random.uniform(350, 400),
+        'current_l1': random.uniform(100, 200),
+        'current_l2': random.uniform(100, 200),
+        'current_l3': random.uniform(100, 200),
+        'gear_oil_pressure': random.uniform(1.5, 3.0),
+        'ambient_temp': random.uniform(10, 35),
+        'humidity': random.uniform(30, 80),
+        'wind_direction': random.uniform(0, 360),
+    }
+    return TurbineData(**mock_data)
+
+def generate_component_predictions(turbine_data: TurbineData,
+                                   base_prediction: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
     """Generate component-specific predictions using the Random Forest model"""
     try:
-        # Generate mock sensor data for prediction
-        mock_data = {
-            'wind_speed': random.uniform(5, 25),
-            'power_output': random.uniform(1000, 3000),
-            'rotor_rpm': random.uniform(10, 30),
-            'nacelle_temp': random.uniform(50, 90),
-            'gear_oil_temp': random.uniform(60, 100),
-            'generator_temp': random.uniform(70, 110),
-            'blade_pitch': random.uniform(-5, 90),
-            'yaw_angle': random.uniform(0, 360),
-            'voltage_l1': random.uniform(350, 400),
-            'voltage_l2': random.uniform(350, 400),
-            'voltage_l3': random.uniform(350, 400),
-            'current_l1': random.uniform(100, 200),
-            'current_l2': random.uniform(100, 200),
-            'current_l3': random.uniform(100, 200),
-            'gear_oil_pressure': random.uniform(1.5, 3.0),
-            'ambient_temp': random.uniform(10, 35),
-            'humidity': random.uniform(30, 80),
-            'wind_direction': random.uniform(0, 360),
-        }
-        
-        # Create TurbineData object
-        turbine_data = TurbineData(**mock_data)
-        
-        # Get base prediction
-        base_prediction = predict_failure(turbine_data)
-        
         # Component-specific messages and statuses
         component_messages = {
             "Gearbox": {
@@ -450,16 +854,79 @@ def generate_component_predictions() -> Dict[str, Dict[str, str]]:
             }
         }
 
-@app.on_event("startup")
-async def startup_event():
-    """Load models on startup"""
-    print("🚀 Starting Wind Turbine ML API...")
-    success = load_models()
+def publish_new_data():
+    """Expire cached payloads and push fresh ones to stream subscribers"""
+    response_cache.invalidate()
+    if prediction_stream is not None:
+        prediction_stream.notify()
+
+async def warm_models():
+    """Load models in the background while the API already serves requests"""
+    loop = asyncio.get_running_loop()
+    success = await loop.run_in_executor(None, load_models)
+    # The windows only need the LSTM; the forest may still be missing
+    if sequence_buffer is not None:
+        warmed = await loop.run_in_executor(None, warm_sequence_buffer)
+        if warmed:
+            print(f"✅ LSTM windows rebuilt for {warmed} turbines")
+    # Payloads computed with fallback models are out of date now
+    publish_new_data()
     if success:
         print("✅ API ready to serve predictions")
     else:
         print("⚠️ API running with fallback predictions")
 
+@app.on_event("startup")
+async def startup_event():
+    """Start loading models and background workers"""
+    global lstm_task, inference_executor, failure_batcher, model_loading_task, prediction_stream
+    print("🚀 Starting Wind Turbine ML API...")
+    # Recorded history comes back before models start consuming it
+    await asyncio.get_running_loop().run_in_executor(None, open_telemetry_log)
+    # Until the models are warm, predictions fall back to the rule-based
+    # component health and default probabilities
+    model_loading_task = asyncio.create_task(warm_models())
+    inference_executor = InferenceExecutor(
+        kind=INFERENCE_EXECUTOR,
+        max_workers=INFERENCE_WORKERS,
+        max_queue=INFERENCE_QUEUE_SIZE,
+        initializer=load_forest_models
+    )
+    if MICRO_BATCH_ENABLED:
+        failure_batcher = MicroBatcher(
+            predict_failure_batch_async,
+            max_batch_size=MICRO_BATCH_MAX_SIZE,
+            max_wait_ms=MICRO_BATCH_MAX_WAIT_MS
+        )
+        failure_batcher.start()
+    lstm_task = asyncio.create_task(lstm_tick_loop())
+    prediction_stream = Broadcaster(
+        {
+            "predictions": lambda: response_cache.get(
+                "component_predictions", compute_component_predictions
+            ),
+            "health": lambda: response_cache.get("component_health", compute_component_health),
+        },
+        interval_seconds=STREAM_INTERVAL_SECONDS
+    )
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background workers"""
+    if lstm_task is not None:
+        lstm_task.cancel()
+    if failure_batcher is not None:
+        await failure_batcher.stop()
+    if prediction_stream is not None:
+        await prediction_stream.stop()
+    if inference_executor is not None:
+        inference_executor.shutdown()
+    # Pending recordings are written before the log closes
+    await asyncio.get_running_loop().run_in_executor(None, telemetry_executor.shutdown)
+    if telemetry_log is not None:
+        telemetry_log.close()
+    lstm_executor.shutdown(wait=False)
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -467,54 +934,171 @@ async def root():
         "message": "Wind Turbine ML API",
         "status": "running",
         "version": "1.0.0",
-        "models_loaded": rf_model is not None and lstm_model is not None
+        "models_loaded": rf_model is not None and lstm_model is not None,
+        "models": dict(model_status)
     }
 
+def build_prediction_response(data: TurbineData, prediction: Dict[str, Any],
+                              next_maintenance: datetime,
+                              health_scores: Optional[Dict[str, float]] = None,
+                              rul_estimates: Optional[Dict[str, int]] = None,
+                              power_score: Optional[Tuple[Optional[float], Optional[float]]] = None) -> PredictionResponse:
+    """Attach component health, RUL and expected power to a failure prediction"""
+    # Calculate component health unless scored with the rest of a batch
+    if health_scores is None:
+        health_scores = calculate_component_health(data)
+    
+    # Estimate RUL
+    if rul_estimates is None:
+        rul_estimates = estimate_rul(health_scores)
+    
+    # Compare actual power against the turbine's baseline curve
+    expected_power, power_deviation = power_score or (None, None)
+    if power_score is None and power_table is not None:
+        expected_power, power_deviation = power_table.score_one(
+            data.turbine_id, data.wind_speed, data.power_output
+        )
+    
+    return PredictionResponse(
+        failure_probability=prediction["failure_probability"],
+        failure_prediction=prediction["failure_prediction"],
+        confidence=prediction["confidence"],
+        risk_level=prediction["risk_level"],
+        recommended_actions=prediction["recommended_actions"],
+        next_maintenance_date=next_maintenance.strftime("%Y-%m-%d"),
+        component_health=health_scores,
+        rul_estimates=rul_estimates,
+        expected_power=expected_power,
+        power_deviation=power_deviation
+    )
+
 @app.post("/predict/failure", response_model=PredictionResponse)
 async def predict_failure_endpoint(data: TurbineData):
     """Predict failure probability and provide maintenance recommendations"""
     try:
-        # Get failure prediction
-        prediction = predict_failure(data)
-        
-        # Calculate component health
-        health_scores = calculate_component_health(data)
-        
-        # Estimate RUL
-        rul_estimates = estimate_rul(health_scores)
+        # Get failure prediction, sharing a model call with concurrent
+        # requests when micro-batching is enabled
+        if failure_batcher is not None:
+            prediction = await failure_batcher.submit(data)
+        else:
+            prediction = (await predict_failure_batch_async([data]))[0]
         
         # Calculate next maintenance date
         next_maintenance = datetime.now() + timedelta(days=30)
         
-        return PredictionResponse(
-            failure_probability=prediction["failure_probability"],
-            failure_prediction=prediction["failure_prediction"],
-            confidence=prediction["confidence"],
-            risk_level=prediction["risk_level"],
-            recommended_actions=prediction["recommended_actions"],
-            next_maintenance_date=next_maintenance.strftime("%Y-%m-%d"),
-            component_health=health_scores,
-            rul_estimates=rul_estimates
-        )
+        return build_prediction_response(data, prediction, next_maintenance)
         
+    except InferenceOverloaded as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Prediction error: {str(e)}")
 
+@app.post("/predict/failure/batch", response_model=List[PredictionResponse])
+async def predict_failure_batch_endpoint(readings: List[TurbineData]):
+    """Predict failure probability for many turbines in a single model call"""
+    try:
+        predictions = await predict_failure_batch_async(readings)
+        
+        next_maintenance = datetime.now() + timedelta(days=30)
+        
+        # Component health and RUL for the whole batch in one pass
+        health, rul = health_engine.evaluate(telemetry_matrix(readings))
+        
+        # Expected power for the whole batch in one table lookup
+        power_scores = [None] * len(readings)
+        if power_table is not None:
+            expected, deviation = power_table.score(
+                [data.turbine_id for data in readings],
+                np.array([data.wind_speed for data in readings], dtype=np.float64),
+                np.array([data.power_output for data in readings], dtype=np.float64)
+            )
+            power_scores = [
+                (float(e) if np.isfinite(e) else None, float(d) if np.isfinite(d) else None)
+                for e, d in zip(expected.tolist(), deviation.tolist())
+            ]
+        
+        return [
+            build_prediction_response(data, prediction, next_maintenance, health_scores, rul_estimates, power_score)
+            for data, prediction, (health_scores, rul_estimates), power_score
+            in zip(readings, predictions, health_engine.records(health, rul), power_scores)
+        ]
+        
+    except InferenceOverloaded as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Batch prediction error: {str(e)}")
+
+async def compute_component_predictions() -> Dict[str, Any]:
+    """Component predictions with the forest scored on the inference executor"""
+    turbine_data = sample_turbine_data()
+    base_prediction = (await predict_failure_batch_async([turbine_data]))[0]
+    return generate_component_predictions(turbine_data, base_prediction)
+
+@app.post("/ingest/telemetry")
+async def ingest_telemetry(request: Request):
+    """Bulk-load telemetry streamed as NDJSON or an Arrow IPC stream"""
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    rows = 0
+    chunks = 0
+    untimed = []  # Per chunk, appended from worker threads
+    arrow = None
+    
+    try:
+        if content_type in NDJSON_CONTENT_TYPES:
+            parser = NdjsonParser(TURBINE_FIELDS, chunk_rows=INGEST_CHUNK_ROWS)
+            # Parse as the body arrives; parsing and scaling run off the event loop
+            async for data in request.stream():
+                for chunk in await loop.run_in_executor(None, parser.feed, data):
+                    untimed.append(await loop.run_in_executor(None, ingest_chunk, chunk))
+                    rows += len(chunk)
+                    chunks += 1
+            for chunk in await loop.run_in_executor(None, parser.close):
+                untimed.append(await loop.run_in_executor(None, ingest_chunk, chunk))
+                rows += len(chunk)
+                chunks += 1
+        elif content_type in ARROW_CONTENT_TYPES:
+            arrow = ArrowStreamIngest(TURBINE_FIELDS, lambda chunk: untimed.append(ingest_chunk(chunk)))
+            try:
+                async for data in request.stream():
+                    if data and not arrow.put(data):
+                        # Back-pressure: wait for the reader thread to catch up
+                        await loop.run_in_executor(None, arrow.put_blocking, data)
+            finally:
+                rows = await loop.run_in_executor(None, arrow.finish)
+            chunks = arrow.batches
+        else:
+            raise HTTPException(
+                status_code=415,
+                detail=f"Send {NDJSON_CONTENT_TYPES[0]} or {ARROW_CONTENT_TYPES[0]}"
+            )
+    except IngestError as e:
+        if arrow is not None:
+            rows = arrow.rows
+        raise HTTPException(status_code=400, detail=f"{e} ({rows} rows ingested before the error)")
+    finally:
+        if rows:
+            publish_new_data()
+    
+    seconds = loop.time() - start
+    return {
+        "rows": rows,
+        "chunks": chunks,
+        "untimed_rows": sum(untimed),  # Not kept in the telemetry history
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(rows / seconds) if seconds > 0 else None
+    }
+
 @app.get("/api/predict")
-async def get_component_predictions():
+async def get_component_predictions(request: Request):
     """Get component-specific predictions using the Random Forest model"""
     try:
-        predictions = generate_component_predictions()
-        
-        # Add cache control headers to prevent caching issues
-        return JSONResponse(
-            content=predictions,
-            headers={
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0"
-            }
-        )
+        # Served from the shared cache; clients revalidate with If-None-Match
+        payload = await response_cache.get("component_predictions", compute_component_predictions)
+        return response_cache.respond(payload, request)
+    except InferenceOverloaded as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         print(f"API Error: {e}")
         # Return fallback predictions even on error
@@ -567,10 +1151,115 @@ async def get_component_predictions():
             }
         )
 
-@app.get("/health/components")
-async def get_component_health():
-    """Get current component health status"""
-    # Mock data for demonstration
+@app.get("/stream/predictions")
+async def stream_predictions():
+    """Server-sent events with component predictions and health as they change"""
+    async def events():
+        async with prediction_stream.subscribe() as subscription:
+            while True:
+                updates = await subscription.get(timeout=STREAM_KEEPALIVE_SECONDS)
+                if not updates:
+                    yield ": keepalive\n\n"  # Keeps proxies from closing an idle stream
+                for name, payload in updates.items():
+                    yield f"event: {name}\nid: {payload.etag}\ndata: {payload.body.decode()}\n\n"
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.get("/metrics/inference")
+async def get_inference_metrics():
+    """Inference executor queue depth and wait times"""
+    return inference_executor.metrics()
+
+@app.get("/metrics/telemetry")
+async def get_telemetry_metrics():
+    """Telemetry store size and memory"""
+    return {
+        "turbines": len(telemetry_store),
+        "retention_days": TELEMETRY_RETENTION_DAYS,
+        "rows_per_turbine": telemetry_store.capacity,
+        "channels": telemetry_store.n_channels,
+        "memory_bytes": telemetry_store.memory_bytes(),
+        "log": telemetry_log.stats() if telemetry_log is not None else None
+    }
+
+@app.get("/metrics/cache")
+async def get_cache_metrics():
+    """Response cache hit, miss and revalidation counts"""
+    metrics = response_cache.metrics()
+    metrics["stream_subscribers"] = prediction_stream.subscriber_count if prediction_stream else 0
+    return metrics
+
+def turbine_hourly_telemetry(turbine_id: str):
+    """Hourly means over a turbine's latest HEALTH_WINDOW_HOURS, complete hours only"""
+    end_ns = telemetry_store.last_timestamp(turbine_id) + 1
+    start_ns = end_ns - HEALTH_WINDOW_HOURS * 3600 * NS_PER_SECOND
+    _, hourly = telemetry_store.downsample(turbine_id, start_ns, end_ns, 3600)
+    hours = np.flatnonzero(~np.isnan(hourly).any(axis=1))
+    return hours, hourly[hours]
+
+def health_risk_level(health: float) -> str:
+    if health > 85:
+        return "LOW"
+    if health >= 70:
+        return "MEDIUM"
+    return "HIGH"
+
+def stored_component_health() -> List[HealthScore]:
+    """Fleet component health, trend and RUL from the telemetry store"""
+    hours, hourly = [], []
+    for turbine_id in telemetry_store.turbines:
+        turbine_hours, turbine_hourly = turbine_hourly_telemetry(turbine_id)
+        if len(turbine_hours):
+            hours.append(turbine_hours)
+            hourly.append(turbine_hourly)
+    if not hours:
+        return []
+    
+    # One rules pass over the hourly means of every turbine
+    health = health_engine.health(np.concatenate(hourly))
+    histories = np.split(health, np.cumsum([len(h) for h in hours])[:-1])
+    
+    # Fleet health per component: mean over turbines of their window means
+    fleet_health = np.mean([history.mean(axis=0) for history in histories], axis=0)
+    fleet_rul = health_engine.rul(fleet_health[np.newaxis])[0]
+    
+    now = datetime.now()
+    components = []
+    for i, component in enumerate(health_engine.components):
+        # Fleet trend: mean least-squares slope, in health points per day
+        slopes = [
+            np.polyfit(turbine_hours, history[:, i], 1)[0] * 24
+            for turbine_hours, history in zip(hours, histories) if len(turbine_hours) > 1
+        ]
+        slope = float(np.mean(slopes)) if slopes else 0.0
+        if slope > HEALTH_TREND_THRESHOLD:
+            trend = "improving"
+        elif slope < -HEALTH_TREND_THRESHOLD:
+            trend = "declining"
+        else:
+            trend = "stable"
+        health_score = float(fleet_health[i])
+        components.append(HealthScore(
+            component=HEALTH_COMPONENT_NAMES[component],
+            health_score=round(health_score, 1),
+            trend=trend,
+            last_maintenance="unknown",  # No maintenance records yet
+            next_maintenance=(now + timedelta(hours=int(fleet_rul[i]))).strftime("%Y-%m-%d"),
+            risk_level=health_risk_level(health_score)
+        ))
+    return components
+
+def component_health_payload() -> Dict[str, Any]:
+    """Current component health status"""
+    components = stored_component_health()
+    if components:
+        return {"components": components, "source": "telemetry", "turbines": len(telemetry_store)}
+    
+    # Mock data until telemetry has been received
     components = [
         HealthScore(
             component="Main Bearing",
@@ -606,11 +1295,29 @@ async def get_component_health():
         )
     ]
     
-    return {"components": components}
+    return {"components": components, "source": "mock"}
 
-@app.get("/analytics/summary")
-async def get_analytics_summary():
-    """Get maintenance analytics summary"""
+async def compute_component_health() -> Dict[str, Any]:
+    """Run component_health_payload off the event loop
+    
+    It reads this process's telemetry store, so it runs on the inference
+    threads but never in pool processes, whose stores are empty.
+    """
+    if inference_executor is not None and inference_executor.kind == "thread":
+        return await inference_executor.run(component_health_payload)
+    return await asyncio.get_running_loop().run_in_executor(None, component_health_payload)
+
+@app.get("/health/components")
+async def get_component_health(request: Request):
+    """Get current component health status"""
+    try:
+        payload = await response_cache.get("component_health", compute_component_health)
+    except InferenceOverloaded as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    return response_cache.respond(payload, request)
+
+def analytics_summary_payload() -> Dict[str, Any]:
+    """Maintenance analytics summary"""
     return {
         "total_turbines": 10,
         "operational_hours": 8742,
@@ -629,6 +1336,12 @@ async def get_analytics_summary():
         }
     }
 
+@app.get("/analytics/summary")
+async def get_analytics_summary(request: Request):
+    """Get maintenance analytics summary"""
+    payload = await response_cache.get("analytics_summary", analytics_summary_payload)
+    return response_cache.respond(payload, request)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""
+Expected-power lookup tables for real-time underperformance scoring.
+"""
+
+import json
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+
+class ExpectedPowerTable:
+    """Dense per-turbine expected power, sampled every ``step`` m/s.
+
+    Built once from the binned power curves written by
+    ``BD/Analysis/power_curve.py``: each curve is linearly interpolated
+    between its bin mean wind speeds onto a regular grid, so a lookup is
+    one multiply, one round and one array index. Turbines without a curve
+    of their own use the pooled fleet curve (the last table row).
+    """
+
+    def __init__(self, curves: Dict, step: float = 0.01):
+        turbine_curves = {
+            turbine: curve for turbine, curve in curves.get("turbines", {}).items()
+            if curve.get("power")
+        }
+        fleet = curves.get("fleet") or {}
+        if not fleet.get("power"):
+            if not turbine_curves:
+                raise ValueError("Power curve file holds no curves")
+            fleet = self._pooled(turbine_curves.values())
+
+        ordered = list(turbine_curves.values()) + [fleet]
+        max_wind = max(max(curve["wind_speed"]) for curve in ordered)
+        self.step = step
+        self.grid = np.arange(int(np.ceil(max_wind / step)) + 1) * step
+
+        self.rows = {turbine: i for i, turbine in enumerate(turbine_curves)}
+        self.fleet_row = len(turbine_curves)
+        self.table = np.empty((len(ordered), len(self.grid)), dtype=np.float32)
+        for i, curve in enumerate(ordered):
+            # Below the first and above the last bin the edge value is held
+            self.table[i] = np.interp(self.grid, curve["wind_speed"], curve["power"])
+        self.rated_power = self.table.max(axis=1).astype(np.float64)
+
+    @staticmethod
+    def _pooled(curves: Iterable[Dict]) -> Dict:
+        """Count-weighted mean of several curves over their union of bins"""
+        sums: Dict[float, list] = {}
+        for curve in curves:
+            for wind, power, count in zip(curve["wind_speed"], curve["power"], curve["count"]):
+                entry = sums.setdefault(round(wind * 2) / 2, [0.0, 0.0, 0])
+                entry[0] += wind * count
+                entry[1] += power * count
+                entry[2] += count
+        bins = sorted(sums)
+        return {
+            "wind_speed": [sums[b][0] / sums[b][2] for b in bins],
+            "power": [sums[b][1] / sums[b][2] for b in bins],
+        }
+
+    @classmethod
+    def from_file(cls, path: str, step: float = 0.01) -> "ExpectedPowerTable":
+        with open(path, "r") as f:
+            return cls(json.load(f), step)
+
+    def row_for(self, turbine_id: Optional[str]) -> int:
+        return self.rows.get(turbine_id, self.fleet_row)
+
+    def score_one(self, turbine_id: Optional[str], wind_speed: float,
+                  power_output: float) -> Tuple[Optional[float], Optional[float]]:
+        """Expected power and deviation (share of rated power) for one reading"""
+        if not np.isfinite(wind_speed):
+            return None, None
+        row = self.row_for(turbine_id)
+        index = min(max(int(wind_speed / self.step + 0.5), 0), len(self.grid) - 1)
+        expected = float(self.table[row, index])
+        rated = self.rated_power[row]
+        deviation = (power_output - expected) / rated if rated > 0 else None
+        return expected, deviation
+
+    def score(self, turbine_ids, wind_speeds: np.ndarray,
+              power_outputs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized ``score_one``; NaN where a value cannot be scored"""
+        rows = np.fromiter((self.row_for(t) for t in turbine_ids), dtype=np.intp,
+                           count=len(wind_speeds))
+        wind_speeds = np.asarray(wind_speeds, dtype=np.float64)
+        valid = np.isfinite(wind_speeds)
+        index = np.clip(np.floor(np.where(valid, wind_speeds, 0.0) / self.step + 0.5),
+                        0, len(self.grid) - 1).astype(np.intp)
+        expected = np.where(valid, self.table[rows, index], np.nan)
+        rated = self.rated_power[rows]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            deviation = np.where(rated > 0, (np.asarray(power_outputs) - expected) / rated, np.nan)
+        return expected, deviation
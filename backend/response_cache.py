@@ -0,0 +1,107 @@
+"""
+In-memory cache for read-mostly JSON endpoints polled by the dashboards.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Union
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+
+
+class CachedPayload(NamedTuple):
+    body: bytes
+    etag: str
+    created: float
+    generation: int
+
+
+class ResponseCache:
+    """Serve each payload from memory until it expires or new data arrives.
+
+    A payload is computed at most once per ``ttl_seconds`` and per data
+    generation (bumped by ``invalidate``). Concurrent requests for a payload
+    that is being computed wait for that one computation instead of
+    starting their own, so any number of pollers cost one computation.
+    Responses carry an ETag, and a matching If-None-Match gets a 304.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.generation = 0
+        self._entries: Dict[str, CachedPayload] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.not_modified = 0
+
+    def _fresh(self, entry: Optional[CachedPayload]) -> bool:
+        return (
+            entry is not None
+            and entry.generation == self.generation
+            and time.monotonic() - entry.created < self.ttl_seconds
+        )
+
+    async def _fill(self, key: str, compute: Callable[[], Union[Any, Awaitable[Any]]]) -> CachedPayload:
+        generation = self.generation
+        try:
+            content = compute()
+            if inspect.isawaitable(content):
+                content = await content
+            body = json.dumps(jsonable_encoder(content), separators=(",", ":")).encode()
+            etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+            entry = CachedPayload(body, etag, time.monotonic(), generation)
+            self._entries[key] = entry
+            return entry
+        finally:
+            self._inflight.pop(key, None)
+
+    async def get(self, key: str, compute: Callable[[], Union[Any, Awaitable[Any]]]) -> CachedPayload:
+        """Cached payload for ``key``, computing it with ``compute`` if stale"""
+        entry = self._entries.get(key)
+        if self._fresh(entry):
+            self.hits += 1
+            return entry
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            # A separate task, so a disconnecting client does not cancel
+            # the computation other requests are waiting on
+            task = asyncio.ensure_future(self._fill(key, compute))
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def invalidate(self):
+        """Mark every cached payload stale, e.g. when new telemetry arrives"""
+        self.generation += 1
+
+    def respond(self, payload: CachedPayload, request: Request) -> Response:
+        """JSON response for a payload, or 304 if the client already has it"""
+        headers = {"ETag": payload.etag, "Cache-Control": "no-cache"}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            if "*" in tags or payload.etag in tags:
+                self.not_modified += 1
+                return Response(status_code=304, headers=headers)
+        return Response(content=payload.body, media_type="application/json", headers=headers)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "ttl_seconds": self.ttl_seconds,
+            "generation": self.generation,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "not_modified": self.not_modified,
+        }
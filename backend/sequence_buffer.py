@@ -0,0 +1,131 @@
+"""
+Rolling per-turbine feature windows for LSTM inference.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+class SequenceBuffer:
+    """Fixed-size ring buffer of recent scaled feature vectors for each turbine.
+
+    Every turbine owns a ``(window, n_features)`` array that is overwritten in
+    place, so memory per turbine never grows past one window. Turbines whose
+    window moved forward since the last call to ``pop_ready_windows`` are
+    tracked so a periodic tick only re-scores what changed.
+
+    Rows may carry a time-grid slot number (see ``time_grid``). Rows for a
+    slot at or before the turbine's latest one are dropped as duplicates or
+    out of order, gaps of up to ``max_fill_gap`` slots are forward-filled
+    with the previous row, and longer gaps restart the window so it never
+    spans a hole in the data.
+    """
+
+    def __init__(self, window: int, n_features: int, max_fill_gap: int = 2):
+        self.window = window
+        self.n_features = n_features
+        self.max_fill_gap = max_fill_gap
+        self._rows: Dict[str, np.ndarray] = {}
+        self._heads: Dict[str, int] = {}
+        self._counts: Dict[str, int] = {}
+        self._slots: Dict[str, int] = {}
+        self._scores: Dict[str, float] = {}
+        self._dirty = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _append_locked(self, turbine_id: str, row: np.ndarray):
+        rows = self._rows.get(turbine_id)
+        if rows is None:
+            rows = np.zeros((self.window, self.n_features), dtype=np.float32)
+            self._rows[turbine_id] = rows
+            self._heads[turbine_id] = 0
+            self._counts[turbine_id] = 0
+        head = self._heads[turbine_id]
+        rows[head] = row
+        self._heads[turbine_id] = (head + 1) % self.window
+        self._counts[turbine_id] = min(self._counts[turbine_id] + 1, self.window)
+        self._dirty.add(turbine_id)
+
+    def _push_locked(self, turbine_id: str, row: np.ndarray, slot: Optional[int] = None) -> bool:
+        if slot is None or slot < 0:
+            self._append_locked(turbine_id, row)
+            return True
+
+        last = self._slots.get(turbine_id)
+        if last is not None:
+            if slot <= last:
+                return False
+            gap = slot - last - 1
+            if gap > self.max_fill_gap:
+                # The old window's score no longer describes the turbine
+                self._counts[turbine_id] = 0
+                self._scores.pop(turbine_id, None)
+            elif gap > 0 and self._counts[turbine_id] > 0:
+                previous = self._rows[turbine_id][(self._heads[turbine_id] - 1) % self.window].copy()
+                for _ in range(min(gap, self.window)):
+                    self._append_locked(turbine_id, previous)
+        self._slots[turbine_id] = slot
+        self._append_locked(turbine_id, row)
+        return True
+
+    def push(self, turbine_id: str, row: np.ndarray, slot: Optional[int] = None) -> bool:
+        """Append one scaled feature vector to a turbine's window.
+
+        Returns False when a slotted row was dropped as a duplicate or
+        arrived out of order.
+        """
+        with self._lock:
+            return self._push_locked(turbine_id, row, slot)
+
+    def push_many(self, turbine_ids: Iterable[str], rows: np.ndarray,
+                  slots: Optional[Iterable[int]] = None) -> int:
+        """Append one row per turbine id, in order; returns the rows accepted"""
+        if slots is None:
+            slots = [None] * len(rows)
+        with self._lock:
+            return sum(
+                self._push_locked(turbine_id, row, None if slot is None else int(slot))
+                for turbine_id, row, slot in zip(turbine_ids, rows, slots)
+            )
+
+    def window_for(self, turbine_id: str) -> Optional[np.ndarray]:
+        """Return a turbine's full window ordered oldest to newest, if any"""
+        with self._lock:
+            if self._counts.get(turbine_id, 0) < self.window:
+                return None
+            return self._ordered(turbine_id)
+
+    def _ordered(self, turbine_id: str) -> np.ndarray:
+        order = (self._heads[turbine_id] + np.arange(self.window)) % self.window
+        return self._rows[turbine_id][order]
+
+    def pop_ready_windows(self) -> Tuple[List[str], np.ndarray]:
+        """Collect full windows that advanced since the last call.
+
+        Returns the turbine ids and a ``(k, window, n_features)`` batch ready
+        for a single ``predict`` call.
+        """
+        with self._lock:
+            ready = [t for t in self._dirty if self._counts[t] >= self.window]
+            self._dirty.difference_update(ready)
+            if not ready:
+                return [], np.empty((0, self.window, self.n_features), dtype=np.float32)
+            windows = np.stack([self._ordered(t) for t in ready])
+        return ready, windows
+
+    def set_scores(self, turbine_ids: List[str], scores: np.ndarray):
+        """Store the latest model score for each turbine"""
+        with self._lock:
+            for turbine_id, score in zip(turbine_ids, scores):
+                self._scores[turbine_id] = float(score)
+
+    def score(self, turbine_id: Optional[str], default: float) -> float:
+        """Latest model score for a turbine, or ``default`` when not yet scored"""
+        if turbine_id is None:
+            return default
+        return self._scores.get(turbine_id, default)
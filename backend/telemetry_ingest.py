@@ -0,0 +1,215 @@
+"""
+Streaming parsers that turn bulk telemetry uploads into columnar chunks.
+
+Both formats produce ``TelemetryChunk`` objects holding an ``N x len(fields)``
+float64 matrix plus the optional turbine ids and timestamps, without
+building a pydantic model per row.
+"""
+
+import io
+import json
+import queue
+import threading
+from operator import itemgetter
+from typing import Callable, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:  # Arrow uploads are rejected without pyarrow
+    pa = None
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl", "application/ndjson")
+ARROW_CONTENT_TYPES = ("application/vnd.apache.arrow.stream",)
+
+
+class TelemetryChunk(NamedTuple):
+    values: np.ndarray                  # N x len(fields) sensor matrix
+    turbine_ids: List[Optional[str]]
+    timestamps: List[Optional[str]]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class IngestError(ValueError):
+    """Malformed telemetry in an upload"""
+
+
+class NdjsonParser:
+    """Incremental newline-delimited JSON parser.
+
+    Body chunks may split lines anywhere; the unfinished tail is carried
+    over to the next ``feed``. Complete lines are parsed together with one
+    ``json.loads`` call once ``chunk_rows`` of them are buffered.
+    """
+
+    def __init__(self, fields: Sequence[str], chunk_rows: int = 10_000):
+        self.fields = tuple(fields)
+        self.chunk_rows = chunk_rows
+        self._get_values = itemgetter(*self.fields)
+        self._tail = b""
+        self._lines: List[bytes] = []
+        self.lines_seen = 0
+
+    def feed(self, data: bytes) -> List[TelemetryChunk]:
+        """Consume body bytes, returning any chunks that are complete"""
+        lines = (self._tail + data).split(b"\n")
+        self._tail = lines.pop()
+        self._lines.extend(line for line in lines if line.strip())
+        chunks = []
+        while len(self._lines) >= self.chunk_rows:
+            batch, self._lines = self._lines[:self.chunk_rows], self._lines[self.chunk_rows:]
+            chunks.append(self._parse(batch))
+        return chunks
+
+    def close(self) -> List[TelemetryChunk]:
+        """Parse whatever is left once the body has ended"""
+        if self._tail.strip():
+            self._lines.append(self._tail)
+        self._tail = b""
+        batch, self._lines = self._lines, []
+        return [self._parse(batch)] if batch else []
+
+    def _parse(self, lines: List[bytes]) -> TelemetryChunk:
+        first_line = self.lines_seen + 1
+        self.lines_seen += len(lines)
+        try:
+            rows = json.loads(b"[" + b",".join(lines) + b"]")
+        except json.JSONDecodeError:
+            # Find the offending line only on the slow path
+            for i, line in enumerate(lines):
+                try:
+                    json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise IngestError(f"Line {first_line + i}: invalid JSON ({e.msg})") from None
+            raise IngestError(f"Lines {first_line}-{self.lines_seen}: invalid JSON") from None
+
+        try:
+            values = np.array([self._get_values(row) for row in rows], dtype=np.float64)
+        except (KeyError, TypeError, ValueError) as e:
+            raise IngestError(
+                f"Lines {first_line}-{self.lines_seen}: every row needs numeric {', '.join(self.fields)} ({e})"
+            ) from None
+        turbine_ids = [row.get("turbine_id") for row in rows]
+        timestamps = [row.get("timestamp") for row in rows]
+        for name, column in (("turbine_id", turbine_ids), ("timestamp", timestamps)):
+            for i, value in enumerate(column):
+                if value is not None and not isinstance(value, str):
+                    raise IngestError(f"Line {first_line + i}: {name} must be a string")
+        return TelemetryChunk(
+            values=values.reshape(len(rows), len(self.fields)),
+            turbine_ids=turbine_ids,
+            timestamps=timestamps,
+        )
+
+
+def _is_text(arrow_type) -> bool:
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+
+
+class _QueueReader(io.RawIOBase):
+    """Blocking file-like view of byte chunks pushed onto a queue (None ends it)"""
+
+    def __init__(self, chunks: "queue.Queue[Optional[bytes]]"):
+        self._chunks = chunks
+        self._buffer = memoryview(b"")
+        self.eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        while not self._buffer and not self.eof:
+            chunk = self._chunks.get()
+            if chunk is None:
+                self.eof = True
+            else:
+                self._buffer = memoryview(chunk)
+        n = min(len(target), len(self._buffer))
+        target[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+class ArrowStreamIngest:
+    """Read an Arrow IPC stream on a worker thread as its bytes arrive.
+
+    The request handler ``put``s body chunks; the thread decodes record
+    batches and hands each one as a ``TelemetryChunk`` to ``on_chunk``.
+    ``finish`` ends the stream and returns the rows handled or re-raises
+    the worker's error.
+    """
+
+    def __init__(self, fields: Sequence[str], on_chunk: Callable[[TelemetryChunk], None],
+                 max_pending: int = 64):
+        if pa is None:
+            raise IngestError("Arrow uploads require pyarrow")
+        self.fields = tuple(fields)
+        self.on_chunk = on_chunk
+        self.chunks: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=max_pending)
+        self.rows = 0
+        self.batches = 0
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="arrow-ingest", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        source = _QueueReader(self.chunks)
+        try:
+            reader = pa.ipc.open_stream(io.BufferedReader(source))
+            for batch in reader:
+                self.on_chunk(self._to_chunk(batch))
+                self.rows += batch.num_rows
+                self.batches += 1
+        except Exception as e:
+            self._error = e
+            # Drain so the producer is never blocked on a dead reader
+            while not source.eof and self.chunks.get() is not None:
+                pass
+
+    def _to_chunk(self, batch) -> TelemetryChunk:
+        names = batch.schema.names
+        missing = [field for field in self.fields if field not in names]
+        if missing:
+            raise IngestError(f"Arrow stream is missing columns: {', '.join(missing)}")
+        values = np.empty((batch.num_rows, len(self.fields)), dtype=np.float64)
+        for j, field in enumerate(self.fields):
+            values[:, j] = batch.column(field).to_numpy(zero_copy_only=False)
+        for name, accepts, expected in (
+            ("turbine_id", _is_text, "a string"),
+            ("timestamp", lambda t: _is_text(t) or pa.types.is_timestamp(t), "a string or timestamp"),
+        ):
+            if name in names:
+                arrow_type = batch.schema.field(name).type
+                if not (accepts(arrow_type) or pa.types.is_null(arrow_type)):
+                    raise IngestError(f"Arrow column {name} must be {expected}, not {arrow_type}")
+        n = batch.num_rows
+        turbine_ids = batch.column("turbine_id").to_pylist() if "turbine_id" in names else [None] * n
+        timestamps = batch.column("timestamp").to_pylist() if "timestamp" in names else [None] * n
+        return TelemetryChunk(values, turbine_ids, timestamps)
+
+    def put(self, data: bytes) -> bool:
+        """Queue body bytes without blocking; False if the queue is full"""
+        try:
+            self.chunks.put_nowait(data)
+            return True
+        except queue.Full:
+            return False
+
+    def put_blocking(self, data: Optional[bytes]):
+        self.chunks.put(data)
+
+    def finish(self) -> int:
+        """Signal the end of the body and wait for the worker (blocking)"""
+        self.chunks.put(None)
+        self._thread.join()
+        if self._error is not None:
+            if isinstance(self._error, IngestError):
+                raise self._error
+            raise IngestError(f"Invalid Arrow stream: {self._error}")
+        return self.rows
@@ -0,0 +1,254 @@
+"""
+Append-only on-disk log of recorded telemetry, replayed with memory maps.
+
+A log directory holds numbered segment directories. Each segment stores one
+raw little-endian file per column: ``ts.i64`` (epoch nanoseconds),
+``turbine.i32`` (position in ``turbines.json``) and one ``<field>.f32`` per
+sensor channel. Appending is a plain write to every column file, and a
+segment is read back with ``np.memmap`` without any parsing. ``index.json``
+records the row count and timestamp range of every sealed segment.
+"""
+
+import json
+import os
+import shutil
+import threading
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+TIMESTAMP_FILE = "ts.i64"
+TURBINE_FILE = "turbine.i32"
+TURBINES_FILE = "turbines.json"
+INDEX_FILE = "index.json"
+SEGMENT_PREFIX = "segment-"
+
+TIMESTAMP_DTYPE = np.dtype("<i8")
+TURBINE_DTYPE = np.dtype("<i4")
+VALUE_DTYPE = np.dtype("<f4")
+
+
+class SegmentInfo(NamedTuple):
+    name: str
+    rows: int
+    first_ns: int   # Smallest timestamp in the segment
+    last_ns: int    # Largest timestamp in the segment
+
+
+class LogChunk(NamedTuple):
+    turbine_ids: np.ndarray   # Object array of turbine ids
+    timestamps: np.ndarray    # int64 epoch nanoseconds
+    values: np.ndarray        # N x len(fields) float32
+
+
+def _write_json(path: str, content):
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "w") as f:
+        json.dump(content, f)
+    os.replace(tmp_path, path)
+
+
+class TelemetryLog:
+    """Columnar segment log in ``directory`` for rows of ``fields``.
+
+    Rows go to the active segment until it holds ``segment_rows``; it is
+    then sealed into the index and a new one is started. A segment left
+    behind by a crash may have columns of different lengths; opening the
+    log truncates every column to the shortest one, dropping the partial
+    row. With ``retention_seconds``, sealing a segment also retires sealed
+    segments that end that long before the newest row.
+    """
+
+    def __init__(self, directory: str, fields: Sequence[str], segment_rows: int = 500_000,
+                 retention_seconds: Optional[float] = None):
+        self.directory = directory
+        self.fields = tuple(fields)
+        self.segment_rows = segment_rows
+        self.retention_seconds = retention_seconds
+        self._columns = [(TIMESTAMP_FILE, TIMESTAMP_DTYPE), (TURBINE_FILE, TURBINE_DTYPE)]
+        self._columns += [(f"{field}.f32", VALUE_DTYPE) for field in self.fields]
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+        self._turbines: List[str] = self._read_json(TURBINES_FILE, [])
+        self._codes = {turbine_id: code for code, turbine_id in enumerate(self._turbines)}
+        # Segments retired by an interrupted compaction may still be indexed
+        self._sealed = [
+            SegmentInfo(**segment)
+            for segment in self._read_json(INDEX_FILE, {"segments": []})["segments"]
+            if os.path.isdir(self._path(segment["name"]))
+        ]
+        self._files = []
+        self._active = None
+        self._active_rows = 0
+        self._open_active()
+
+    def _path(self, name: str, filename: str = "") -> str:
+        return os.path.join(self.directory, name, filename)
+
+    def _read_json(self, filename: str, default):
+        path = os.path.join(self.directory, filename)
+        if not os.path.exists(path):
+            return default
+        with open(path) as f:
+            return json.load(f)
+
+    def _write_index(self):
+        _write_json(
+            os.path.join(self.directory, INDEX_FILE),
+            {"segments": [segment._asdict() for segment in self._sealed]}
+        )
+
+    def _recover(self, name: str) -> int:
+        """Truncate every column of a segment to its complete rows"""
+        sizes = []
+        for filename, dtype in self._columns:
+            path = self._path(name, filename)
+            sizes.append(os.path.getsize(path) // dtype.itemsize if os.path.exists(path) else 0)
+        rows = min(sizes)
+        for filename, dtype in self._columns:
+            with open(self._path(name, filename), "ab") as f:
+                f.truncate(rows * dtype.itemsize)
+        return rows
+
+    def _segment_info(self, name: str, rows: int) -> SegmentInfo:
+        if rows == 0:
+            return SegmentInfo(name, 0, 0, 0)
+        timestamps = np.memmap(self._path(name, TIMESTAMP_FILE), dtype=TIMESTAMP_DTYPE,
+                               mode="r", shape=(rows,))
+        return SegmentInfo(name, rows, int(timestamps.min()), int(timestamps.max()))
+
+    def _open_active(self):
+        sealed = {segment.name for segment in self._sealed}
+        unsealed = sorted(
+            name for name in os.listdir(self.directory)
+            if name.startswith(SEGMENT_PREFIX) and name not in sealed
+        )
+        # Normally at most one; seal any older leftovers so a single
+        # segment is ever written to
+        for name in unsealed[:-1]:
+            self._sealed.append(self._segment_info(name, self._recover(name)))
+        if unsealed[:-1]:
+            self._write_index()
+
+        if unsealed:
+            self._active = unsealed[-1]
+            self._active_rows = self._recover(self._active)
+        else:
+            names = [segment.name for segment in self._sealed]
+            number = int(max(names)[len(SEGMENT_PREFIX):]) + 1 if names else 1
+            self._active = f"{SEGMENT_PREFIX}{number:06d}"
+            self._active_rows = 0
+            os.makedirs(self._path(self._active), exist_ok=True)
+        self._files = [open(self._path(self._active, filename), "ab") for filename, _ in self._columns]
+
+    def _roll(self):
+        """Seal the active segment and start the next one"""
+        for handle in self._files:
+            handle.close()
+        self._files = []
+        self._sealed.append(self._segment_info(self._active, self._active_rows))
+        self._write_index()
+        self._open_active()
+        if self.retention_seconds is not None:
+            newest = max(segment.last_ns for segment in self._sealed)
+            self._compact_locked(newest - int(self.retention_seconds * 1e9))
+
+    def append(self, turbine_ids: Sequence[str], timestamps: np.ndarray, values: np.ndarray) -> int:
+        """Append rows (epoch-ns timestamps, ``N x len(fields)`` values)"""
+        n = len(turbine_ids)
+        if n == 0:
+            return 0
+        with self._lock:
+            new_ids = [turbine_id for turbine_id in dict.fromkeys(turbine_ids) if turbine_id not in self._codes]
+            if new_ids:
+                for turbine_id in new_ids:
+                    self._codes[turbine_id] = len(self._turbines)
+                    self._turbines.append(turbine_id)
+                # Persisted before any row refers to the new codes
+                _write_json(os.path.join(self.directory, TURBINES_FILE), self._turbines)
+
+            values = np.asarray(values, dtype=VALUE_DTYPE).reshape(n, len(self.fields))
+            columns = [
+                np.asarray(timestamps, dtype=TIMESTAMP_DTYPE),
+                np.fromiter((self._codes[turbine_id] for turbine_id in turbine_ids), dtype=TURBINE_DTYPE, count=n),
+            ]
+            columns += [values[:, j] for j in range(len(self.fields))]
+
+            start = 0
+            while start < n:
+                stop = start + min(n - start, self.segment_rows - self._active_rows)
+                for handle, column in zip(self._files, columns):
+                    handle.write(np.ascontiguousarray(column[start:stop]).tobytes())
+                for handle in self._files:
+                    handle.flush()
+                self._active_rows += stop - start
+                start = stop
+                if self._active_rows >= self.segment_rows:
+                    self._roll()
+        return n
+
+    def segments(self) -> List[SegmentInfo]:
+        """Sealed segments followed by the active one, oldest first"""
+        with self._lock:
+            return self._sealed + [self._segment_info(self._active, self._active_rows)]
+
+    def last_timestamp(self) -> Optional[int]:
+        """Newest timestamp in the log, None if it is empty"""
+        segments = [segment for segment in self.segments() if segment.rows]
+        return max(segment.last_ns for segment in segments) if segments else None
+
+    def _map(self, segment: SegmentInfo, since_ns: Optional[int]) -> LogChunk:
+        columns = [
+            np.memmap(self._path(segment.name, filename), dtype=dtype, mode="r", shape=(segment.rows,))
+            for filename, dtype in self._columns
+        ]
+        timestamps, codes, channels = columns[0], columns[1], columns[2:]
+        rows = slice(None) if since_ns is None else timestamps >= since_ns
+        turbines = np.array(self._turbines, dtype=object)
+        return LogChunk(
+            turbine_ids=turbines[codes[rows]],
+            timestamps=np.array(timestamps[rows]),
+            values=np.column_stack([channel[rows] for channel in channels]),
+        )
+
+    def replay(self, since_ns: Optional[int] = None) -> Iterator[LogChunk]:
+        """Rows at or after ``since_ns``, one chunk per segment in append order"""
+        for segment in self.segments():
+            if segment.rows == 0 or (since_ns is not None and segment.last_ns < since_ns):
+                continue
+            chunk = self._map(segment, since_ns)
+            if len(chunk.timestamps):
+                yield chunk
+
+    def _compact_locked(self, before_ns: int) -> int:
+        retired = [segment for segment in self._sealed if segment.last_ns < before_ns]
+        if not retired:
+            return 0
+        # Data first, then the index: a crash in between only leaves index
+        # entries for missing directories, which opening the log ignores
+        for segment in retired:
+            shutil.rmtree(self._path(segment.name), ignore_errors=True)
+        self._sealed = [segment for segment in self._sealed if segment.last_ns >= before_ns]
+        self._write_index()
+        return len(retired)
+
+    def compact(self, before_ns: int) -> int:
+        """Retire sealed segments whose rows are all older than ``before_ns``"""
+        with self._lock:
+            return self._compact_locked(before_ns)
+
+    def stats(self) -> Dict[str, int]:
+        segments = self.segments()
+        return {
+            "segments": len(segments),
+            "rows": sum(segment.rows for segment in segments),
+            "bytes": sum(segment.rows for segment in segments) * sum(dtype.itemsize for _, dtype in self._columns),
+            "turbines": len(self._turbines),
+        }
+
+    def close(self):
+        with self._lock:
+            for handle in self._files:
+                handle.close()
+            self._files = []
@@ -0,0 +1,164 @@
+"""
+Array-backed ring store of recent per-turbine telemetry.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from time_grid import SLOT_SECONDS
+
+NS_PER_SECOND = 1_000_000_000
+
+
+class _TurbineRing:
+    """Chronological ring of (timestamp, channels) rows for one turbine"""
+
+    def __init__(self, capacity: int, n_channels: int):
+        self.timestamps = np.zeros(capacity, dtype=np.int64)
+        self.values = np.zeros((capacity, n_channels), dtype=np.float32)
+        self.head = 0   # Next write position
+        self.count = 0
+
+    def order(self) -> np.ndarray:
+        """Physical positions of the stored rows, oldest first"""
+        capacity = len(self.timestamps)
+        return (self.head - self.count + np.arange(self.count)) % capacity
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        if self.count == 0:
+            return None
+        return int(self.timestamps[(self.head - 1) % len(self.timestamps)])
+
+
+class TelemetryStore:
+    """Last ``retention_days`` of 10-minute readings for every turbine.
+
+    Each turbine gets a fixed ring of int64 epoch-nanosecond timestamps and
+    a float32 ``(capacity, n_channels)`` block, sized for one row per
+    10-minute slot, so memory is ``turbines x capacity x (8 + 4 * channels)``
+    bytes however long the service runs. Rows must arrive in time order per
+    turbine; rows at or before a turbine's latest timestamp are dropped.
+    """
+
+    def __init__(self, n_channels: int, retention_days: float = 7,
+                 slot_seconds: int = SLOT_SECONDS):
+        self.n_channels = n_channels
+        self.capacity = max(1, int(retention_days * 86400 // slot_seconds))
+        self._rings: Dict[str, _TurbineRing] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rings)
+
+    @property
+    def turbines(self) -> List[str]:
+        return sorted(self._rings)
+
+    def last_timestamp(self, turbine_id: str) -> Optional[int]:
+        """Epoch nanoseconds of a turbine's newest row, None if it has none"""
+        with self._lock:
+            ring = self._rings.get(turbine_id)
+            return None if ring is None else ring.last_timestamp
+
+    def memory_bytes(self) -> int:
+        per_turbine = self.capacity * (8 + 4 * self.n_channels)
+        return per_turbine * len(self._rings)
+
+    def _append_locked(self, turbine_id: str, timestamps: np.ndarray, values: np.ndarray) -> np.ndarray:
+        ring = self._rings.get(turbine_id)
+        if ring is None:
+            ring = self._rings[turbine_id] = _TurbineRing(self.capacity, self.n_channels)
+
+        # Keep rows that move time strictly forward
+        last = ring.last_timestamp
+        floor = np.iinfo(np.int64).min if last is None else last
+        running_max = np.maximum.accumulate(np.concatenate(([floor], timestamps)))
+        keep = timestamps > running_max[:-1]
+        # Rows that would be overwritten within this append are not stored
+        keep[np.flatnonzero(keep)[:-self.capacity]] = False
+        timestamps, values = timestamps[keep], values[keep]
+
+        n = len(timestamps)
+        positions = (ring.head + np.arange(n)) % self.capacity
+        ring.timestamps[positions] = timestamps
+        ring.values[positions] = values
+        ring.head = (ring.head + n) % self.capacity
+        ring.count = min(ring.count + n, self.capacity)
+        return keep
+
+    def append(self, turbine_id: str, timestamps: np.ndarray, values: np.ndarray) -> int:
+        """Append rows of one turbine; returns how many were stored"""
+        timestamps = np.asarray(timestamps, dtype=np.int64).reshape(-1)
+        values = np.asarray(values, dtype=np.float32).reshape(len(timestamps), self.n_channels)
+        with self._lock:
+            return int(self._append_locked(turbine_id, timestamps, values).sum())
+
+    def append_many(self, turbine_ids: Iterable[str], timestamps: np.ndarray,
+                    values: np.ndarray) -> np.ndarray:
+        """Append rows for many turbines, keeping each turbine's row order
+
+        Returns a boolean mask of the rows that were stored.
+        """
+        ids = np.asarray(list(turbine_ids), dtype=object)
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float32)
+        stored = np.zeros(len(ids), dtype=bool)
+        if len(ids) == 0:
+            return stored
+        unique, inverse = np.unique(ids, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(len(unique) + 1))
+        with self._lock:
+            for i, turbine_id in enumerate(unique):
+                rows = order[bounds[i]:bounds[i + 1]]
+                stored[rows] = self._append_locked(turbine_id, timestamps[rows], values[rows])
+        return stored
+
+    def range(self, turbine_id: str, start_ns: Optional[int] = None,
+              end_ns: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Rows with ``start_ns <= timestamp < end_ns``, oldest first (copies)"""
+        with self._lock:
+            ring = self._rings.get(turbine_id)
+            if ring is None or ring.count == 0:
+                return (np.empty(0, dtype=np.int64),
+                        np.empty((0, self.n_channels), dtype=np.float32))
+            order = ring.order()
+            timestamps = ring.timestamps[order]
+            lo = 0 if start_ns is None else np.searchsorted(timestamps, start_ns, side="left")
+            hi = len(timestamps) if end_ns is None else np.searchsorted(timestamps, end_ns, side="left")
+            return timestamps[lo:hi], ring.values[order[lo:hi]]
+
+    def latest(self, turbine_id: str, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """The newest ``n`` rows (fewer if not stored yet), oldest first"""
+        with self._lock:
+            ring = self._rings.get(turbine_id)
+            if ring is None:
+                return (np.empty(0, dtype=np.int64),
+                        np.empty((0, self.n_channels), dtype=np.float32))
+            order = ring.order()[-n:]
+            return ring.timestamps[order], ring.values[order]
+
+    def downsample(self, turbine_id: str, start_ns: int, end_ns: int,
+                   bucket_seconds: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-bucket channel means over ``[start_ns, end_ns)``.
+
+        Returns the bucket start timestamps and a ``(buckets, n_channels)``
+        float64 array with NaN for buckets or channels without data.
+        """
+        bucket_ns = bucket_seconds * NS_PER_SECOND
+        n_buckets = max(0, -(-(end_ns - start_ns) // bucket_ns))
+        starts = start_ns + np.arange(n_buckets, dtype=np.int64) * bucket_ns
+        sums = np.zeros((n_buckets, self.n_channels))
+        counts = np.zeros((n_buckets, self.n_channels))
+
+        timestamps, values = self.range(turbine_id, start_ns, end_ns)
+        if len(timestamps):
+            buckets = (timestamps - start_ns) // bucket_ns
+            valid = ~np.isnan(values)
+            np.add.at(sums, buckets, np.where(valid, values, 0.0))
+            np.add.at(counts, buckets, valid)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return starts, np.where(counts > 0, sums / counts, np.nan)
@@ -0,0 +1,52 @@
+import os
+import warnings
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+import main
+
+SHIPPED_SCALER = os.path.join(main.BACKEND_DIR, "..", "BD", "models", "scaler.pkl")
+
+
+@pytest.fixture(autouse=True)
+def model_globals(monkeypatch):
+    # _publish_forest swaps the serving models; restore them afterwards
+    for name in ("rf_model", "scaler", "feature_names", "feature_plan"):
+        monkeypatch.setattr(main, name, getattr(main, name, None))
+    monkeypatch.setattr(main, "model_status", dict(main.model_status))
+
+
+@pytest.fixture
+def shipped_scaler():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # Pickled with another scikit-learn
+        try:
+            return joblib.load(SHIPPED_SCALER)
+        except ModuleNotFoundError as e:
+            pytest.skip(f"shipped scaler cannot be unpickled here: {e}")
+
+
+def test_shipped_scaler_names_are_used_without_feature_names_file(shipped_scaler, tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "FEATURE_NAMES_PATH", str(tmp_path / "feature_names.json"))
+    names = main._load_feature_names(str(tmp_path))
+    assert names is None
+
+    n_features = shipped_scaler.n_features_in_
+    rng = np.random.default_rng(0)
+    forest = RandomForestClassifier(n_estimators=2, random_state=0).fit(
+        rng.normal(size=(40, n_features)), rng.integers(0, 2, 40)
+    )
+    assert main._publish_forest(forest, shipped_scaler, names)
+    assert main.feature_plan.names == list(shipped_scaler.feature_names_in_)
+    # The shipped features are the ten turbines' ambient wind speeds
+    assert not main.feature_plan.zero_mask.any()
+    assert set(main.feature_plan.indices) == {main.TURBINE_FIELDS.index("wind_speed")}
+
+
+def test_mismatched_feature_names_fail_the_forest(shipped_scaler):
+    forest = RandomForestClassifier(n_estimators=2, random_state=0).fit(np.zeros((4, 10)), [0, 1, 0, 1])
+    assert not main._publish_forest(forest, shipped_scaler, list(main.DEFAULT_FEATURE_FIELDS))
+    assert main.model_status["random_forest"] == "failed"
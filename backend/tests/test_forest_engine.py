@@ -0,0 +1,97 @@
+import os
+
+import joblib
+import numpy as np
+import pytest
+import sklearn
+from sklearn.ensemble import RandomForestClassifier
+
+from forest_engine import CompiledForest, load_compiled_forest
+
+
+# Random forests accept NaN from scikit-learn 1.4
+needs_missing_value_support = pytest.mark.skipif(
+    tuple(int(part) for part in sklearn.__version__.split(".")[:2]) < (1, 4),
+    reason="this scikit-learn does not route missing values in forests"
+)
+
+
+def _data(n_rows=400, n_features=6, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_rows, n_features))
+    y = (X[:, 0] + 0.5 * X[:, 1] - X[:, 2] > 0).astype(int)
+    return X, y
+
+
+def _with_nans(X, seed=1, fraction=0.2):
+    rng = np.random.default_rng(seed)
+    X = X.copy()
+    X[rng.random(X.shape) < fraction] = np.nan
+    return X
+
+
+@pytest.fixture(scope="module")
+def forest():
+    X, y = _data()
+    return RandomForestClassifier(n_estimators=20, max_depth=8, random_state=0).fit(X, y)
+
+
+def test_matches_sklearn_probabilities(forest):
+    X, _ = _data(n_rows=300, seed=5)
+    compiled = CompiledForest.from_sklearn(forest)
+    np.testing.assert_allclose(compiled.predict_proba(X), forest.predict_proba(X))
+    np.testing.assert_array_equal(compiled.predict(X), forest.predict(X))
+
+
+def test_leaves_match_sklearn_apply(forest):
+    X, _ = _data(n_rows=50, seed=6)
+    compiled = CompiledForest.from_sklearn(forest)
+    offsets = compiled.roots[np.newaxis, :]
+    np.testing.assert_array_equal(compiled.apply(X) - offsets, forest.apply(X.astype(np.float32)))
+
+
+@needs_missing_value_support
+def test_missing_values_follow_sklearn_routing(forest):
+    # Forest trained without NaN: scikit-learn still sends NaN one way per node
+    X = _with_nans(_data(n_rows=300, seed=7)[0])
+    compiled = CompiledForest.from_sklearn(forest)
+    np.testing.assert_allclose(compiled.predict_proba(X), forest.predict_proba(X))
+
+
+@needs_missing_value_support
+def test_missing_values_learned_during_training():
+    X, y = _data(n_rows=600, seed=8)
+    X = _with_nans(X, seed=9)
+    model = RandomForestClassifier(n_estimators=15, random_state=0).fit(X, y)
+    assert any(estimator.tree_.missing_go_to_left.any() for estimator in model.estimators_)
+
+    X_test = _with_nans(_data(n_rows=300, seed=10)[0], seed=11)
+    compiled = CompiledForest.from_sklearn(model)
+    np.testing.assert_allclose(compiled.predict_proba(X_test), model.predict_proba(X_test))
+
+
+def test_rejects_wrong_feature_count(forest):
+    compiled = CompiledForest.from_sklearn(forest)
+    with pytest.raises(ValueError):
+        compiled.predict_proba(np.zeros((2, 3)))
+
+
+def test_compiled_file_is_memory_mapped_and_rebuilt_when_stale(forest, tmp_path):
+    pickle_path = str(tmp_path / "random_forest_model.pkl")
+    compiled_path = str(tmp_path / "random_forest_compiled.joblib")
+    joblib.dump(forest, pickle_path)
+
+    loaded = load_compiled_forest(pickle_path, compiled_path)
+    assert os.path.exists(compiled_path)
+    assert isinstance(loaded.threshold, np.memmap)
+
+    # A newer pickle invalidates the compiled file
+    retrained = RandomForestClassifier(n_estimators=3, random_state=1).fit(*_data(seed=12))
+    joblib.dump(retrained, pickle_path)
+    os.utime(compiled_path, (0, 0))
+    X, _ = _data(n_rows=20, seed=13)
+    np.testing.assert_allclose(
+        load_compiled_forest(pickle_path, compiled_path).predict_proba(X),
+        retrained.predict_proba(X)
+    )
+
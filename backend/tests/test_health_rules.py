@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+import main
+from health_rules import HEALTH_RULES, HealthEngine, HealthRule
+
+FIELDS = main.TURBINE_FIELDS
+
+# Every rule threshold, values just either side of them, and missing readings
+EDGE_VALUES = [80, 2.0, 85, 90, -90, 70, 79.999999, 80.000001, 1.9999999, 2.0000001, -90.000001, np.nan]
+
+
+def _expected(row):
+    """The component rules written out by hand, one reading at a time"""
+    r = dict(zip(FIELDS, row.tolist()))
+    gearbox = 100.0 - 20 * (r["gear_oil_temp"] > 80) - 15 * (r["gear_oil_pressure"] < 2.0)
+    generator = 100.0 - 25 * (r["generator_temp"] > 85)
+    blades = 100.0 - 10 * (abs(r["blade_pitch"]) > 90)
+    nacelle = 100.0 - 15 * (r["nacelle_temp"] > 70)
+    health = {
+        "gearbox": gearbox,
+        "generator": generator,
+        "blades": blades,
+        "nacelle": nacelle,
+        "overall": (gearbox + generator + blades + nacelle) / 4,
+    }
+    base = {"gearbox": 8760, "generator": 17520, "blades": 26280, "nacelle": 13140}
+    return health, {component: int(base[component] * health[component] / 100.0) for component in base}
+
+
+@pytest.fixture(scope="module")
+def readings():
+    rng = np.random.default_rng(0)
+    random_rows = rng.uniform(-200, 200, (500, len(FIELDS)))
+    edge_rows = rng.choice(EDGE_VALUES, (500, len(FIELDS)))
+    return np.vstack([random_rows, edge_rows])
+
+
+def test_matches_the_component_rules(readings):
+    engine = HealthEngine(FIELDS)
+    health, rul = engine.evaluate(readings)
+    for row, (health_scores, rul_estimates) in zip(readings, engine.records(health, rul)):
+        expected_health, expected_rul = _expected(row)
+        assert health_scores == expected_health
+        assert rul_estimates == expected_rul
+        assert all(type(v) is float for v in health_scores.values())
+        assert all(type(v) is int for v in rul_estimates.values())
+
+
+def test_per_reading_functions_use_the_same_rules(readings):
+    for row in readings[::50]:
+        data = main.TurbineData.model_construct(**dict(zip(FIELDS, row.tolist())))
+        health_scores = main.calculate_component_health(data)
+        assert (health_scores, main.estimate_rul(health_scores)) == _expected(row)
+
+
+def test_every_rule_fires(readings):
+    engine = HealthEngine(FIELDS)
+    health = engine.health(readings)
+    for component in range(len(engine.components)):
+        assert (health[:, component] < 100).any()
+        assert (health[:, component] == 100).any()
+
+
+def test_nan_readings_keep_full_health():
+    engine = HealthEngine(FIELDS)
+    health, rul = engine.evaluate(np.full((2, len(FIELDS)), np.nan))
+    np.testing.assert_array_equal(health, 100.0)
+    np.testing.assert_array_equal(rul, [[8760, 17520, 26280, 13140]] * 2)
+
+
+def test_unknown_comparison_is_rejected():
+    rules = HEALTH_RULES + (HealthRule("nacelle", "nacelle_temp", ">=", 70, 15),)
+    with pytest.raises(ValueError, match="Unknown comparison"):
+        HealthEngine(FIELDS, rules).health(np.zeros((1, len(FIELDS))))
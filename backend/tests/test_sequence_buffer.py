@@ -0,0 +1,29 @@
+import numpy as np
+
+from sequence_buffer import SequenceBuffer
+
+
+def _fill(buffer, turbine_id, slots):
+    rows = np.arange(len(slots), dtype=np.float32).reshape(-1, 1)
+    return buffer.push_many([turbine_id] * len(slots), rows, slots)
+
+
+def test_short_gaps_are_filled_and_duplicates_dropped():
+    buffer = SequenceBuffer(window=3, n_features=1, max_fill_gap=2)
+    assert _fill(buffer, 'WTG01', [10, 10, 9, 12]) == 2
+    np.testing.assert_array_equal(buffer.window_for('WTG01')[:, 0], [0, 0, 3])
+
+
+def test_long_gap_restarts_the_window_and_its_score():
+    buffer = SequenceBuffer(window=3, n_features=1, max_fill_gap=1)
+    _fill(buffer, 'WTG01', [1, 2, 3])
+    turbine_ids, _ = buffer.pop_ready_windows()
+    buffer.set_scores(turbine_ids, np.array([0.9]))
+    assert buffer.score('WTG01', 0.15) == 0.9
+
+    _fill(buffer, 'WTG01', [10])
+    assert buffer.window_for('WTG01') is None
+    assert buffer.score('WTG01', 0.15) == 0.15
+
+    _fill(buffer, 'WTG01', [11, 12])
+    assert buffer.pop_ready_windows()[0] == ['WTG01']
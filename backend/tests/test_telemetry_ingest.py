@@ -0,0 +1,88 @@
+import io
+import json
+
+import numpy as np
+import pytest
+
+from telemetry_ingest import ArrowStreamIngest, IngestError, NdjsonParser
+
+FIELDS = ("wind_speed", "power_output")
+
+
+def _lines(rows):
+    return b"".join(json.dumps(row).encode() + b"\n" for row in rows)
+
+
+def _parse(body, chunk_rows=2, piece=5):
+    parser = NdjsonParser(FIELDS, chunk_rows=chunk_rows)
+    chunks = []
+    for i in range(0, len(body), piece):
+        chunks.extend(parser.feed(body[i:i + piece]))
+    return chunks + parser.close()
+
+
+def test_ndjson_lines_split_across_feeds():
+    rows = [
+        {"wind_speed": i, "power_output": 10 * i, "turbine_id": f"WTG{i:02d}", "timestamp": "2024-01-01T00:00:00Z"}
+        for i in range(5)
+    ]
+    rows[3].pop("turbine_id")
+    chunks = _parse(_lines(rows))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    values = np.vstack([chunk.values for chunk in chunks])
+    np.testing.assert_array_equal(values, [[i, 10 * i] for i in range(5)])
+    assert sum((chunk.turbine_ids for chunk in chunks), []) == ["WTG00", "WTG01", "WTG02", None, "WTG04"]
+
+
+@pytest.mark.parametrize("bad", [{"turbine_id": 5}, {"timestamp": 1704067200}, {"turbine_id": ["WTG01"]}])
+def test_ndjson_rejects_untyped_ids_and_timestamps(bad):
+    rows = [{"wind_speed": 1, "power_output": 2, "turbine_id": "WTG01"} for _ in range(3)]
+    rows[2].update(bad)
+    with pytest.raises(IngestError, match="Line 3: .* must be a string"):
+        _parse(_lines(rows), chunk_rows=10)
+
+
+def test_ndjson_reports_the_bad_line():
+    body = _lines([{"wind_speed": 1, "power_output": 2}]) + b"{bad\n"
+    with pytest.raises(IngestError, match="Line 2: invalid JSON"):
+        _parse(body)
+    with pytest.raises(IngestError, match="numeric"):
+        _parse(_lines([{"wind_speed": 1}]))
+
+
+def _arrow_upload(table):
+    pa = pytest.importorskip("pyarrow")
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=2)
+
+    chunks = []
+    ingest = ArrowStreamIngest(FIELDS, chunks.append)
+    data = sink.getvalue()
+    for i in range(0, len(data), 64):
+        ingest.put_blocking(data[i:i + 64])
+    return ingest.finish(), chunks
+
+
+def test_arrow_stream():
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({
+        "wind_speed": [1.0, 2.0, 3.0],
+        "power_output": [10, 20, 30],
+        "turbine_id": pa.array(["WTG01", None, "WTG03"]).dictionary_encode(),
+        "timestamp": pa.array([0, 600, 1200], pa.timestamp("s")),
+    })
+    rows, chunks = _arrow_upload(table)
+
+    assert rows == 3
+    np.testing.assert_array_equal(np.vstack([chunk.values for chunk in chunks]), [[1, 10], [2, 20], [3, 30]])
+    assert sum((chunk.turbine_ids for chunk in chunks), []) == ["WTG01", None, "WTG03"]
+
+
+@pytest.mark.parametrize("column, values", [("turbine_id", [5, 6]), ("timestamp", [1.5, 2.5])])
+def test_arrow_rejects_untyped_ids_and_timestamps(column, values):
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({"wind_speed": [1.0, 2.0], "power_output": [1.0, 2.0], column: values})
+    with pytest.raises(IngestError, match=f"{column} must be"):
+        _arrow_upload(table)
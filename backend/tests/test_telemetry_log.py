@@ -0,0 +1,130 @@
+import os
+
+import numpy as np
+
+from telemetry_log import INDEX_FILE, TelemetryLog
+
+FIELDS = ("wind_speed", "power_output")
+HOUR_NS = 3600 * 10**9
+
+
+def _rows(n, start_ns=0, step_ns=HOUR_NS, turbines=("WTG01", "WTG02")):
+    ids = [turbines[i % len(turbines)] for i in range(n)]
+    timestamps = start_ns + np.arange(n, dtype=np.int64) * step_ns
+    values = np.column_stack([np.arange(n), -np.arange(n)]).astype(np.float32)
+    return ids, timestamps, values
+
+
+def _replayed(log, since_ns=None):
+    chunks = list(log.replay(since_ns))
+    if not chunks:
+        return [], np.empty(0, dtype=np.int64), np.empty((0, len(FIELDS)), dtype=np.float32)
+    return (sum((chunk.turbine_ids.tolist() for chunk in chunks), []),
+            np.concatenate([chunk.timestamps for chunk in chunks]),
+            np.concatenate([chunk.values for chunk in chunks]))
+
+
+def test_append_rolls_segments_and_replays(tmp_path):
+    log = TelemetryLog(str(tmp_path), FIELDS, segment_rows=4)
+    ids, timestamps, values = _rows(10)
+    log.append(ids[:3], timestamps[:3], values[:3])
+    log.append(ids[3:], timestamps[3:], values[3:])
+
+    segments = log.segments()
+    assert [segment.rows for segment in segments] == [4, 4, 2]
+    assert (segments[1].first_ns, segments[1].last_ns) == (timestamps[4], timestamps[7])
+    assert log.last_timestamp() == timestamps[-1]
+    assert log.stats()["rows"] == 10
+
+    replay_ids, replay_timestamps, replay_values = _replayed(log)
+    assert replay_ids == ids
+    np.testing.assert_array_equal(replay_timestamps, timestamps)
+    np.testing.assert_array_equal(replay_values, values)
+
+    replay_ids, replay_timestamps, _ = _replayed(log, since_ns=timestamps[6])
+    assert replay_ids == ids[6:]
+    np.testing.assert_array_equal(replay_timestamps, timestamps[6:])
+
+
+def test_reopen_continues_the_log(tmp_path):
+    ids, timestamps, values = _rows(7)
+    log = TelemetryLog(str(tmp_path), FIELDS, segment_rows=4)
+    log.append(ids[:5], timestamps[:5], values[:5])
+    log.close()
+
+    log = TelemetryLog(str(tmp_path), FIELDS, segment_rows=4)
+    log.append(ids[5:], timestamps[5:], values[5:])
+    assert [segment.rows for segment in log.segments()] == [4, 3]
+    np.testing.assert_array_equal(_replayed(log)[1], timestamps)
+
+
+def test_partial_row_is_dropped_after_a_crash(tmp_path):
+    ids, timestamps, values = _rows(3)
+    log = TelemetryLog(str(tmp_path), FIELDS, segment_rows=100)
+    log.append(ids, timestamps, values)
+    active = log.segments()[-1].name
+    log.close()
+
+    # A crash mid-append: the timestamp and turbine columns got a fourth row
+    with open(tmp_path / active / "ts.i64", "ab") as f:
+        f.write(np.int64(99).tobytes())
+    with open(tmp_path / active / "turbine.i32", "ab") as f:
+        f.write(np.int32(0).tobytes())
+    with open(tmp_path / active / "wind_speed.f32", "ab") as f:
+        f.write(b"\x00\x00")  # Torn write
+
+    log = TelemetryLog(str(tmp_path), FIELDS, segment_rows=100)
+    assert log.segments()[-1].rows == 3
+    for name in ("ts.i64", "wind_speed.f32", "power_output.f32"):
+        size = os.path.getsize(tmp_path / active / name)
+        assert size == 3 * (8 if name == "ts.i64" else 4)
+
+    more_ids, more_timestamps, more_values = _rows(2, start_ns=10 * HOUR_NS)
+    log.append(more_ids, more_timestamps, more_values)
+    replay_ids, replay_timestamps, replay_values = _replayed(log)
+    assert replay_ids == ids + more_ids
+    np.testing.assert_array_equal(replay_timestamps, np.concatenate([timestamps, more_timestamps]))
+    np.testing.assert_array_equal(replay_values, np.concatenate([values, more_values]))
+
+
+def test_compaction_retires_old_segments(tmp_path):
+    log = TelemetryLog(str(tmp_path), FIELDS, segment_rows=4)
+    ids, timestamps, values = _rows(10)
+    log.append(ids, timestamps, values)
+
+    assert log.compact(timestamps[4]) == 1  # Only the first segment ends before it
+    assert not os.path.exists(tmp_path / "segment-000001")
+    np.testing.assert_array_equal(_replayed(log)[1], timestamps[4:])
+    log.close()
+
+    log = TelemetryLog(str(tmp_path), FIELDS, segment_rows=4)
+    np.testing.assert_array_equal(_replayed(log)[1], timestamps[4:])
+
+
+def test_retention_applies_when_a_segment_is_sealed(tmp_path):
+    log = TelemetryLog(str(tmp_path), FIELDS, segment_rows=4, retention_seconds=5 * 3600)
+    ids, timestamps, values = _rows(12)
+    log.append(ids, timestamps, values)
+
+    # Sealing the third segment (newest hour 11) retires the first (hours 0-3);
+    # the active segment is empty
+    assert [segment.first_ns for segment in log.segments()] == [timestamps[4], timestamps[8], 0]
+    np.testing.assert_array_equal(_replayed(log)[1], timestamps[4:])
+
+
+def test_interrupted_compaction_is_ignored(tmp_path):
+    log = TelemetryLog(str(tmp_path), FIELDS, segment_rows=4)
+    ids, timestamps, values = _rows(9)
+    log.append(ids, timestamps, values)
+    log.close()
+
+    # Crash after deleting a segment but before rewriting the index
+    first = log.segments()[0].name
+    for name in os.listdir(tmp_path / first):
+        os.remove(tmp_path / first / name)
+    os.rmdir(tmp_path / first)
+    assert first in (tmp_path / INDEX_FILE).read_text()
+
+    log = TelemetryLog(str(tmp_path), FIELDS, segment_rows=4)
+    assert first not in [segment.name for segment in log.segments()]
+    np.testing.assert_array_equal(_replayed(log)[1], timestamps[4:])
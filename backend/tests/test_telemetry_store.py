@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+from telemetry_store import NS_PER_SECOND, TelemetryStore
+
+SLOT_NS = 600 * NS_PER_SECOND
+
+
+def _timestamps(n, start='2024-01-01'):
+    return pd.date_range(start, periods=n, freq='10min').to_numpy('datetime64[ns]').astype(np.int64)
+
+
+def test_ring_keeps_the_retention_window():
+    store = TelemetryStore(3, retention_days=1)
+    timestamps = _timestamps(300)
+    values = np.random.default_rng(0).random((300, 3)).astype(np.float32)
+
+    assert store.capacity == 144
+    assert store.append('WTG01', timestamps[:200], values[:200]) == 144
+    assert store.append('WTG01', timestamps[150:], values[150:]) == 100  # Overlap dropped
+
+    stored, stored_values = store.range('WTG01')
+    np.testing.assert_array_equal(stored, timestamps[-144:])
+    np.testing.assert_array_equal(stored_values, values[-144:])
+    assert store.last_timestamp('WTG01') == timestamps[-1]
+    np.testing.assert_array_equal(store.latest('WTG01', 3)[0], timestamps[-3:])
+    np.testing.assert_array_equal(store.range('WTG01', timestamps[200], timestamps[210])[0], timestamps[200:210])
+    assert store.memory_bytes() == 144 * (8 + 4 * 3)
+
+
+def test_rows_must_move_time_forward():
+    store = TelemetryStore(1)
+    assert store.append('WTG01', [2, 1, 3, 3, 5, 4], np.arange(6)) == 3
+    np.testing.assert_array_equal(store.range('WTG01')[0], [2, 3, 5])
+    assert store.append('WTG01', [5], [[0]]) == 0
+
+
+def test_append_many_keeps_per_turbine_order():
+    store = TelemetryStore(1)
+    ids = ['b', 'a', 'b', 'a', 'b']
+    stored = store.append_many(ids, [10, 1, 20, 2, 15], np.arange(5).reshape(5, 1))
+    np.testing.assert_array_equal(stored, [True, True, True, True, False])
+    assert store.turbines == ['a', 'b']
+    np.testing.assert_array_equal(store.range('b')[0], [10, 20])
+    np.testing.assert_array_equal(store.range('b')[1][:, 0], [0, 2])
+    np.testing.assert_array_equal(store.range('a')[0], [1, 2])
+    assert len(store.append_many([], [], np.empty((0, 1)))) == 0
+
+
+def test_append_many_reports_rows_past_capacity():
+    store = TelemetryStore(1, retention_days=1)
+    timestamps = _timestamps(150)
+    stored = store.append_many(['a'] * 150 + ['b'], np.append(timestamps, 1), np.zeros((151, 1)))
+    np.testing.assert_array_equal(stored, [False] * 6 + [True] * 145)
+    np.testing.assert_array_equal(store.range('a')[0], timestamps[6:])
+
+
+def test_downsample_matches_pandas():
+    store = TelemetryStore(2)
+    timestamps = _timestamps(100)
+    values = np.random.default_rng(1).random((100, 2)).astype(np.float32)
+    values[5, 1] = np.nan
+    values[6:12, 0] = np.nan  # One hour without channel 0
+    store.append('WTG01', timestamps, values)
+
+    start, end = timestamps[3], timestamps[-1] + 1
+    starts, means = store.downsample('WTG01', start, end, 3600)
+
+    frame = pd.DataFrame(values[3:].astype(np.float64))
+    expected = frame.groupby((timestamps[3:] - start) // (6 * SLOT_NS)).mean()
+    np.testing.assert_array_equal(starts, start + np.arange(len(expected)) * 6 * SLOT_NS)
+    np.testing.assert_allclose(means, expected.to_numpy(), equal_nan=True, rtol=1e-6)
+
+    starts, means = store.downsample('unknown', start, start + 2 * 6 * SLOT_NS, 3600)
+    assert len(starts) == 2 and np.isnan(means).all()
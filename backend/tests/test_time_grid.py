@@ -0,0 +1,38 @@
+import datetime
+
+import numpy as np
+
+from time_grid import SLOT_SECONDS, slot_numbers, to_epoch_ns
+
+MIDNIGHT_NS = 1_704_067_200_000_000_000  # 2024-01-01T00:00:00Z
+MIDNIGHT_SLOT = MIDNIGHT_NS // (SLOT_SECONDS * 1_000_000_000)
+
+
+def test_mixed_iso_variants_parse():
+    timestamps = [
+        '2024-01-01T00:00:00',
+        '2024-01-01T00:10:00.5',
+        '2024-01-01 00:20:00+00:00',
+        '2024-01-01T00:30:00Z',
+        '2024-01-01T02:40:00+02:00',
+        '2024-01-01 00:50:00',
+    ]
+    expected = MIDNIGHT_NS + np.array([0, 600.5, 1200, 1800, 2400, 3000]) * 1e9
+    np.testing.assert_array_equal(to_epoch_ns(timestamps), expected.astype(np.int64))
+    np.testing.assert_array_equal(slot_numbers(timestamps), MIDNIGHT_SLOT + np.arange(6))
+
+
+def test_missing_and_invalid_timestamps():
+    slots = slot_numbers(['2024-01-01T00:00:00Z', None, 'not a time', '2024-01-01T00:10:00'])
+    np.testing.assert_array_equal(slots, [MIDNIGHT_SLOT, -1, -1, MIDNIGHT_SLOT + 1])
+
+
+def test_datetimes_and_epoch_nanoseconds():
+    utc = datetime.timezone.utc
+    datetimes = [datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 1, 0, 10, tzinfo=utc)]
+    np.testing.assert_array_equal(to_epoch_ns(datetimes), [MIDNIGHT_NS, MIDNIGHT_NS + 600 * 10**9])
+
+    ns = np.array([MIDNIGHT_NS, MIDNIGHT_NS + 600 * 10**9], dtype=np.int64)
+    np.testing.assert_array_equal(to_epoch_ns(ns), ns)
+    np.testing.assert_array_equal(slot_numbers(ns), [MIDNIGHT_SLOT, MIDNIGHT_SLOT + 1])
+    assert len(to_epoch_ns([])) == 0
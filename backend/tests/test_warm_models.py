@@ -0,0 +1,28 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+
+import main
+from sequence_buffer import SequenceBuffer
+from telemetry_store import TelemetryStore
+
+
+def test_windows_are_rebuilt_without_the_forest(monkeypatch):
+    n_features = len(main.feature_plan.indices)
+    buffer = SequenceBuffer(window=6, n_features=n_features)
+    store = TelemetryStore(len(main.TURBINE_FIELDS))
+    timestamps = pd.date_range("2024-01-01", periods=10, freq="10min").to_numpy("datetime64[ns]").astype(np.int64)
+    store.append("WTG01", timestamps, np.ones((10, len(main.TURBINE_FIELDS))))
+
+    # The LSTM loaded but the forest did not, so load_models reports failure
+    monkeypatch.setattr(main, "load_models", lambda: False)
+    monkeypatch.setattr(main, "sequence_buffer", buffer)
+    monkeypatch.setattr(main, "telemetry_store", store)
+    monkeypatch.setattr(main, "scaler", None)
+    asyncio.run(main.warm_models())
+
+    assert len(buffer) == 1
+    turbine_ids, windows = buffer.pop_ready_windows()
+    assert turbine_ids == ["WTG01"]
+    assert windows.shape == (1, 6, n_features)
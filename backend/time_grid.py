@@ -0,0 +1,35 @@
+"""
+Epoch slot numbering for 10-minute SCADA telemetry.
+
+Timestamps are mapped to integer slot numbers counted from the Unix epoch,
+``round(t / step)``, so any component can turn a timestamp into a slot in
+O(1) without a lookup table and every component agrees on slot numbering.
+The analysis scripts' gap index (BD/Analysis/slot_grid.py) parses and
+numbers timestamps the same way; a test checks the two agree.
+"""
+
+import numpy as np
+import pandas as pd
+
+SLOT_SECONDS = 600
+
+
+def to_epoch_ns(timestamps) -> np.ndarray:
+    """Nanoseconds since the epoch (UTC) as int64; unparseable values become NaT"""
+    timestamps = pd.Series(timestamps)
+    if pd.api.types.is_numeric_dtype(timestamps):
+        parsed = pd.to_datetime(timestamps, utc=True, errors='coerce', unit='ns')
+    else:
+        # Parsed per value: a format inferred from the first string would turn
+        # other ISO variants (fractional seconds, Z, offsets) into NaT
+        parsed = pd.to_datetime(timestamps, utc=True, errors='coerce', format='ISO8601')
+    return parsed.dt.tz_localize(None).to_numpy(dtype='datetime64[ns]').astype(np.int64)
+
+
+def slot_numbers(timestamps, step_seconds: int = SLOT_SECONDS) -> np.ndarray:
+    """Epoch slot number of every timestamp, -1 where the timestamp is missing"""
+    ns = to_epoch_ns(timestamps)
+    step_ns = step_seconds * 1_000_000_000
+    slots = (ns + step_ns // 2) // step_ns
+    return np.where(ns == np.iinfo(np.int64).min, -1, slots)
+
@@ -1,4 +1,4 @@
-import React, { useEffect, useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import { Settings, AlertTriangle, CheckCircle, Clock, Calendar, Wrench } from 'lucide-react';
 import { useTurbineStore } from '../../store/turbineStore';
@@ -20,6 +20,7 @@ const Maintenance: React.FC = () => {
   const [predictions, setPredictions] = useState<PredictionsData>({});
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const hasPredictions = useRef(false);
 
   const maintenanceData = currentData?.maintenance;
   const nextServiceDate = maintenanceData?.nextService ? new Date(maintenanceData.nextService) : null;
@@ -99,92 +100,76 @@ const Maintenance: React.FC = () => {
     }
   };
 
-  // Fetch predictions from the FastAPI backend
-  const fetchPredictions = async () => {
-    try {
-      setIsLoading(true);
-      setError(null);
-      
-      const controller = new AbortController();
-      const timeoutId = setTimeout(() => controller.abort(), 2000); // 2 second timeout
-      
-      const response = await fetch('http://localhost:8000/api/predict', {
-        signal: controller.signal,
-        headers: {
-          'Cache-Control': 'no-cache',
-          'Pragma': 'no-cache'
-        }
-      });
-      
-      clearTimeout(timeoutId);
-      
-      if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`);
-      }
-      
-      const data = await response.json();
-      setPredictions(data);
-    } catch (err) {
-      console.error('Error fetching predictions:', err);
-      
-      // Only show error if we don't have any existing predictions
-      if (Object.keys(predictions).length === 0) {
-        setError('Failed to fetch predictions');
-      }
-      
-      // Set fallback predictions only if we don't have any
-      if (Object.keys(predictions).length === 0) {
-        setPredictions({
-          "Gearbox": {
-            "status": "Normal",
-            "message": "Gearbox operating within normal parameters.",
-            "confidence": "85%",
-            "based_on": "30 days of logs"
-          },
-          "Bearings": {
-            "status": "Normal",
-            "message": "Bearing vibration levels are stable and within range.",
-            "confidence": "88%",
-            "based_on": "6 weeks of data"
-          },
-          "Generator": {
-            "status": "Normal",
-            "message": "Generator operating efficiently with stable output.",
-            "confidence": "92%",
-            "based_on": "2 months of telemetry"
-          },
-          "Rotors": {
-            "status": "Normal",
-            "message": "Rotor balance is optimal for current conditions.",
-            "confidence": "87%",
-            "based_on": "3 months of sensor data"
-          },
-          "Blades": {
-            "status": "Normal",
-            "message": "Blade aerodynamics are stable and efficient.",
-            "confidence": "90%",
-            "based_on": "60 days of telemetry"
-          },
-          "Temperature Sensors": {
-            "status": "Normal",
-            "message": "Temperature sensors operating within calibration range.",
-            "confidence": "89%",
-            "based_on": "90 days of data"
-          }
-        });
+  // Rule-based predictions shown while the backend is unreachable
+  const showFallbackPredictions = () => {
+    setPredictions({
+      "Gearbox": {
+        "status": "Normal",
+        "message": "Gearbox operating within normal parameters.",
+        "confidence": "85%",
+        "based_on": "30 days of logs"
+      },
+      "Bearings": {
+        "status": "Normal",
+        "message": "Bearing vibration levels are stable and within range.",
+        "confidence": "88%",
+        "based_on": "6 weeks of data"
+      },
+      "Generator": {
+        "status": "Normal",
+        "message": "Generator operating efficiently with stable output.",
+        "confidence": "92%",
+        "based_on": "2 months of telemetry"
+      },
+      "Rotors": {
+        "status": "Normal",
+        "message": "Rotor balance is optimal for current conditions.",
+        "confidence": "87%",
+        "based_on": "3 months of sensor data"
+      },
+      "Blades": {
+        "status": "Normal",
+        "message": "Blade aerodynamics are stable and efficient.",
+        "confidence": "90%",
+        "based_on": "60 days of telemetry"
+      },
+      "Temperature Sensors": {
+        "status": "Normal",
+        "message": "Temperature sensors operating within calibration range.",
+        "confidence": "89%",
+        "based_on": "90 days of data"
       }
-    } finally {
-      setIsLoading(false);
-    }
+    });
   };
 
-  // Fetch predictions on component mount and every 3 seconds
+  // Subscribe to prediction updates pushed by the FastAPI backend
   useEffect(() => {
-    fetchPredictions();
+    setIsLoading(true);
+    setError(null);
+    
+    // The server pushes only when the predictions change; EventSource
+    // reconnects on its own after network errors
+    const source = new EventSource('http://localhost:8000/stream/predictions');
+    
+    source.addEventListener('predictions', (event) => {
+      hasPredictions.current = true;
+      setPredictions(JSON.parse((event as MessageEvent).data));
+      setError(null);
+      setIsLoading(false);
+    });
     
-    const interval = setInterval(fetchPredictions, 3000); // Changed from 5000 to 3000
+    source.onerror = (err) => {
+      console.error('Error receiving predictions:', err);
+      setIsLoading(false);
+      
+      // Only show an error and fallback data if nothing was received yet
+      if (!hasPredictions.current) {
+        setError('Failed to fetch predictions');
+        showFallbackPredictions();
+      }
+    };
     
-    return () => clearInterval(interval);
+    return () => source.close();
   }, []);
 
   return (